@@ -25,6 +25,7 @@ LOCAL_APPS = [
     "jurin.items.apps.ItemsConfig",
     "jurin.files.apps.FilesConfig",
     "jurin.stocks.apps.StocksConfig",
+    "jurin.tasks.apps.TasksConfig",
 ]
 
 THIRD_PARTY_APPS = [
@@ -133,8 +134,8 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 MEDIA_URL = "/media/"
 
 REST_FRAMEWORK = {
-    "DEFAULT_RENDERER_CLASSES": ("djangorestframework_camel_case.render.CamelCaseJSONRenderer",),
-    "DEFAULT_PARSER_CLASSES": ("djangorestframework_camel_case.parser.CamelCaseJSONParser",),
+    "DEFAULT_RENDERER_CLASSES": ("jurin.common.renderers.CamelCaseJSONRenderer",),
+    "DEFAULT_PARSER_CLASSES": ("jurin.common.parsers.CamelCaseJSONParser",),
     "DEFAULT_AUTHENTICATION_CLASSES": ("jurin.authentication.services.CustomJWTAuthentication",),
     "EXCEPTION_HANDLER": "jurin.common.exception.exception_handler.default_exception_handler",
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.AllowAny",),
@@ -201,13 +202,25 @@ CACHES = {
 
 from config.settings.cors import *  # noqa
 from config.settings.jwt import *  # noqa
+from config.settings.authentication import *  # noqa
 from config.settings.files_and_storages import *  # noqa
 from config.settings.celery import *  # noqa
+from config.settings.async_apis import *  # noqa
+from config.settings.streams import *  # noqa
+from config.settings.response_cache import *  # noqa
+from config.settings.replica.settings import *  # noqa
+from config.settings.sharding.settings import *  # noqa
 
 from config.settings.debug_toolbar.settings import *  # noqa
 from config.settings.debug_toolbar.setup import DebugToolbarSetup  # noqa
 from config.settings.swagger.settings import *  # noqa
 from config.settings.swagger.setup import SwaggerSetup  # noqa
+from config.settings.metrics.settings import *  # noqa
+from config.settings.metrics.setup import MetricsSetup  # noqa
+from config.settings.slow_queries.settings import *  # noqa
+from config.settings.slow_queries.setup import SlowQuerySetup  # noqa
 
 INSTALLED_APPS, MIDDLEWARE = DebugToolbarSetup.do_settings(INSTALLED_APPS, MIDDLEWARE)
 INSTALLED_APPS = SwaggerSetup.do_settings(INSTALLED_APPS)
+MIDDLEWARE = MetricsSetup.do_settings(MIDDLEWARE)
+MIDDLEWARE = SlowQuerySetup.do_settings(MIDDLEWARE)
@@ -1,5 +1,8 @@
 from config.env import env
 from config.django.base import *  # noqa
+from config.django.base import MIDDLEWARE
+from config.settings.replica.setup import ReplicaSetup
+from config.settings.sharding.setup import ChannelShardSetup
 
 SECRET_KEY = env("SECRET_KEY")
 
@@ -18,6 +21,14 @@ DATABASES = {
         "PORT": env("DEV_MYSQL_PORT"),
     }
 }
+DATABASES, DATABASE_ROUTERS, MIDDLEWARE = ReplicaSetup.do_settings(DATABASES, MIDDLEWARE, env.list("DEV_MYSQL_REPLICAS", default=[]))
+DATABASES, DATABASE_ROUTERS, MIDDLEWARE, CHANNEL_SHARD_DATABASES = ChannelShardSetup.do_settings(
+    DATABASES,
+    DATABASE_ROUTERS,
+    MIDDLEWARE,
+    env.list("DEV_MYSQL_SHARDS", default=[]),
+    env.int("CHANNEL_SHARD_AUTO_INCREMENT_INCREMENT", default=10),
+)
 
 SESSION_COOKIE_SECURE = env.bool("SESSION_COOKIE_SECURE", default=True)
 
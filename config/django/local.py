@@ -1,5 +1,8 @@
 from config.env import env
 from config.django.base import *  # noqa
+from config.django.base import MIDDLEWARE
+from config.settings.replica.setup import ReplicaSetup
+from config.settings.sharding.setup import ChannelShardSetup
 
 pymysql.install_as_MySQLdb()
 DATABASES = {
@@ -12,3 +15,11 @@ DATABASES = {
         "PORT": env("LOCAL_MYSQL_PORT", default="3306"),
     }
 }
+DATABASES, DATABASE_ROUTERS, MIDDLEWARE = ReplicaSetup.do_settings(DATABASES, MIDDLEWARE, env.list("LOCAL_MYSQL_REPLICAS", default=[]))
+DATABASES, DATABASE_ROUTERS, MIDDLEWARE, CHANNEL_SHARD_DATABASES = ChannelShardSetup.do_settings(
+    DATABASES,
+    DATABASE_ROUTERS,
+    MIDDLEWARE,
+    env.list("LOCAL_MYSQL_SHARDS", default=[]),
+    env.int("CHANNEL_SHARD_AUTO_INCREMENT_INCREMENT", default=10),
+)
@@ -23,9 +23,11 @@ urlpatterns = [
 
 from config.settings.debug_toolbar.setup import DebugToolbarSetup  # noqa
 from config.settings.swagger.setup import SwaggerSetup  # noqa
+from config.settings.metrics.setup import MetricsSetup  # noqa
 
 urlpatterns = DebugToolbarSetup.do_urls(urlpatterns)
 urlpatterns = SwaggerSetup.do_urls(urlpatterns)
+urlpatterns = MetricsSetup.do_urls(urlpatterns)
 
 # Static/Media File Root (CSS, JavaScript, Images)
 urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,4 @@
+from config.env import env
+
+# 학생 조회 API(주식, 거래, 아이템, 게시글)를 비동기 뷰로 제공할지 여부 (ASGI 서버로 실행할 때 사용)
+ASYNC_READ_APIS_ENABLED = env.bool("ASYNC_READ_APIS_ENABLED", default=False)
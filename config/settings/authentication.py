@@ -0,0 +1,25 @@
+from config.env import env
+
+PASSWORD_HASH_WORKERS = env.int("PASSWORD_HASH_WORKERS", default=4)
+
+PASSWORD_HASHER_ITERATIONS = env.int("PASSWORD_HASHER_ITERATIONS", default=600000)
+PASSWORD_HASHERS = [
+    "jurin.authentication.hashers.ConfigurablePBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+AUTHENTICATION_BACKENDS = ["jurin.authentication.backends.PasswordVerificationPoolBackend"]
+PASSWORD_VERIFICATION_WORKERS = env.int("PASSWORD_VERIFICATION_WORKERS", default=4)
+PASSWORD_VERIFICATION_QUEUE_SIZE = env.int("PASSWORD_VERIFICATION_QUEUE_SIZE", default=64)
+PASSWORD_VERIFICATION_TIMEOUT = env.float("PASSWORD_VERIFICATION_TIMEOUT", default=10.0)  # seconds
+
+SIGN_IN_THROTTLE_IP_CAPACITY = env.int("SIGN_IN_THROTTLE_IP_CAPACITY", default=300)
+SIGN_IN_THROTTLE_IP_REFILL_RATE = env.float("SIGN_IN_THROTTLE_IP_REFILL_RATE", default=5.0)  # tokens per second
+SIGN_IN_THROTTLE_USERNAME_CAPACITY = env.int("SIGN_IN_THROTTLE_USERNAME_CAPACITY", default=10)
+SIGN_IN_THROTTLE_USERNAME_REFILL_RATE = env.float("SIGN_IN_THROTTLE_USERNAME_REFILL_RATE", default=0.1)  # tokens per second
+
+USERNAME_BLOOM_FILTER_CAPACITY = env.int("USERNAME_BLOOM_FILTER_CAPACITY", default=1000000)
+USERNAME_BLOOM_FILTER_ERROR_RATE = env.float("USERNAME_BLOOM_FILTER_ERROR_RATE", default=0.001)
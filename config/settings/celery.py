@@ -11,3 +11,6 @@ CELERY_TIMEZONE = "Asia/Seoul"
 CELERY_TASK_SOFT_TIME_LIMIT = 20  # seconds
 CELERY_TASK_TIME_LIMIT = 30  # seconds
 CELERY_TASK_MAX_RETRIES = 3
+
+HARD_DELETE_USERS_TIME_BUDGET = env.int("HARD_DELETE_USERS_TIME_BUDGET", default=15)  # seconds
+HARD_DELETE_USERS_END_HOUR = env.int("HARD_DELETE_USERS_END_HOUR", default=6)  # hour
@@ -27,3 +27,6 @@ SIMPLE_JWT = {
     "TOKEN_USER_CLASS": "rest_framework_simplejwt.models.TokenUser",
     "JTI_CLAIM": "jti",
 }
+
+JWT_USER_CACHE_TIMEOUT = env.int("JWT_USER_CACHE_TIMEOUT", default=60)  # seconds
+JWT_STATELESS_AUTHENTICATION = env.bool("JWT_STATELESS_AUTHENTICATION", default=False)
@@ -0,0 +1,7 @@
+from config.env import env
+
+METRICS_ENABLED = env.bool("METRICS_ENABLED", default=False)
+METRICS_DIRECTORY = env.str("METRICS_DIRECTORY", default="/tmp/jurin_metrics")
+METRICS_FLUSH_INTERVAL = env.int("METRICS_FLUSH_INTERVAL", default=5)  # seconds
+METRICS_QUERY_BUDGET = env.int("METRICS_QUERY_BUDGET", default=30)
+METRICS_TOKEN = env.str("METRICS_TOKEN", default="")
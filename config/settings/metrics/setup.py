@@ -0,0 +1,38 @@
+import logging
+
+from django.urls import path
+
+logger = logging.getLogger("configuration")
+
+
+def use_metrics(*args, **kwargs) -> bool:
+    from config.settings.metrics.settings import METRICS_ENABLED
+
+    return METRICS_ENABLED
+
+
+class MetricsSetup:
+    @staticmethod
+    def do_settings(MIDDLEWARE, middleware_position=None):
+        _use_metrics: bool = use_metrics()
+        logger.info(f"Metrics in use: {_use_metrics}")
+
+        if not _use_metrics:
+            return MIDDLEWARE
+
+        # 다른 미들웨어의 쿼리와 시간도 측정하도록 가장 앞에 추가
+        metrics_middleware = "jurin.common.metrics.MetricsMiddleware"
+
+        _middleware = MIDDLEWARE[::]
+        _middleware.insert(0 if middleware_position is None else middleware_position, metrics_middleware)
+
+        return _middleware
+
+    @staticmethod
+    def do_urls(urlpatterns):
+        if not use_metrics():
+            return urlpatterns
+
+        from jurin.common.metrics import metrics_view
+
+        return urlpatterns + [path("metrics", metrics_view, name="metrics")]
@@ -0,0 +1,3 @@
+from config.env import env
+
+REPLICA_STICKY_SECONDS = env.int("REPLICA_STICKY_SECONDS", default=5)
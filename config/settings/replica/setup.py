@@ -0,0 +1,34 @@
+import logging
+
+logger = logging.getLogger("configuration")
+
+
+class ReplicaSetup:
+    @staticmethod
+    def do_settings(DATABASES, MIDDLEWARE, replicas):
+        """
+        레플리카마다 프라이머리(default) 설정을 복사하여 replica1, replica2, ... 데이터베이스를 추가하고, 라우터와 미들웨어를 설정합니다.
+        MySQL은 레플리카를 "호스트:포트"로, SQLite는 데이터베이스 파일 경로로 입력합니다.
+        """
+        logger.info(f"Database replicas in use: {len(replicas)}")
+
+        if not replicas:
+            return DATABASES, [], MIDDLEWARE
+
+        primary = DATABASES["default"]
+        _databases = {**DATABASES}
+
+        for index, replica in enumerate(replicas):
+            if primary["ENGINE"].endswith("sqlite3"):
+                overrides = {"NAME": replica}
+
+            else:
+                host, _, port = replica.partition(":")
+                overrides = {"HOST": host, "PORT": port or primary.get("PORT", "")}
+
+            _databases[f"replica{index + 1}"] = {**primary, **overrides, "TEST": {"MIRROR": "default"}}
+
+        # 메트릭, 느린 쿼리 기록 등 다른 미들웨어의 쓰기가 요청의 쓰기로 판단되지 않도록 가장 뒤에 추가
+        _middleware = [*MIDDLEWARE, "jurin.common.db_routers.ReplicaRoutingMiddleware"]
+
+        return _databases, ["jurin.common.db_routers.ReplicaRouter"], _middleware
@@ -0,0 +1,5 @@
+from config.env import env
+
+# 채널 조회 API 응답 캐시(cache_channel_response) 사용 여부와 응답 보관 시간
+CHANNEL_RESPONSE_CACHE_ENABLED = env.bool("CHANNEL_RESPONSE_CACHE_ENABLED", default=False)
+CHANNEL_RESPONSE_CACHE_TIMEOUT = env.int("CHANNEL_RESPONSE_CACHE_TIMEOUT", default=60)  # seconds
@@ -0,0 +1,5 @@
+from config.env import env
+
+# 채널 데이터를 나누어 저장할 데이터베이스 별칭 리스트 (ChannelShardSetup에서 설정, default는 유저 등 전역 데이터를 저장하는 홈 샤드)
+CHANNEL_SHARD_DATABASES = ["default"]
+CHANNEL_SHARD_CACHE_TIMEOUT = env.int("CHANNEL_SHARD_CACHE_TIMEOUT", default=300)  # seconds
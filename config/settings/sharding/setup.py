@@ -0,0 +1,67 @@
+import logging
+
+from django.core.exceptions import ImproperlyConfigured
+
+logger = logging.getLogger("configuration")
+
+
+class ChannelShardSetup:
+    @staticmethod
+    def do_settings(DATABASES, DATABASE_ROUTERS, MIDDLEWARE, shards, auto_increment_increment=10):
+        """
+        샤드마다 홈 샤드(default) 설정을 복사하여 shard1, shard2, ... 데이터베이스를 추가하고, 라우터와 미들웨어를 설정합니다.
+        MySQL은 샤드를 "호스트:포트"로, SQLite는 데이터베이스 파일 경로로 입력합니다.
+        채널 라우터는 레플리카 라우터보다 먼저 실행되어 채널 데이터는 샤드로, 전역 데이터는 다음 라우터로 보냅니다.
+
+        채널을 다른 샤드로 옮길 수 있도록 MySQL 샤드는 연결마다 자동 증가 값의 간격(auto_increment_increment)을 같게,
+        시작 값(auto_increment_offset)을 샤드 순서(default는 1)로 설정하여 샤드의 아이디 범위가 겹치지 않도록 합니다.
+        샤드를 추가해도 기존 샤드의 아이디 범위가 바뀌지 않도록 간격은 최대 샤드 수로 정하고 바꾸지 않습니다.
+        """
+        logger.info(f"Channel shards in use: {len(shards)}")
+
+        if not shards:
+            return DATABASES, DATABASE_ROUTERS, MIDDLEWARE, ["default"]
+
+        if len(shards) + 1 > auto_increment_increment:
+            raise ImproperlyConfigured(
+                f"Channel shards ({len(shards) + 1}) exceed the auto increment increment ({auto_increment_increment})."
+            )
+
+        home = DATABASES["default"]
+        is_sqlite = home["ENGINE"].endswith("sqlite3")
+        _databases = {**DATABASES}
+        shard_databases = ["default"]
+
+        if not is_sqlite:
+            _databases["default"] = ChannelShardSetup._with_auto_increment(home, auto_increment_increment, 1)
+
+        for index, shard in enumerate(shards):
+            if is_sqlite:
+                overrides = {"NAME": shard}
+
+            else:
+                host, _, port = shard.partition(":")
+                overrides = {"HOST": host, "PORT": port or home.get("PORT", "")}
+
+            alias = f"shard{index + 1}"
+            _databases[alias] = {**home, **overrides}
+
+            if not is_sqlite:
+                _databases[alias] = ChannelShardSetup._with_auto_increment(_databases[alias], auto_increment_increment, index + 2)
+
+            shard_databases.append(alias)
+
+        _database_routers = ["jurin.channels.sharding.ChannelShardRouter", *DATABASE_ROUTERS]
+        _middleware = [*MIDDLEWARE, "jurin.channels.sharding.ChannelShardMiddleware"]
+
+        return _databases, _database_routers, _middleware, shard_databases
+
+    @staticmethod
+    def _with_auto_increment(database, increment, offset):
+        """
+        MySQL 연결의 자동 증가 값 간격과 시작 값을 설정하는 init_command를 추가한 데이터베이스 설정을 반환합니다.
+        """
+        options = {**database.get("OPTIONS", {})}
+        init_command = f"SET SESSION auto_increment_increment={increment}, SESSION auto_increment_offset={offset}"
+        options["init_command"] = f"{options['init_command']}; {init_command}" if options.get("init_command") else init_command
+        return {**database, "OPTIONS": options}
@@ -0,0 +1,6 @@
+from config.env import env
+
+SLOW_QUERY_ENABLED = env.bool("SLOW_QUERY_ENABLED", default=False)
+SLOW_QUERY_THRESHOLD = env.float("SLOW_QUERY_THRESHOLD", default=100.0)  # milliseconds
+SLOW_QUERY_SAMPLE_RATE = env.float("SLOW_QUERY_SAMPLE_RATE", default=1.0)
+SLOW_QUERY_TOP_N = env.int("SLOW_QUERY_TOP_N", default=200)
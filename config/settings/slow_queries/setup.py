@@ -0,0 +1,27 @@
+import logging
+
+logger = logging.getLogger("configuration")
+
+
+def use_slow_query(*args, **kwargs) -> bool:
+    from config.settings.slow_queries.settings import SLOW_QUERY_ENABLED
+
+    return SLOW_QUERY_ENABLED
+
+
+class SlowQuerySetup:
+    @staticmethod
+    def do_settings(MIDDLEWARE, middleware_position=None):
+        _use_slow_query: bool = use_slow_query()
+        logger.info(f"Slow query capture in use: {_use_slow_query}")
+
+        if not _use_slow_query:
+            return MIDDLEWARE
+
+        # 다른 미들웨어에서 실행한 쿼리도 기록하도록 가장 앞에 추가
+        slow_query_middleware = "jurin.common.slow_queries.SlowQueryMiddleware"
+
+        _middleware = MIDDLEWARE[::]
+        _middleware.insert(0 if middleware_position is None else middleware_position, slow_query_middleware)
+
+        return _middleware
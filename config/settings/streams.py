@@ -0,0 +1,8 @@
+from config.env import env
+
+# 학생에게 채널의 주식 변경(거래, 매수가 변경, 종목 수정)을 SSE로 보낼지 여부 (ASGI 서버로 실행할 때 사용)
+STOCK_STREAM_ENABLED = env.bool("STOCK_STREAM_ENABLED", default=False)
+STOCK_STREAM_HEARTBEAT_SECONDS = env.float("STOCK_STREAM_HEARTBEAT_SECONDS", default=15.0)  # seconds
+STOCK_STREAM_MAX_SECONDS = env.float("STOCK_STREAM_MAX_SECONDS", default=300.0)  # seconds
+STOCK_STREAM_QUEUE_SIZE = env.int("STOCK_STREAM_QUEUE_SIZE", default=100)
+STOCK_STREAM_TICKET_TIMEOUT = env.int("STOCK_STREAM_TICKET_TIMEOUT", default=30)  # seconds
@@ -1,3 +1,5 @@
+import math
+
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import serializers, status
 from rest_framework.permissions import AllowAny
@@ -8,8 +10,12 @@ from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 from jurin.authentication.services import CustomJWTAuthentication
+from jurin.authentication.throttles import SignInTokenBucketThrottle
 from jurin.common.base.serializers import BaseResponseSerializer, BaseSerializer
-from jurin.common.exception.exceptions import InvalidTokenException
+from jurin.common.exception.exceptions import (
+    InvalidTokenException,
+    TooManyRequestsException,
+)
 from jurin.common.response import create_response
 from jurin.users.services import UserService
 
@@ -69,6 +75,7 @@ class SignUpAPI(APIView):
 class SignInAPI(TokenObtainPairView):
     permission_classes = (AllowAny,)
     authentication_classes = ()
+    throttle_classes = (SignInTokenBucketThrottle,)
 
     class InputSerializer(BaseSerializer):
         username = serializers.CharField(required=True, max_length=32)
@@ -78,6 +85,12 @@ class SignInAPI(TokenObtainPairView):
         access_token = serializers.CharField()
         refresh_token = serializers.CharField()
 
+    def throttled(self, request: Request, wait: float):
+        if wait is None:
+            raise TooManyRequestsException()
+
+        raise TooManyRequestsException(f"Too many requests. Please try again in {math.ceil(wait)} seconds.")
+
     @swagger_auto_schema(
         tags=["인증"],
         operation_summary="로그인",
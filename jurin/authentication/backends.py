@@ -0,0 +1,49 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from jurin.authentication.hashers import get_password_verification_pool
+
+UserModel = get_user_model()
+
+
+class PasswordVerificationPoolBackend(ModelBackend):
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        """
+        이 함수는 기존의 ModelBackend의 authenticate 함수를 오버라이드하여
+        비밀번호 검증을 제한된 크기의 검증 풀에서 실행합니다.
+        해셔의 작업량이 변경된 경우 로그인에 성공하면 비밀번호를 다시 해시하여 저장합니다.
+
+        Args:
+            request (HttpRequest): Request 객체입니다.
+            username (str): 아이디입니다.
+            password (str): 비밀번호입니다.
+        Returns:
+            User | None: 인증된 유저 객체입니다. 인증에 실패하면 None을 반환합니다.
+        """
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+
+        if username is None or password is None:
+            return None
+
+        password_verification_pool = get_password_verification_pool()
+
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+
+        except UserModel.DoesNotExist:
+            # 존재하지 않는 아이디인지 응답 시간으로 알 수 없도록 해시를 한 번 실행
+            password_verification_pool.run_dummy_hash(password)
+            return None
+
+        is_valid, must_update = password_verification_pool.verify(password, user.password)
+
+        if is_valid is False or self.user_can_authenticate(user) is False:
+            return None
+
+        # 해셔의 작업량이 변경된 경우 다시 해시
+        if must_update is True:
+            user.set_password(password)
+            user.save(update_fields=["password"])
+
+        return user
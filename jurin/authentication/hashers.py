@@ -0,0 +1,194 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    PBKDF2PasswordHasher,
+    check_password,
+    make_password,
+)
+
+from config.django.base import logger
+from jurin.common.exception.exceptions import ServiceUnavailableException
+from jurin.common.metrics import metrics_registry
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    이 클래스는 반복 횟수(작업량)를 설정으로 변경할 수 있는 PBKDF2 해셔입니다.
+    알고리즘 이름이 기본 해셔와 같으므로 기존 해시를 그대로 검증하며,
+    반복 횟수가 설정과 다른 해시는 로그인에 성공할 때 새로운 반복 횟수로 다시 해시됩니다.
+    """
+
+    @property
+    def iterations(self) -> int:
+        return settings.PASSWORD_HASHER_ITERATIONS
+
+
+class PasswordVerificationPool:
+    """
+    이 클래스는 비밀번호 해시 검증을 제한된 크기의 스레드 풀에서 실행하는 클래스입니다.
+    PBKDF2 해시는 GIL을 해제하므로 스레드에서 병렬로 실행되며,
+    실행 중인 작업과 대기 중인 작업의 합이 한도를 넘으면 기다리지 않고 바로 거절합니다.
+    """
+
+    def __init__(self, max_workers: int, max_queue_size: int, timeout: float):
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-verification")
+        self.slots = threading.BoundedSemaphore(max_workers + max_queue_size)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.rejected_count = 0
+        self.completed_count = 0
+
+    def _submit(self, func, *args):
+        """
+        이 내장 함수는 작업을 풀에 넣고 결과를 기다립니다.
+        남은 자리가 없거나 제한 시간이 지나면 예외를 발생시킵니다.
+        """
+        if self.slots.acquire(blocking=False) is False:
+            with self.lock:
+                self.rejected_count += 1
+
+            logger.warning(f"Password verification pool is full. {self.get_metrics()}")
+            raise ServiceUnavailableException("Too many sign-in requests. Please try again later.")
+
+        with self.lock:
+            self.in_flight += 1
+
+        try:
+            future = self.executor.submit(func, *args)
+
+        except Exception:
+            self._release()
+            raise
+
+        # 제한 시간이 지나도 실행 중인 해시가 끝날 때까지 자리를 차지하도록 작업이 끝나면 자리를 반환
+        future.add_done_callback(self._release)
+
+        try:
+            return future.result(timeout=self.timeout)
+
+        except FutureTimeoutError:
+            # 아직 시작하지 않은 작업은 취소하여 바로 자리를 반환
+            future.cancel()
+            raise ServiceUnavailableException("Too many sign-in requests. Please try again later.")
+
+    def _release(self, future: Optional[Future] = None):
+        """
+        이 내장 함수는 끝난 작업의 자리를 반환합니다.
+        """
+        with self.lock:
+            self.in_flight -= 1
+            self.completed_count += 1
+
+        self.slots.release()
+
+    def verify(self, password: str, encoded: str) -> tuple[bool, bool]:
+        """
+        이 함수는 비밀번호와 해시를 받아서 풀에서 검증합니다.
+
+        Args:
+            password (str): 비밀번호입니다.
+            encoded (str): 저장된 해시입니다.
+        Returns:
+            tuple[bool, bool]: 검증 결과와 다시 해시해야 하는지 여부입니다.
+        """
+        must_update = []
+        is_valid = self._submit(check_password, password, encoded, must_update.append)
+        return is_valid, bool(must_update)
+
+    def run_dummy_hash(self, password: str):
+        """
+        이 함수는 존재하지 않는 유저로 로그인할 때 응답 시간을 맞추기 위해 풀에서 해시를 한 번 실행합니다.
+
+        Args:
+            password (str): 비밀번호입니다.
+        """
+        self._submit(make_password, password)
+
+    def get_metrics(self) -> dict:
+        """
+        이 함수는 풀의 현재 상태를 반환합니다.
+
+        Returns:
+            dict: 실행 및 대기 중인 작업 수, 대기열 깊이, 거절 및 완료된 작업 수입니다.
+        """
+        with self.lock:
+            return {
+                "in_flight": self.in_flight,
+                "queue_depth": max(0, self.in_flight - self.max_workers),
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+                "rejected_count": self.rejected_count,
+                "completed_count": self.completed_count,
+            }
+
+    def collect_metrics(self) -> dict[str, float]:
+        """
+        이 함수는 /metrics에 보낼 풀의 지표를 반환합니다. (metrics_registry의 수집 함수)
+
+        Returns:
+            dict[str, float]: 지표 이름과 값입니다.
+        """
+        metrics = self.get_metrics()
+        return {
+            "jurin_password_verification_in_flight": metrics["in_flight"],
+            "jurin_password_verification_queue_depth": metrics["queue_depth"],
+            "jurin_password_verification_rejected_total": metrics["rejected_count"],
+            "jurin_password_verification_completed_total": metrics["completed_count"],
+        }
+
+
+_password_verification_pool: Optional[PasswordVerificationPool] = None
+_password_verification_pool_lock = threading.Lock()
+
+
+def get_password_verification_pool() -> PasswordVerificationPool:
+    """
+    이 함수는 프로세스마다 하나의 비밀번호 검증 풀을 생성하여 반환합니다.
+    gunicorn 워커가 fork된 이후에 생성되도록 처음 사용할 때 생성하며, 풀의 지표를 /metrics에서 조회할 수 있도록 등록합니다.
+
+    Returns:
+        PasswordVerificationPool: 비밀번호 검증 풀입니다.
+    """
+    global _password_verification_pool
+
+    if _password_verification_pool is None:
+        with _password_verification_pool_lock:
+            if _password_verification_pool is None:
+                _password_verification_pool = PasswordVerificationPool(
+                    max_workers=settings.PASSWORD_VERIFICATION_WORKERS,
+                    max_queue_size=settings.PASSWORD_VERIFICATION_QUEUE_SIZE,
+                    timeout=settings.PASSWORD_VERIFICATION_TIMEOUT,
+                )
+                metrics_registry.register_collector(_password_verification_pool.collect_metrics)
+
+    return _password_verification_pool
+
+
+_password_hash_executor: Optional[ThreadPoolExecutor] = None
+_password_hash_executor_lock = threading.Lock()
+
+
+def get_password_hash_executor() -> ThreadPoolExecutor:
+    """
+    이 함수는 프로세스마다 하나의 비밀번호 해시(학생 일괄 생성) 스레드 풀을 생성하여 반환합니다.
+    요청마다 풀을 만들지 않고 PASSWORD_HASH_WORKERS개의 스레드를 모든 요청이 함께 사용하므로, 동시에 실행되는 해시 수가 제한됩니다.
+    gunicorn 워커가 fork된 이후에 생성되도록 처음 사용할 때 생성합니다.
+
+    Returns:
+        ThreadPoolExecutor: 비밀번호 해시 스레드 풀입니다.
+    """
+    global _password_hash_executor
+
+    if _password_hash_executor is None:
+        with _password_hash_executor_lock:
+            if _password_hash_executor is None:
+                _password_hash_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+
+    return _password_hash_executor
@@ -10,8 +10,10 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     @classmethod
     def get_token(cls, user: User) -> Token:
         """
-        이 함수는 Token의 payload에 유저의 권한 정보를 추가하고
+        이 함수는 Token의 payload에 유저의 권한 정보, 토큰 버전과 유저 정보(닉네임, 학교 이름, 탈퇴 여부)를 추가하고
         삭제된 유저는 복구합니다.
+        권한 정보는 권한 검사에서 그대로 사용되며, 토큰 버전은 권한 변경 시 기존 토큰을 무효화하는 데 사용됩니다.
+        유저 정보는 데이터베이스를 조회하지 않는 인증(JWT_STATELESS_AUTHENTICATION)에서 유저 객체를 만드는 데 사용됩니다.
 
         Args:
             user (User): 유저 객체입니다.
@@ -21,18 +23,32 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         token = super().get_token(user)
         user_group = user.groups.first()
 
+        # 유저가 삭제되었을 경우, 삭제된 유저를 복구합니다. (복구된 상태를 토큰에 담기 위해 먼저 처리)
+        cls._handle_deleted_user(user, user_group)
+
+        token["token_version"] = user.token_version
+        token["nickname"] = user.nickname
+        token["school_name"] = user.school_name
+        token["is_deleted"] = user.is_deleted
+
         if user_group is not None:
             token["user_role"] = {
                 "id": user_group.id,
                 "name": user_group.name,
             }
 
-        # 유저가 삭제되었을 경우, 삭제된 유저를 복구합니다.
-        cls._handle_deleted_user(user, user_group)
         return token
 
     @staticmethod
     def _handle_deleted_user(user: User, user_group: Group):
+        """
+        이 내장 함수는 삭제된 유저를 복구합니다.
+        유저 복구는 한 번의 조건부 수정으로 처리하고, 채널 복구는 백그라운드 작업으로 처리합니다.
+
+        Args:
+            user (User): 유저 객체입니다.
+            user_group (Group): 유저의 권한 그룹입니다.
+        """
         if user.is_deleted is True and user.deleted_at is not None:
             user_service = UserService()
             user_service.restore_user(user=user, user_role=getattr(user_group, "id", None))
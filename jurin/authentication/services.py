@@ -1,23 +1,284 @@
+import secrets
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.request import Request
 from rest_framework_simplejwt.authentication import AuthUser, JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import Token
 
+from jurin.channels.sharding import activate_user_channel_shard, is_sharding_enabled
 from jurin.common.exception.exceptions import AuthenticationFailedException
+from jurin.users.caches import UserCache
+from jurin.users.models import User
 
 
 class CustomJWTAuthentication(JWTAuthentication):
+    STATELESS_USER_FIELD_NAMES = ["id", "nickname", "school_name", "is_active", "is_deleted", "token_version"]
+
+    def authenticate(self, request: Request) -> Optional[tuple[AuthUser, Token]]:
+        """
+        이 함수는 기존의 JWTAuthentication의 authenticate 함수를 오버라이드하여
+        인증된 유저가 참여한 채널의 샤드를 요청의 채널 샤드로 설정합니다. (경로에 채널 아이디가 없는 요청에 사용)
+
+        Args:
+            request (Request): 요청 객체입니다.
+        Returns:
+            Optional[tuple[AuthUser, Token]]: 유저 객체와 토큰 객체입니다.
+        """
+        result = super().authenticate(request)
+
+        if result is not None:
+            activate_user_channel_shard(user_id=result[0].id)
+
+        return result
+
+    async def aauthenticate(self, request: Request) -> Optional[tuple[AuthUser, Token]]:
+        """
+        이 함수는 authenticate 함수의 비동기 버전으로, 비동기 뷰(AsyncAPIView)의 인증을 처리합니다.
+        토큰 검증은 데이터베이스를 사용하지 않으므로 이벤트 루프에서 바로 실행합니다.
+
+        Args:
+            request (Request): 요청 객체입니다.
+        Returns:
+            Optional[tuple[AuthUser, Token]]: 유저 객체와 토큰 객체입니다.
+        """
+        header = self.get_header(request)
+
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        user = await self.aget_user(validated_token)
+
+        if is_sharding_enabled():
+            await sync_to_async(activate_user_channel_shard)(user_id=user.id)
+
+        return user, validated_token
+
     def get_user(self, validated_token: Token) -> AuthUser:
         """
         이 함수는 기존의 JWTAuthentication의 get_user 함수를 오버라이드하여
-        삭제된 유저의 로그인을 막습니다. 로그인을 제외한 모든 API의 인증을 처리합니다.
+        삭제된 유저의 로그인과 토큰 버전이 다른(권한이 변경된) 토큰의 사용을 막습니다.
+        로그인을 제외한 모든 API의 인증을 처리합니다.
+        유저는 캐시에서 먼저 조회하며, 캐시에 없거나 토큰 버전이 다르면 데이터베이스에서 조회 후 캐시에 저장합니다.
 
         Args:
             validated_token (Token): JWT Token 객체입니다.
         Returns:
             user (AuthUser): 유저 객체입니다.
         """
-        user = super().get_user(validated_token)
+        if settings.JWT_STATELESS_AUTHENTICATION is True:
+            return self.get_stateless_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        token_version = validated_token.get("token_version", 0)
+        user_cache = UserCache()
+        user = user_cache.get_user(user_id=user_id)
+
+        if user is None or user.token_version != token_version:
+            user = super().get_user(validated_token)
+            user_cache.set_user(user=user)
 
+        elif user.is_active is False:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        self._check_user(user=user, token_version=token_version)
+        return user
+
+    async def aget_user(self, validated_token: Token) -> AuthUser:
+        """
+        이 함수는 get_user 함수의 비동기 버전입니다. 캐시는 비동기로 조회하고, 캐시에 없을 때만 데이터베이스에서 조회합니다.
+
+        Args:
+            validated_token (Token): JWT Token 객체입니다.
+        Returns:
+            user (AuthUser): 유저 객체입니다.
+        """
+        if settings.JWT_STATELESS_AUTHENTICATION is True:
+            return self.get_stateless_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        token_version = validated_token.get("token_version", 0)
+        user_cache = UserCache()
+        user = await user_cache.aget_user(user_id=user_id)
+
+        if user is None or user.token_version != token_version:
+            user = await sync_to_async(super().get_user)(validated_token)
+            await user_cache.aset_user(user=user)
+
+        elif user.is_active is False:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        self._check_user(user=user, token_version=token_version)
+        return user
+
+    def _check_user(self, user: User, token_version: int):
+        """
+        이 내장 함수는 삭제된 유저와 토큰 버전이 다른(권한이 변경된) 토큰을 거부합니다.
+        """
         if user.is_deleted is True and user.deleted_at is not None:
             raise AuthenticationFailedException("User is deleted")
 
+        if token_version != user.token_version:
+            raise AuthenticationFailedException("Token is revoked")
+
+    def get_stateless_user(self, validated_token: Token) -> User:
+        """
+        이 함수는 데이터베이스를 조회하지 않고 토큰의 유저 정보(아이디, 닉네임, 학교 이름, 권한, 토큰 버전)로 유저 객체를 만듭니다.
+        유저 정보가 없는 이전 토큰과 탈퇴한 유저의 토큰은 거부합니다.
+        토큰을 발급한 후의 변경(닉네임 수정, 탈퇴, 권한 변경)은 토큰이 만료되어 다시 발급받을 때 반영됩니다.
+
+        Args:
+            validated_token (Token): JWT Token 객체입니다.
+        Returns:
+            User: 토큰의 유저 정보로 만든 유저 객체입니다.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+            user_role = validated_token["user_role"]
+            values = [
+                user_id,
+                validated_token["nickname"],
+                validated_token["school_name"],
+                True,
+                validated_token["is_deleted"],
+                validated_token["token_version"],
+            ]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        if validated_token["is_deleted"] is True:
+            raise AuthenticationFailedException("User is deleted")
+
+        user = User.from_db(DEFAULT_DB_ALIAS, self.STATELESS_USER_FIELD_NAMES, values)
+
+        # 권한 그룹을 조회한 것처럼 저장하여 user.groups.first()가 데이터베이스를 조회하지 않도록 함
+        groups = Group.objects.order_by("pk")
+        groups._result_cache = [Group(id=user_role["id"], name=user_role["name"])]
+        groups._prefetch_done = True
+        user._prefetched_objects_cache = {"groups": groups}
+
+        return user
+
+
+class StreamTicketAuthentication(BaseAuthentication):
+    """
+    SSE API(주식 스트림)의 인증 클래스로, 쿼리 파라미터(ticket)의 스트림 티켓으로 인증합니다.
+    브라우저의 EventSource는 헤더를 설정할 수 없으므로, 액세스 토큰 대신 JWT 인증으로 발급받은 일회용 티켓을 URL에 넣습니다.
+    티켓은 STOCK_STREAM_TICKET_TIMEOUT초 동안 발급받은 채널에서 한 번만 사용할 수 있으므로, 접근 로그에 남아도 다시 사용할 수 없습니다.
+    """
+
+    CACHE_KEY = "authentication:stream_ticket:{ticket}"
+    query_param = "ticket"
+
+    def issue_ticket(self, user: User, channel_id: int) -> str:
+        """
+        이 함수는 유저와 채널 아이디로 스트림 티켓을 발급합니다.
+
+        Args:
+            user (User): 유저 객체입니다.
+            channel_id (int): 채널 아이디입니다.
+        Returns:
+            str: 스트림 티켓입니다.
+        """
+        ticket = secrets.token_urlsafe(32)
+        cache.set(
+            self.CACHE_KEY.format(ticket=ticket),
+            {"user_id": user.id, "channel_id": channel_id},
+            timeout=settings.STOCK_STREAM_TICKET_TIMEOUT,
+        )
+        return ticket
+
+    def authenticate(self, request: Request) -> Optional[tuple[User, None]]:
+        """
+        이 함수는 스트림 티켓을 사용 처리하고 티켓을 발급받은 유저를 반환합니다.
+        티켓은 캐시에서 삭제에 성공한 요청만 사용할 수 있으므로, 동시에 같은 티켓으로 요청해도 하나의 요청만 인증됩니다.
+
+        Args:
+            request (Request): 요청 객체입니다.
+        Returns:
+            Optional[tuple[User, None]]: 유저 객체입니다. 티켓이 없으면 None을 반환합니다.
+        """
+        ticket = request.query_params.get(self.query_param)
+
+        if not ticket:
+            return None
+
+        cache_key = self.CACHE_KEY.format(ticket=ticket)
+        values = cache.get(cache_key)
+
+        # 티켓을 삭제한 요청만 사용할 수 있음 (동시에 같은 티켓을 사용한 요청은 거부)
+        if not cache.delete(cache_key):
+            values = None
+
+        self._check_ticket(request=request, values=values)
+
+        user = User.objects.filter(id=values["user_id"]).first()
+        return self._check_user(user=user), None
+
+    async def aauthenticate(self, request: Request) -> Optional[tuple[User, None]]:
+        """
+        이 함수는 authenticate 함수의 비동기 버전입니다.
+
+        Args:
+            request (Request): 요청 객체입니다.
+        Returns:
+            Optional[tuple[User, None]]: 유저 객체입니다. 티켓이 없으면 None을 반환합니다.
+        """
+        ticket = request.query_params.get(self.query_param)
+
+        if not ticket:
+            return None
+
+        cache_key = self.CACHE_KEY.format(ticket=ticket)
+        values = await cache.aget(cache_key)
+
+        # 티켓을 삭제한 요청만 사용할 수 있음 (동시에 같은 티켓을 사용한 요청은 거부)
+        if not await cache.adelete(cache_key):
+            values = None
+
+        self._check_ticket(request=request, values=values)
+
+        user = await User.objects.filter(id=values["user_id"]).afirst()
+        return self._check_user(user=user), None
+
+    def authenticate_header(self, request: Request) -> str:
+        return "Ticket"
+
+    def _check_ticket(self, request: Request, values: Optional[dict]):
+        """
+        이 내장 함수는 만료되었거나 다른 채널에서 발급받은 티켓을 거부합니다.
+        """
+        channel_id = request.parser_context["kwargs"].get("channel_id")
+
+        if values is None or values["channel_id"] != channel_id:
+            raise AuthenticationFailedException("Stream ticket is invalid or expired.")
+
+    def _check_user(self, user: Optional[User]) -> User:
+        """
+        이 내장 함수는 티켓 발급 후 삭제되거나 비활성화된 유저를 거부합니다.
+        """
+        if user is None or user.is_active is False or user.is_deleted is True:
+            raise AuthenticationFailedException("User is inactive or deleted")
+
         return user
@@ -0,0 +1,97 @@
+import time
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from rest_framework.request import Request
+from rest_framework.throttling import BaseThrottle
+from rest_framework.views import APIView
+
+from config.django.base import logger
+
+
+class SignInTokenBucketThrottle(BaseThrottle):
+    """
+    이 클래스는 로그인 요청을 IP와 아이디별 토큰 버킷으로 제한하는 클래스입니다.
+    버킷은 Redis에 저장되어 모든 워커가 공유하며, Lua 스크립트로 원자적으로 갱신됩니다.
+    수업 시작 시 같은 학교 IP에서 많은 학생이 동시에 로그인하므로 IP 버킷은 크게, 아이디 버킷은 작게 설정합니다.
+    Redis를 사용할 수 없으면 요청을 허용합니다.
+    """
+
+    CACHE_KEY = "throttles:sign_in:{scope}:{ident}"
+    SCRIPT = """
+    local capacity = tonumber(ARGV[1])
+    local refill_rate = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated_at")
+    local tokens = tonumber(bucket[1]) or capacity
+    local updated_at = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * refill_rate)
+    local allowed = 0
+    local wait = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+        allowed = 1
+    else
+        wait = (1 - tokens) / refill_rate
+    end
+    redis.call("HSET", KEYS[1], "tokens", tokens, "updated_at", now)
+    redis.call("EXPIRE", KEYS[1], math.ceil(capacity / refill_rate) + 1)
+    return {allowed, tostring(wait)}
+    """
+
+    def __init__(self):
+        self.wait_seconds = None
+
+    def _consume(self, scope: str, ident: str, capacity: int, refill_rate: float) -> bool:
+        """
+        이 내장 함수는 버킷에서 토큰 하나를 꺼냅니다.
+
+        Args:
+            scope (str): 버킷 종류입니다. (ip, username)
+            ident (str): 버킷 식별자입니다.
+            capacity (int): 버킷의 최대 토큰 수입니다.
+            refill_rate (float): 초당 채워지는 토큰 수입니다.
+        Returns:
+            bool: 토큰을 꺼냈으면 True, 버킷이 비어있으면 False를 반환합니다.
+        """
+        redis_connection = get_redis_connection("default")
+        allowed, wait = redis_connection.eval(
+            self.SCRIPT,
+            1,
+            self.CACHE_KEY.format(scope=scope, ident=ident),
+            capacity,
+            refill_rate,
+            time.time(),
+        )
+
+        if int(allowed) == 0:
+            self.wait_seconds = max(self.wait_seconds or 0, float(wait))
+            return False
+
+        return True
+
+    def allow_request(self, request: Request, view: APIView) -> bool:
+        buckets = [
+            ("ip", self.get_ident(request), settings.SIGN_IN_THROTTLE_IP_CAPACITY, settings.SIGN_IN_THROTTLE_IP_REFILL_RATE),
+        ]
+
+        username = request.data.get("username") if hasattr(request.data, "get") else None
+
+        if isinstance(username, str) and username:
+            buckets.append(
+                ("username", username, settings.SIGN_IN_THROTTLE_USERNAME_CAPACITY, settings.SIGN_IN_THROTTLE_USERNAME_REFILL_RATE)
+            )
+
+        try:
+            return all([self._consume(*bucket) for bucket in buckets])
+
+        except NotImplementedError:
+            # Redis 캐시를 사용하지 않는 환경
+            return True
+
+        except Exception as e:
+            logger.warning(f"Sign in throttle is unavailable. {e}")
+            return True
+
+    def wait(self):
+        return self.wait_seconds
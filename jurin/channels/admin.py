@@ -1,6 +1,8 @@
 from django.contrib import admin
 
-from jurin.channels.models import Channel, UserChannel
+from jurin.channels.models import Channel, ChannelShard, PointLog, UserChannel
 
 admin.site.register(Channel)
 admin.site.register(UserChannel)
+admin.site.register(PointLog)
+admin.site.register(ChannelShard)
@@ -0,0 +1,211 @@
+import asyncio
+import functools
+import hashlib
+import time
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from config.django.base import logger
+from jurin.channels.selectors.user_channels import UserChannelSelector
+from jurin.channels.sharding import get_current_channel_shard_database
+from jurin.common.db_routers import use_primary
+from jurin.common.permissions import aget_user_role_id, get_user_role_id
+
+
+class ChannelResponseCache:
+    """
+    이 클래스는 채널 조회 API의 응답을 채널의 세대(generation) 번호와 함께 캐시에 저장하고 조회하는 클래스입니다.
+    채널 데이터를 변경하는 서비스는 커밋 후 채널의 세대 번호를 올리며, 세대 번호가 캐시 키에 포함되므로 이전 세대의 응답은 다시 조회되지 않고 만료됩니다.
+    세대 번호가 없으면(캐시 초기화 등) 현재 시각(ns)으로 시작하여 이전에 사용한 세대 번호와 겹치지 않도록 합니다.
+    """
+
+    GENERATION_CACHE_KEY = "channels:generation:{channel_id}"
+    RESPONSE_CACHE_KEY = "channels:response:{channel_id}:{generation}:{digest}"
+
+    def _get_generation_cache_key(self, channel_id: int) -> str:
+        return self.GENERATION_CACHE_KEY.format(channel_id=channel_id)
+
+    def get_generation(self, channel_id: int) -> int:
+        """
+        이 함수는 채널의 세대 번호를 조회하고, 없으면 생성합니다.
+
+        Args:
+            channel_id (int): 채널 아이디입니다.
+        Returns:
+            int: 채널의 세대 번호입니다.
+        """
+        cache_key = self._get_generation_cache_key(channel_id=channel_id)
+        generation = cache.get(cache_key)
+
+        if generation is None:
+            cache.add(cache_key, time.time_ns(), timeout=None)
+            generation = cache.get(cache_key)
+
+        return generation
+
+    async def aget_generation(self, channel_id: int) -> int:
+        """
+        이 함수는 get_generation 함수의 비동기 버전입니다.
+
+        Args:
+            channel_id (int): 채널 아이디입니다.
+        Returns:
+            int: 채널의 세대 번호입니다.
+        """
+        cache_key = self._get_generation_cache_key(channel_id=channel_id)
+        generation = await cache.aget(cache_key)
+
+        if generation is None:
+            await cache.aadd(cache_key, time.time_ns(), timeout=None)
+            generation = await cache.aget(cache_key)
+
+        return generation
+
+    def bump_generation(self, channel_id: int):
+        """
+        이 함수는 채널의 세대 번호를 올려 채널의 캐시된 응답을 모두 무효화합니다.
+        트랜잭션 안에서 호출되면 커밋된 후에 올려, 커밋 전의 데이터가 새 세대 번호로 캐시되지 않도록 합니다.
+
+        Args:
+            channel_id (int): 채널 아이디입니다.
+        """
+        cache_key = self._get_generation_cache_key(channel_id=channel_id)
+
+        def _bump():
+            try:
+                # INCR로 올리므로 동시에 변경되어도 세대 번호가 겹치지 않음
+                cache.incr(cache_key)
+
+            except ValueError:
+                # 세대 번호가 없으면 조회 시 새로 생성되므로 이전 세대의 응답은 조회되지 않음
+                pass
+
+            except Exception as e:
+                logger.warning(f"Failed to bump channel generation. {e}")
+
+        transaction.on_commit(_bump, using=get_current_channel_shard_database())
+
+    def get_response_cache_key(self, view: APIView, request: Request, channel_id: int, role_id: int, generation: int) -> str:
+        """
+        이 함수는 뷰, 요청 URL(경로 파라미터, 쿼리 파라미터), 권한, 날짜와 채널의 세대 번호로 응답 캐시 키를 만듭니다.
+        페이지네이션의 다음, 이전 URL이 요청의 호스트를 포함하므로 전체 URL을 사용하고,
+        오늘의 거래처럼 날짜에 따라 달라지는 응답이 있으므로 날짜를 포함합니다.
+
+        Returns:
+            str: 응답 캐시 키입니다.
+        """
+        raw_key = f"{type(view).__module__}.{type(view).__qualname__}|{role_id}|{timezone.now().date()}|{request.build_absolute_uri()}"
+        digest = hashlib.sha256(raw_key.encode()).hexdigest()[:32]
+        return self.RESPONSE_CACHE_KEY.format(channel_id=channel_id, generation=generation, digest=digest)
+
+
+def cache_channel_response(timeout: Optional[int] = None) -> Callable:
+    """
+    이 함수는 채널 조회 API의 get 핸들러(동기, 비동기)의 응답을 채널 세대 번호로 캐시하는 데코레이터입니다.
+    경로에 channel_id가 있고 응답이 유저마다 다르지 않은(채널과 권한에만 의존하는) 조회 API에만 사용합니다.
+    (유저 본인의 보유 주식, 아이템 등을 조회하는 API에는 사용하지 않습니다.)
+
+    캐시된 응답이 있어도 유저의 채널 참여 여부는 매번 확인하며, 참여하지 않았으면 핸들러를 실행하여 핸들러의 검증 에러를 반환합니다.
+    캐시에 없으면 레플리카 지연으로 이전 데이터가 새 세대 번호로 캐시되지 않도록 프라이머리에서 조회하고, 성공(200) 응답만 저장합니다.
+    캐시를 사용할 수 없으면 캐시 없이 핸들러를 실행합니다.
+
+    Args:
+        timeout (Optional[int]): 응답 보관 시간(초)입니다. 기본값은 CHANNEL_RESPONSE_CACHE_TIMEOUT입니다.
+    Returns:
+        Callable: 데코레이터입니다.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(view: APIView, request: Request, *args, **kwargs) -> Response:
+                if settings.CHANNEL_RESPONSE_CACHE_ENABLED is False:
+                    return await func(view, request, *args, **kwargs)
+
+                channel_id = kwargs["channel_id"]
+                channel_response_cache = ChannelResponseCache()
+
+                try:
+                    generation = await channel_response_cache.aget_generation(channel_id=channel_id)
+                    role_id = await aget_user_role_id(request)
+                    cache_key = channel_response_cache.get_response_cache_key(
+                        view=view, request=request, channel_id=channel_id, role_id=role_id, generation=generation
+                    )
+                    data = await cache.aget(cache_key)
+
+                except Exception as e:
+                    logger.warning(f"Failed to get channel response cache. {e}")
+                    return await func(view, request, *args, **kwargs)
+
+                # 캐시된 응답이 있어도 채널 참여 여부 확인
+                if data is not None:
+                    user_channel_selector = UserChannelSelector()
+
+                    if await user_channel_selector.aget_user_channel_by_channel_id_and_user(channel_id=channel_id, user=request.user):
+                        return Response(data, status=status.HTTP_200_OK)
+
+                with use_primary():
+                    response = await func(view, request, *args, **kwargs)
+
+                if response.status_code == status.HTTP_200_OK:
+                    try:
+                        await cache.aset(cache_key, response.data, timeout=timeout or settings.CHANNEL_RESPONSE_CACHE_TIMEOUT)
+
+                    except Exception as e:
+                        logger.warning(f"Failed to set channel response cache. {e}")
+
+                return response
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(view: APIView, request: Request, *args, **kwargs) -> Response:
+            if settings.CHANNEL_RESPONSE_CACHE_ENABLED is False:
+                return func(view, request, *args, **kwargs)
+
+            channel_id = kwargs["channel_id"]
+            channel_response_cache = ChannelResponseCache()
+
+            try:
+                generation = channel_response_cache.get_generation(channel_id=channel_id)
+                role_id = get_user_role_id(request)
+                cache_key = channel_response_cache.get_response_cache_key(
+                    view=view, request=request, channel_id=channel_id, role_id=role_id, generation=generation
+                )
+                data = cache.get(cache_key)
+
+            except Exception as e:
+                logger.warning(f"Failed to get channel response cache. {e}")
+                return func(view, request, *args, **kwargs)
+
+            # 캐시된 응답이 있어도 채널 참여 여부 확인
+            if data is not None:
+                user_channel_selector = UserChannelSelector()
+
+                if user_channel_selector.get_user_channel_by_channel_id_and_user(channel_id=channel_id, user=request.user):
+                    return Response(data, status=status.HTTP_200_OK)
+
+            with use_primary():
+                response = func(view, request, *args, **kwargs)
+
+            if response.status_code == status.HTTP_200_OK:
+                try:
+                    cache.set(cache_key, response.data, timeout=timeout or settings.CHANNEL_RESPONSE_CACHE_TIMEOUT)
+
+                except Exception as e:
+                    logger.warning(f"Failed to set channel response cache. {e}")
+
+            return response
+
+        return wrapper
+
+    return decorator
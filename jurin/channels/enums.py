@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class PointLogType(Enum):
+    """
+    이 클래스는 포인트 변동 내역의 종류를 나타내는 열거형 클래스입니다.
+    """
+
+    GRANT = 1
+    STOCK_BUY = 2
+    STOCK_SELL = 3
+    ITEM_BUY = 4
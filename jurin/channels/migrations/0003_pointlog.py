@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:11
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('channels', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PointLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='포인트 내역 고유 아이디')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성 일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정 일시')),
+                ('log_type', models.PositiveSmallIntegerField(verbose_name='포인트 내역 종류')),
+                ('point', models.IntegerField(verbose_name='포인트 변동량')),
+                ('actor', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='acted_point_logs', to=settings.AUTH_USER_MODEL, verbose_name='처리 유저 고유 아이디')),
+                ('channel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='point_logs', to='channels.channel', verbose_name='채널 고유 아이디')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='point_logs', to=settings.AUTH_USER_MODEL, verbose_name='유저 고유 아이디')),
+            ],
+            options={
+                'verbose_name': 'point log',
+                'verbose_name_plural': 'point logs',
+                'db_table': 'point_log',
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:12
+
+from django.db import migrations, models
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_nickname_and_member_count(apps, schema_editor):
+    Channel = apps.get_model('channels', 'Channel')
+    UserChannel = apps.get_model('channels', 'UserChannel')
+    User = apps.get_model('users', 'User')
+
+    UserChannel.objects.update(nickname=Subquery(User.objects.filter(id=OuterRef('user_id')).values('nickname')[:1]))
+
+    member_counts = (
+        UserChannel.objects.filter(channel_id=OuterRef('id'))
+        .exclude(user_id=F('channel__user_id'))
+        .values('channel_id')
+        .annotate(member_count=Count('id'))
+        .values('member_count')
+    )
+    Channel.objects.update(member_count=Coalesce(Subquery(member_counts[:1]), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channels', '0003_pointlog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='channel',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='학생 수'),
+        ),
+        migrations.AddField(
+            model_name='userchannel',
+            name='nickname',
+            field=models.CharField(default='', max_length=8, verbose_name='유저 닉네임'),
+        ),
+        migrations.AddIndex(
+            model_name='userchannel',
+            index=models.Index(fields=['channel', 'nickname', 'id'], name='user_channel_nickname_idx'),
+        ),
+        migrations.RunPython(backfill_nickname_and_member_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channels', '0004_user_channel_nickname_and_member_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChannelShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='채널 고유 아이디')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성 일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정 일시')),
+                ('database', models.CharField(max_length=32, verbose_name='데이터베이스 별칭')),
+                ('entry_code', models.CharField(max_length=8, unique=True, verbose_name='참여 코드')),
+                ('is_migrating', models.BooleanField(default=False, verbose_name='샤드 이동 여부')),
+            ],
+            options={
+                'verbose_name': 'channel shard',
+                'verbose_name_plural': 'channel shards',
+                'db_table': 'channel_shard',
+                'indexes': [models.Index(fields=['database'], name='channel_shard_database_idx')],
+            },
+        ),
+    ]
@@ -14,6 +14,7 @@ class Channel(BaseModel):
     market_closing_at = models.TimeField(default="15:00:00", verbose_name="시장 종료 시간")
     is_pending_deleted = models.BooleanField(default=False, verbose_name="삭제 대기 여부")
     pending_deleted_at = models.DateTimeField(null=True, verbose_name="삭제 대기 일시")
+    member_count = models.PositiveIntegerField(default=0, verbose_name="학생 수")
 
     def __str__(self):
         return f"[{self.id}]: {self.name}"
@@ -29,6 +30,7 @@ class UserChannel(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="유저 고유 아이디", related_name="user_channel_pivot")
     channel = models.ForeignKey(Channel, on_delete=models.CASCADE, verbose_name="채널 고유 아이디", related_name="user_channel_pivot")
     point = models.PositiveIntegerField(default=0, verbose_name="포인트")
+    nickname = models.CharField(max_length=8, default="", verbose_name="유저 닉네임")
 
     def __str__(self):
         return f"[{self.id}]: {self.user.username} - {self.channel.name}"
@@ -38,3 +40,47 @@ class UserChannel(models.Model):
         verbose_name = "user channel"
         verbose_name_plural = "user channels"
         unique_together = ("user", "channel")
+        indexes = [
+            models.Index(fields=["channel", "nickname", "id"], name="user_channel_nickname_idx"),
+        ]
+
+
+class PointLog(BaseModel):
+    id = models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="포인트 내역 고유 아이디")
+    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="유저 고유 아이디", related_name="point_logs")
+    channel = models.ForeignKey(Channel, on_delete=models.CASCADE, verbose_name="채널 고유 아이디", related_name="point_logs")
+    actor = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        verbose_name="처리 유저 고유 아이디",
+        related_name="acted_point_logs",
+    )
+    log_type = models.PositiveSmallIntegerField(verbose_name="포인트 내역 종류")
+    point = models.IntegerField(verbose_name="포인트 변동량")
+
+    def __str__(self):
+        return f"[{self.id}]: {self.user_id} - {self.channel_id} ({self.point})"
+
+    class Meta:
+        db_table = "point_log"
+        verbose_name = "point log"
+        verbose_name_plural = "point logs"
+
+
+class ChannelShard(BaseModel):
+    id = models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="채널 고유 아이디")
+    database = models.CharField(max_length=32, verbose_name="데이터베이스 별칭")
+    entry_code = models.CharField(max_length=8, unique=True, verbose_name="참여 코드")
+    is_migrating = models.BooleanField(default=False, verbose_name="샤드 이동 여부")
+
+    def __str__(self):
+        return f"[{self.id}]: {self.database}"
+
+    class Meta:
+        db_table = "channel_shard"
+        verbose_name = "channel shard"
+        verbose_name_plural = "channel shards"
+        indexes = [
+            models.Index(fields=["database"], name="channel_shard_database_idx"),
+        ]
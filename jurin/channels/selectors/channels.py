@@ -33,6 +33,25 @@ class ChannelSelector:
         except Channel.DoesNotExist:
             return None
 
+    def get_pending_deleted_channel_by_id(self, channel_id: int) -> Optional[Channel]:
+        """
+        이 함수는 채널 아이디로 삭제 대기 중인 채널을 조회합니다.
+
+        Args:
+            channel_id (int): 채널 아이디입니다.
+        Returns:
+            Channel | None: 채널 객체입니다. 존재하지 않으면 None을 반환합니다.
+        """
+        try:
+            return Channel.objects.filter(
+                id=channel_id,
+                is_pending_deleted=True,
+                pending_deleted_at__isnull=False,
+            ).get()
+
+        except Channel.DoesNotExist:
+            return None
+
     def get_channel_by_user(self, user: User) -> Optional[Channel]:
         """
         이 함수는 유저로 채널을 조회합니다.
@@ -34,6 +34,30 @@ class UserChannelSelector:
         except UserChannel.DoesNotExist:
             return None
 
+    async def aget_user_channel_by_channel_id_and_user(self, channel_id: int, user: User) -> Optional[UserChannel]:
+        """
+        이 함수는 get_user_channel_by_channel_id_and_user 함수의 비동기 버전입니다.
+
+        Args:
+            channel_id (int): 채널 ID입니다.
+            user (User): 유저 객체입니다.
+        Returns:
+            Optional[UserChannel]: 유저 채널 객체입니다. 존재하지 않으면 None을 반환합니다.
+        """
+        try:
+            channel_qs = Q(channel__is_pending_deleted=False) & Q(channel__pending_deleted_at__isnull=True)
+
+            return (
+                await UserChannel.objects.filter(
+                    channel_id=channel_id,
+                    user=user,
+                )
+                .filter(channel_qs)
+                .aget()
+            )
+        except UserChannel.DoesNotExist:
+            return None
+
     def get_user_channel_by_channel_id_and_user_for_student(self, channel_id: int, user: User) -> Optional[UserChannel]:
         """
         이 함수는 채널 아이디와 유저를 받아서 학생을 위한 유저 채널을 조회합니다.
@@ -52,15 +76,38 @@ class UserChannelSelector:
         except UserChannel.DoesNotExist:
             return None
 
+    async def aget_user_channel_by_channel_id_and_user_for_student(self, channel_id: int, user: User) -> Optional[UserChannel]:
+        """
+        이 함수는 get_user_channel_by_channel_id_and_user_for_student 함수의 비동기 버전입니다.
+
+        Args:
+            channel_id (int): 채널 ID입니다.
+            user (User): 유저 객체입니다.
+        Returns:
+            Optional[UserChannel]: 유저 채널 객체입니다. 존재하지 않으면 None을 반환합니다.
+        """
+        try:
+            return await UserChannel.objects.filter(
+                channel_id=channel_id,
+                user=user,
+            ).aget()
+        except UserChannel.DoesNotExist:
+            return None
+
     def get_user_channel_queryset_exec_mine_with_user_by_channel_id_and_nickname_and_user(
-        self, channel_id: int, nickname: Optional[str], user: User
+        self, channel_id: int, nickname: Optional[str], user: User, cursor: Optional[tuple[str, int]] = None
     ) -> QuerySet[UserChannel]:
         """
         이 함수는 채널 아이디와 닉네임과 유저를 받아서 자기 자신을 제외하고 유저를 포함한 유저 채널 쿼리셋을 조회합니다.
+        닉네임은 대소문자를 구분하지 않고 앞부분 일치로 검색하며, (채널, 닉네임, 아이디) 인덱스 순서로 정렬합니다.
+        커서가 주어지면 커서 다음 위치부터 조회합니다. (키셋 페이징)
         체널이 삭제 대기 중인 경우 조회되지 않습니다.
 
         Args:
             channel_id (int): 채널 ID입니다.
+            nickname (Optional[str]): 검색할 닉네임의 앞부분입니다.
+            user (User): 유저 객체입니다.
+            cursor (Optional[tuple[str, int]]): 이전 페이지 마지막 유저 채널의 닉네임과 ID입니다.
         Returns:
             QuerySet[UserChannel]: 유저 채널 쿼리셋입니다.
         """
@@ -69,7 +116,13 @@ class UserChannelSelector:
         user_qs = Q()
 
         if nickname is not None:
-            user_qs &= Q(user__nickname__icontains=nickname)
+            user_qs &= Q(nickname__istartswith=nickname)
+
+        cursor_qs = Q()
+
+        if cursor is not None:
+            cursor_nickname, cursor_id = cursor
+            cursor_qs &= Q(nickname__gt=cursor_nickname) | Q(nickname=cursor_nickname, id__gt=cursor_id)
 
         return (
             UserChannel.objects.select_related("user")
@@ -78,7 +131,9 @@ class UserChannelSelector:
             )
             .filter(channel_qs)
             .filter(user_qs)
+            .filter(cursor_qs)
             .exclude(user=user)
+            .order_by("nickname", "id")
         )
 
     def get_user_channel_queryset_exec_mine_by_users_ids_and_user_and_channel_id(
@@ -106,6 +161,31 @@ class UserChannelSelector:
             .exclude(user=user)
         )
 
+    def get_user_channel_queryset_for_update_with_user_by_user_ids_and_channel_id(
+        self, user_ids: list[int], channel_id: int
+    ) -> QuerySet[UserChannel]:
+        """
+        이 함수는 유저 아이디 리스트와 채널 아이디를 받아서 유저를 포함한 유저 채널 쿼리셋을 잠금과 함께 조회합니다.
+        채널이 삭제 대기 중인 경우 조회되지 않습니다. 트랜잭션 안에서 사용해야 합니다.
+
+        Args:
+            user_ids (list[int]): 유저 아이디 리스트입니다.
+            channel_id (int): 채널 ID입니다.
+        Returns:
+            QuerySet[UserChannel]: 유저 채널 쿼리셋입니다.
+        """
+        channel_qs = Q(channel__is_pending_deleted=False) & Q(channel__pending_deleted_at__isnull=True)
+
+        return (
+            UserChannel.objects.select_for_update(of=("self",))
+            .select_related("user")
+            .filter(
+                user_id__in=user_ids,
+                channel_id=channel_id,
+            )
+            .filter(channel_qs)
+        )
+
     def check_is_exists_user_channel_by_user(self, user: User) -> bool:
         """
         이 함수는 유저로 유저 채널이 존재하는지 조회합니다.
@@ -1,38 +1,46 @@
-import random
-import string
-
+from django.db import IntegrityError, transaction
 from django.db.models import F
-from django.db.models.query import QuerySet
 from django.utils import timezone
 
-from jurin.channels.models import Channel, UserChannel
+from jurin.channels.caches import ChannelResponseCache
+from jurin.channels.enums import PointLogType
+from jurin.channels.models import Channel, PointLog, UserChannel
 from jurin.channels.selectors.channels import ChannelSelector
 from jurin.channels.selectors.user_channels import UserChannelSelector
-from jurin.channels.tasks import delete_channel_task
+from jurin.channels.sharding import (
+    allocate_channel_shard,
+    delete_channel_shard,
+    get_channel_id_by_entry_code,
+    get_current_channel_shard_database,
+    mirror_users,
+    use_channel,
+    use_channel_shard,
+)
+from jurin.channels.tasks import cleanup_channel_members_task, delete_channel_task
+from jurin.channels.utils import EntryCodeAllocator
 from jurin.common.exception.exceptions import NotFoundException, ValidationException
+from jurin.common.utils import delete_queryset_in_batches
+from jurin.items.models import UserItem, UserItemLog
+from jurin.stocks.models import UserStock, UserTradeInfo
+from jurin.tasks.services import DeferredTaskService
 from jurin.users.models import User
 
 
 class ChannelService:
+    ENTRY_CODE_MAX_RETRIES = 32
+    MEMBER_CLEANUP_ASYNC_THRESHOLD = 10
+    MEMBER_CLEANUP_BATCH_SIZE = 1000
+
     def __init__(self):
         self.channel_selector = ChannelSelector()
         self.user_channel_selector = UserChannelSelector()
-
-    @staticmethod
-    def _generate_random_entry_code() -> str:
-        """
-        이 내장 함수는 6자리의 랜덤한 문자열을 생성합니다.
-
-        Returns:
-            str: 6자리의 랜덤한 문자열입니다.
-        """
-        characters = string.ascii_lowercase + string.digits
-        random_entry_code = "".join(random.choice(characters) for _ in range(6))
-        return random_entry_code
+        self.entry_code_allocator = EntryCodeAllocator()
+        self.channel_response_cache = ChannelResponseCache()
 
     def create_channel(self, user: User, channel_name: str) -> Channel:
         """
-        이 함수는 채널 이름과 유저를 받아서 검증 후 참여 코드를 생성 후 채널을 생성합니다.
+        이 함수는 채널 이름과 유저를 받아서 검증 후 참여 코드를 발급받아 채널을 생성합니다.
+        참여 코드는 중복되지 않도록 발급되므로 중복 조회 없이 한 번의 삽입으로 채널을 생성합니다.
 
         Args:
             user (User): 유저 객체입니다.
@@ -44,15 +52,33 @@ class ChannelService:
         if self.channel_selector.check_is_exists_channel_by_user(user=user) is True:
             raise ValidationException("You already have a channel.")
 
-        # 참여 코드 생성 및 중복 검증
-        entry_code = self._generate_random_entry_code()
-
-        while self.channel_selector.check_is_exists_channel_by_entry_code(entry_code=entry_code) is True:
-            entry_code = self._generate_random_entry_code()
+        # 참여 코드 발급, 채널 샤드 배정 및 채널 생성
+        # (순번 캐시가 초기화되어 기존 참여 코드와 겹치면 건너뛸 순번을 두 배씩 늘려 재시도하므로,
+        # 순번 캐시가 실제 순번보다 뒤처져 있어도 몇 번의 재시도로 발급된 순번을 넘어섬)
+        for attempt in range(self.ENTRY_CODE_MAX_RETRIES):
+            try:
+                with transaction.atomic():
+                    channel_shard = allocate_channel_shard(entry_code=self.entry_code_allocator.allocate(step=2**attempt))
+
+                    with use_channel_shard(database=channel_shard.database), transaction.atomic(using=channel_shard.database):
+                        mirror_users(users=[user], database=channel_shard.database)
+                        channel = Channel.objects.create(
+                            id=channel_shard.id,
+                            name=channel_name,
+                            entry_code=channel_shard.entry_code,
+                            user=user,
+                        )
+
+                        # 유저 채널 생성
+                        channel.user_channel_pivot.create(user=user, nickname=user.nickname)
+                break
+
+            except IntegrityError:
+                continue
+
+        else:
+            raise ValidationException("Failed to allocate entry code.")
 
-        # 채널 생성 및 유저 채널 생성
-        channel = Channel.objects.create(name=channel_name, entry_code=entry_code, user=user)
-        channel.user_channel_pivot.create(user=user)
         return channel
 
     def join_channel(self, user: User, entry_code: str) -> Channel:
@@ -69,14 +95,24 @@ class ChannelService:
         if self.user_channel_selector.check_is_exists_user_channel_by_user(user=user) is True:
             raise ValidationException("You already joined this channel.")
 
-        # 참여 코드 검증
-        channel = self.channel_selector.get_channel_by_entry_code(entry_code=entry_code)
+        # 참여 코드의 채널이 저장된 샤드에서 참여 처리 (샤드 이동 중이면 참여 불가)
+        with use_channel(channel_id=get_channel_id_by_entry_code(entry_code=entry_code)):
+            database = get_current_channel_shard_database()
 
-        if channel is None:
-            raise ValidationException("Entry code is invalid.")
+            # 참여 코드 검증
+            channel = self.channel_selector.get_channel_by_entry_code(entry_code=entry_code)
+
+            if channel is None:
+                raise ValidationException("Entry code is invalid.")
 
-        # 유저 채널 참여 처리
-        channel.user_channel_pivot.create(user=user)
+            # 유저 채널 참여 처리 및 학생 수 증가
+            with transaction.atomic(using=database):
+                mirror_users(users=[user], database=database)
+                channel.user_channel_pivot.create(user=user, nickname=user.nickname)
+                Channel.objects.filter(id=channel.id).update(member_count=F("member_count") + 1)
+
+                # 채널 응답 캐시 무효화
+                self.channel_response_cache.bump_generation(channel_id=channel.id)
 
         return channel
 
@@ -99,6 +135,9 @@ class ChannelService:
         # 채널 이름 수정
         channel.name = channel_name
         channel.save()
+
+        # 채널 응답 캐시 무효화
+        self.channel_response_cache.bump_generation(channel_id=channel.id)
         return channel
 
     def pending_delete_channel(self, user: User, channel_id: int):
@@ -126,23 +165,32 @@ class ChannelService:
             channel.save()
 
             # 채널 삭제 테스크를 60분 후에 실행
-            delete_channel_task.apply_async(args=[channel_id], countdown=3600)
+            deferred_task_service = DeferredTaskService()
+            deferred_task_service.schedule_task(task=delete_channel_task, task_args=[channel_id], countdown=3600)
+
+            # 채널 응답 캐시 무효화
+            self.channel_response_cache.bump_generation(channel_id=channel_id)
 
     def delete_channel(self, channel_id: int):
         """
-        이 함수는 채널 아이디를 받아서 검증 후 채널을 삭제합니다.
+        이 함수는 채널 아이디를 받아서 검증 후 삭제 대기 중인 채널을 삭제합니다.
+        삭제 대기 중 복구된 채널은 삭제되지 않습니다.
 
         Args:
             channel_id (int): 채널 아이디입니다.
         """
-        # 채널이 존재하는지 검증
-        channel = self.channel_selector.get_channel_by_id(channel_id=channel_id)
+        # 삭제 대기 중인 채널이 존재하는지 검증
+        channel = self.channel_selector.get_pending_deleted_channel_by_id(channel_id=channel_id)
 
         if channel is None:
             raise NotFoundException(detail="Channel does not exist.", code="not_channel")
 
         # 채널 삭제 처리
         channel.delete()
+        delete_channel_shard(channel_id=channel_id)
+
+        # 채널 응답 캐시 무효화
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
 
     def leave_channel(self, user: User, channel_id: int):
         """
@@ -159,16 +207,19 @@ class ChannelService:
         if user_channel is None:
             raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
 
-        # 채널에서 탈퇴 처리
-        user_channel.delete()
-        user.user_stock_pivot.filter(channel_id=channel_id).delete()
-        user.user_item_pivot.filter(channel_id=channel_id).delete()
-        user.user_trade_info_pivot.filter(channel_id=channel_id).delete()
+        with transaction.atomic(using=get_current_channel_shard_database()):
+            # 채널에서 탈퇴 처리 및 학생 수 감소
+            user_channel.delete()
+            Channel.objects.filter(id=channel_id).update(member_count=F("member_count") - 1)
+
+            # 채널에서 탈퇴한 유저의 주식, 아이템, 거래 정보를 삭제
+            # (채널 응답 캐시는 cleanup_channel_members에서 무효화)
+            self.cleanup_channel_members(channel_id=channel_id, user_ids=[user.id])
 
     def leave_users(self, user: User, channel_id: int, user_ids: list[int]):
         """
-        이 함수는 유저와 채널 아이디와 유저 아이디 리스트를 받아 검증 후
-        채널에서 탈퇴시킨 후 포인트를 0으로 초기화합니다.
+        이 함수는 유저와 채널 아이디와 유저 아이디 리스트를 받아 검증 후 채널에서 탈퇴시킵니다.
+        탈퇴한 유저들의 채널 데이터는 인원이 많으면 백그라운드 작업으로 삭제합니다.
         (위 함수와 차이점은 채널 소유의 유저가 유저들을 탈퇴시키는 경우입니다.)
 
         Args:
@@ -182,47 +233,69 @@ class ChannelService:
         if channel is None:
             raise NotFoundException(detail="Channel does not exist.", code="not_channel")
 
-        # 유저 채널이 존재하는지 검증
+        # 채널 소유 유저인 경우 채널에서 탈퇴시키지 못하도록 검증
+        if user.id in user_ids:
+            raise ValidationException("You can't leave owner from channel.")
+
         user_channels = self.user_channel_selector.get_user_channel_queryset_exec_mine_by_users_ids_and_user_and_channel_id(
             user_ids=user_ids,
             channel_id=channel_id,
             user=user,
         )
 
-        if user_channels.count() != len(user_ids):
-            raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
+        with transaction.atomic(using=get_current_channel_shard_database()):
+            # 채널에서 탈퇴 처리 후 유저 채널이 모두 존재했는지 검증
+            deleted_count, _ = user_channels.delete()
 
-        # 채널 소유 유저인 경우 채널에서 탈퇴시키지 못하도록 검증
-        if user_channels.filter(user=user).exists():
-            raise ValidationException("You can't leave owner from channel.")
+            if deleted_count != len(user_ids):
+                raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
 
-        # 채널에서 탈퇴 처리
-        user_channels.delete()
+            # 학생 수 감소
+            Channel.objects.filter(id=channel_id).update(member_count=F("member_count") - deleted_count)
 
-        # 채널에서 탈퇴한 유저들의 주식, 아이템, 거래 정보를 삭제
-        user_stocks_info_pivot = user.user_stocks_info_pivot.filter(stock__channel_id=channel_id)
-        user_item_pivot = user.user_item_pivot.filter(item__channel_id=channel_id)
-        user_trade_info_pivot = user.user_trade_info_pivot.filter(stock__channel_id=channel_id)
+            # 채널에서 탈퇴한 유저들의 주식, 아이템, 거래 정보를 삭제 (인원이 많으면 커밋 후 백그라운드 작업으로 삭제)
+            # (채널 응답 캐시는 cleanup_channel_members에서 무효화하고, 백그라운드 작업으로 삭제하면 탈퇴 처리 커밋 후에도 무효화)
+            if len(user_ids) > self.MEMBER_CLEANUP_ASYNC_THRESHOLD:
+                transaction.on_commit(lambda: cleanup_channel_members_task.delay(channel_id, user_ids))
+                self.channel_response_cache.bump_generation(channel_id=channel_id)
+            else:
+                self.cleanup_channel_members(channel_id=channel_id, user_ids=user_ids)
+
+    def cleanup_channel_members(self, channel_id: int, user_ids: list[int]):
+        """
+        이 함수는 채널 아이디와 유저 아이디 리스트를 받아서 해당 채널에서의 유저들의
+        아이템 사용 내역, 아이템, 거래 내역, 보유 주식을 일정 개수씩 나누어 삭제합니다.
+        참조하는 테이블부터 순서대로 삭제합니다.
 
-        if user_stocks_info_pivot.exists():
-            user_stocks_info_pivot.delete()
+        Args:
+            channel_id (int): 채널 아이디입니다.
+            user_ids (list[int]): 유저 아이디 리스트입니다.
+        """
+        querysets = [
+            UserItemLog.objects.filter(user_item__user_id__in=user_ids, user_item__item__channel_id=channel_id),
+            UserItem.objects.filter(user_id__in=user_ids, item__channel_id=channel_id),
+            UserTradeInfo.objects.filter(user_id__in=user_ids, stock__channel_id=channel_id),
+            UserStock.objects.filter(user_id__in=user_ids, stock__channel_id=channel_id),
+        ]
 
-        if user_item_pivot.exists():
-            user_item_pivot.delete()
+        for queryset in querysets:
+            delete_queryset_in_batches(queryset=queryset, batch_size=self.MEMBER_CLEANUP_BATCH_SIZE)
 
-        if user_trade_info_pivot.exists():
-            user_trade_info_pivot.delete()
+        # 채널 응답 캐시 무효화 (백그라운드 작업으로 삭제한 거래 내역 반영)
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
 
-    def give_point_to_users(self, channel_id: int, user_ids: list[int], point: int, user: User) -> QuerySet[UserChannel]:
+    def give_point_to_users(self, channel_id: int, user_ids: list[int], point: int, user: User) -> list[UserChannel]:
         """
         이 함수는 채널 아이디와 유저 아아디 리스트와 유저를 검증 후 유저 채널에 포인트를 지급합니다.
+        지급 내역은 포인트 내역에 한 번에 기록되며, 잠금으로 조회한 잔액에 지급한 포인트를 더해 다시 조회하지 않고 반환합니다.
 
         Args:
             channel_id (int): 채널 아이디입니다.
             user_ids (list[int]): 유저 아이디 리스트입니다.
             point (int): 포인트입니다.
+            user (User): 유저 객체입니다.
         Returns:
-            QuerySet[UserChannel]: 유저 채널 쿼리셋입니다.
+            list[UserChannel]: 포인트가 반영된 유저 채널 리스트입니다.
         """
         # 채널이 존재하는지 검증
         channel = self.channel_selector.get_channel_by_user_and_id(user=user, channel_id=channel_id)
@@ -230,22 +303,44 @@ class ChannelService:
         if channel is None:
             raise NotFoundException(detail="Channel does not exist.", code="not_channel")
 
-        # 유저 채널이 존재하는지 검증
-        user_channels = self.user_channel_selector.get_user_channel_queryset_exec_mine_by_users_ids_and_user_and_channel_id(
-            user_ids=user_ids,
-            user=user,
-            channel_id=channel_id,
-        )
-
         # 채널 소유 유저인 경우 포인트 지급 금지 검증
-        if user_channels.filter(user=user).exists():
+        if user.id in user_ids:
             raise ValidationException("You can't give point to owner from channel.")
 
-        # 유저 채널이 존재하는지 검증
-        if user_channels.count() != len(user_ids):
-            raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
-
-        # F 객체를 사용하여 포인트를 지급합니다.
-        user_channels.update(point=F("point") + point)
+        with transaction.atomic(using=get_current_channel_shard_database()):
+            # 유저 채널이 존재하는지 검증 (잔액 변경을 막기 위해 잠금)
+            user_channels = list(
+                self.user_channel_selector.get_user_channel_queryset_for_update_with_user_by_user_ids_and_channel_id(
+                    user_ids=user_ids,
+                    channel_id=channel_id,
+                )
+            )
+
+            if len(user_channels) != len(user_ids):
+                raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
+
+            # 포인트 지급 내역 기록
+            PointLog.objects.bulk_create(
+                [
+                    PointLog(
+                        user_id=user_channel.user_id,
+                        channel_id=channel_id,
+                        actor=user,
+                        log_type=PointLogType.GRANT.value,
+                        point=point,
+                    )
+                    for user_channel in user_channels
+                ]
+            )
+
+            # F 객체를 사용하여 포인트를 지급합니다.
+            UserChannel.objects.filter(id__in=[user_channel.id for user_channel in user_channels]).update(point=F("point") + point)
+
+            # 채널 응답 캐시 무효화
+            self.channel_response_cache.bump_generation(channel_id=channel_id)
+
+        # 잠금으로 조회한 잔액에 지급한 포인트 반영
+        for user_channel in user_channels:
+            user_channel.point += point
 
         return user_channels
@@ -0,0 +1,323 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.db.models import Count
+from django.http import HttpRequest, HttpResponse
+
+from jurin.channels.models import ChannelShard, UserChannel
+from jurin.common.exception.exceptions import ServiceUnavailableException
+from jurin.users.models import User
+
+HOME_DATABASE = "default"
+CHANNEL_SCOPED_APP_LABELS = {"stocks", "items", "posts"}
+CHANNEL_SCOPED_MODEL_LABELS = {"channels.channel", "channels.userchannel", "channels.pointlog"}
+CHANNEL_SHARD_CACHE_KEY = "channels:shard:{channel_id}"
+
+# 현재 요청(또는 작업)의 채널 샤드 (database: 채널 데이터를 조회, 저장할 데이터베이스, is_migrating: 샤드 이동 중 여부)
+_shard_state: ContextVar[Optional[dict]] = ContextVar("shard_state", default=None)
+
+
+def get_channel_shard_databases() -> list[str]:
+    return settings.CHANNEL_SHARD_DATABASES
+
+
+def is_sharding_enabled() -> bool:
+    return len(settings.CHANNEL_SHARD_DATABASES) > 1
+
+
+def is_channel_scoped_model(model) -> bool:
+    return model._meta.app_label in CHANNEL_SCOPED_APP_LABELS or model._meta.label_lower in CHANNEL_SCOPED_MODEL_LABELS
+
+
+def get_current_channel_shard_database() -> str:
+    state = _shard_state.get()
+    return state["database"] if state is not None and state["database"] is not None else HOME_DATABASE
+
+
+def get_channel_shard(channel_id: Optional[int]) -> tuple[str, bool]:
+    """
+    이 함수는 채널 디렉토리에서 채널이 저장된 데이터베이스와 샤드 이동 중 여부를 조회합니다.
+    디렉토리는 캐시에 저장하며, 디렉토리에 없는 채널(샤딩 전 생성된 채널)과 채널이 없는 경우(None)는 홈 샤드에 있는 것으로 봅니다.
+
+    Args:
+        channel_id (Optional[int]): 채널 아이디입니다.
+    Returns:
+        tuple[str, bool]: 데이터베이스 별칭, 샤드 이동 중 여부입니다.
+    """
+    if not is_sharding_enabled() or channel_id is None:
+        return HOME_DATABASE, False
+
+    cache_key = CHANNEL_SHARD_CACHE_KEY.format(channel_id=channel_id)
+    channel_shard = cache.get(cache_key)
+
+    if channel_shard is None:
+        channel_shard = ChannelShard.objects.using(HOME_DATABASE).filter(id=channel_id).values_list("database", "is_migrating").first()
+        channel_shard = tuple(channel_shard) if channel_shard is not None else (HOME_DATABASE, False)
+        cache.set(cache_key, channel_shard, timeout=settings.CHANNEL_SHARD_CACHE_TIMEOUT)
+
+    return channel_shard
+
+
+def invalidate_channel_shard(channel_id: int):
+    cache.delete(CHANNEL_SHARD_CACHE_KEY.format(channel_id=channel_id))
+
+
+def get_channel_id_by_entry_code(entry_code: str) -> Optional[int]:
+    """
+    이 함수는 채널 디렉토리에서 참여 코드의 채널 아이디를 조회합니다. (참여 코드는 디렉토리에서 샤드 전체에 대해 중복되지 않도록 관리)
+    샤드 이동 중 여부도 함께 적용되도록, 조회한 채널 아이디로 use_channel 블록을 사용합니다.
+
+    Args:
+        entry_code (str): 참여 코드입니다.
+    Returns:
+        Optional[int]: 채널 아이디입니다. 샤딩을 사용하지 않거나 디렉토리에 없으면 None을 반환합니다. (홈 샤드)
+    """
+    if not is_sharding_enabled():
+        return None
+
+    return ChannelShard.objects.using(HOME_DATABASE).filter(entry_code=entry_code).values_list("id", flat=True).first()
+
+
+def find_user_channel_id(user_id: int) -> Optional[int]:
+    """
+    이 함수는 유저가 참여한 채널(선생님은 자신의 채널)의 아이디를 샤드에서 찾습니다.
+    유저는 하나의 채널에만 참여하므로 샤드마다 유저 채널을 조회하여 처음 찾은 채널 아이디를 반환합니다.
+    이동 후 원래 샤드에 남아 있는 채널 데이터는 무시하도록 디렉토리의 샤드와 같은 샤드의 채널만 반환합니다.
+
+    Args:
+        user_id (int): 유저 아이디입니다.
+    Returns:
+        Optional[int]: 채널 아이디입니다. 샤딩을 사용하지 않거나 참여한 채널이 없으면 None을 반환합니다. (홈 샤드)
+    """
+    if not is_sharding_enabled():
+        return None
+
+    for database in get_channel_shard_databases():
+        channel_ids = UserChannel.objects.using(database).filter(user_id=user_id).values_list("channel_id", flat=True)
+
+        for channel_id in channel_ids:
+            if get_channel_shard(channel_id=channel_id)[0] == database:
+                return channel_id
+
+    return None
+
+
+def check_channel_shard_auto_increment():
+    """
+    이 함수는 샤드의 자동 증가 값 범위가 겹치지 않는지 확인합니다. (채널 디렉토리 등록, 채널 이동 전에 확인)
+    샤드마다 아이디를 따로 할당하므로, 모든 샤드의 자동 증가 값 간격이 샤드 수 이상으로 같고 시작 값이 서로 달라야 채널 데이터를 옮길 수 있습니다.
+    SQLite는 자동 증가 값 범위를 설정할 수 없으므로 확인하지 않습니다. (채널 이동 시 아이디 충돌만 확인)
+    """
+    if not is_sharding_enabled():
+        return
+
+    auto_increments = {}
+
+    for database in get_channel_shard_databases():
+        connection = connections[database]
+
+        if connection.vendor != "mysql":
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT @@SESSION.auto_increment_increment, @@SESSION.auto_increment_offset")
+            auto_increments[database] = cursor.fetchone()
+
+    increments = {increment for increment, _ in auto_increments.values()}
+    offsets = [offset for _, offset in auto_increments.values()]
+
+    if len(increments) != 1 or increments.pop() < len(auto_increments) or len(set(offsets)) != len(offsets):
+        raise ImproperlyConfigured(
+            "Channel shards must use the same auto_increment_increment and distinct auto_increment_offset values. "
+            f"(increment, offset): {auto_increments}"
+        )
+
+
+def allocate_channel_shard(entry_code: str) -> ChannelShard:
+    """
+    이 함수는 새 채널을 저장할 데이터베이스를 정하고 채널 디렉토리에 등록합니다.
+    채널이 가장 적은 샤드를 선택하며, 디렉토리의 아이디를 채널 아이디로 사용하여 샤드 전체에서 채널 아이디가 중복되지 않도록 합니다.
+    샤딩을 사용하지 않으면 저장하지 않은 홈 샤드 디렉토리 객체(아이디 없음)를 반환합니다.
+
+    Args:
+        entry_code (str): 참여 코드입니다.
+    Returns:
+        ChannelShard: 채널 디렉토리 객체입니다.
+    """
+    if not is_sharding_enabled():
+        return ChannelShard(database=HOME_DATABASE, entry_code=entry_code)
+
+    channel_counts = dict(
+        ChannelShard.objects.using(HOME_DATABASE).values("database").annotate(count=Count("id")).values_list("database", "count")
+    )
+    database = min(get_channel_shard_databases(), key=lambda alias: channel_counts.get(alias, 0))
+
+    return ChannelShard.objects.using(HOME_DATABASE).create(database=database, entry_code=entry_code)
+
+
+def delete_channel_shard(channel_id: int):
+    if not is_sharding_enabled():
+        return
+
+    ChannelShard.objects.using(HOME_DATABASE).filter(id=channel_id).delete()
+    invalidate_channel_shard(channel_id=channel_id)
+
+
+def mirror_users(users: Iterable[User], database: str):
+    """
+    이 함수는 유저를 채널 샤드에 복사(있으면 갱신)합니다.
+    채널 데이터의 유저 외래 키와 유저 조인 조회를 위해 샤드에 유저 사본을 두며, 유저의 원본은 항상 홈 샤드에 있습니다.
+
+    Args:
+        users (Iterable[User]): 유저 객체 리스트입니다.
+        database (str): 채널 샤드의 데이터베이스 별칭입니다.
+    """
+    if database == HOME_DATABASE:
+        return
+
+    fields = User._meta.concrete_fields
+    copies = [User(**{field.attname: getattr(user, field.attname) for field in fields}) for user in users]
+
+    if copies:
+        User.objects.using(database).bulk_create(
+            copies,
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=[field.name for field in fields if not field.primary_key],
+        )
+
+
+@contextmanager
+def use_channel_shard(database: str, is_migrating: bool = False):
+    """
+    이 함수는 블록 안의 채널 데이터 조회, 저장을 주어진 샤드로 보내는 컨텍스트 매니저입니다.
+    요청 밖(Celery 작업, 관리 명령)에서 채널 데이터를 다룰 때 사용합니다.
+    """
+    token = _shard_state.set({"database": database, "is_migrating": is_migrating})
+
+    try:
+        yield
+
+    finally:
+        _shard_state.reset(token)
+
+
+@contextmanager
+def use_channel(channel_id: Optional[int]):
+    """
+    이 함수는 블록 안의 채널 데이터 조회, 저장을 채널이 저장된 샤드로 보내는 컨텍스트 매니저입니다.
+    채널이 샤드 이동 중이면 블록 안의 채널 데이터 저장을 막습니다. (채널 아이디가 None이면 홈 샤드)
+    """
+    database, is_migrating = get_channel_shard(channel_id=channel_id)
+
+    with use_channel_shard(database=database, is_migrating=is_migrating):
+        yield
+
+
+def activate_user_channel_shard(user_id: int):
+    """
+    이 함수는 경로에 채널 아이디가 없는 요청(프로필, 채널 조회, 채널 참여 등)에서 유저가 참여한 채널의 샤드를 사용하도록 설정합니다.
+    인증 후에 호출하며, 경로의 채널 아이디로 샤드가 이미 정해진 요청은 변경하지 않습니다.
+
+    Args:
+        user_id (int): 유저 아이디입니다.
+    """
+    state = _shard_state.get()
+
+    if not is_sharding_enabled() or state is None or state["database"] is not None:
+        return
+
+    # 샤드 이동 중인 채널의 쓰기를 막도록 이동 중 여부도 함께 설정
+    database, is_migrating = get_channel_shard(channel_id=find_user_channel_id(user_id=user_id))
+    state.update(database=database, is_migrating=is_migrating)
+
+
+class ChannelShardRouter:
+    """
+    이 클래스는 채널 데이터(채널, 유저 채널, 포인트 내역, 주식, 아이템, 게시글과 그 하위 데이터)를 채널이 저장된 샤드로 보내는 데이터베이스 라우터입니다.
+    샤드는 ChannelShardMiddleware(요청 경로의 채널 아이디), 인증(유저의 채널), use_channel/use_channel_shard 블록으로 정하고,
+    정해지지 않으면 홈 샤드를 사용합니다. 유저 등 전역 데이터는 None을 반환하여 다음 라우터(레플리카 라우터) 또는 홈 샤드로 보냅니다.
+    """
+
+    def _get_database(self, model, **hints) -> Optional[str]:
+        if not is_channel_scoped_model(model):
+            return None
+
+        # 이미 조회된 객체와 관계된 조회, 저장은 객체의 데이터베이스 사용
+        instance = hints.get("instance")
+
+        if instance is not None and instance._state.db is not None and is_channel_scoped_model(type(instance)):
+            return instance._state.db
+
+        return get_current_channel_shard_database()
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        return self._get_database(model, **hints)
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        database = self._get_database(model, **hints)
+        state = _shard_state.get()
+
+        # 샤드 이동 중인 채널은 읽기만 허용
+        if database is not None and state is not None and state["is_migrating"]:
+            raise ServiceUnavailableException("Channel is being migrated. Please try again later.")
+
+        return database
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> Optional[bool]:
+        # 채널 데이터를 옮길 수 있도록 모든 샤드의 스키마를 같게 유지
+        return True if db in get_channel_shard_databases() else None
+
+
+class ChannelShardMiddleware:
+    """
+    이 클래스는 요청 경로에 채널 아이디가 있으면 채널 디렉토리에서 채널의 샤드를 조회하여 요청의 채널 데이터 조회, 저장을 해당 샤드로 보내는 미들웨어입니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = _shard_state.set({"database": None, "is_migrating": False})
+
+        try:
+            return self.get_response(request)
+
+        finally:
+            _shard_state.reset(token)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        token = _shard_state.set({"database": None, "is_migrating": False})
+
+        try:
+            return await self.get_response(request)
+
+        finally:
+            _shard_state.reset(token)
+
+    def process_view(self, request: HttpRequest, view_func, view_args, view_kwargs):
+        channel_id = view_kwargs.get("channel_id")
+
+        if channel_id is not None:
+            database, is_migrating = get_channel_shard(channel_id=channel_id)
+            _shard_state.get().update(database=database, is_migrating=is_migrating)
+
+        return None
@@ -9,10 +9,15 @@ from jurin.channels.selectors.channels import ChannelSelector
 from jurin.channels.selectors.user_channels import UserChannelSelector
 from jurin.channels.services import ChannelService
 from jurin.common.base.serializers import BaseResponseSerializer, BaseSerializer
-from jurin.common.exception.exceptions import NotFoundException
+from jurin.common.exception.exceptions import (
+    InvalidParameterFormatException,
+    NotFoundException,
+)
+from jurin.common.pagination import decode_cursor, encode_cursor
 from jurin.common.permissions import TeacherPermission
 from jurin.common.response import create_response
 from jurin.common.utils import inline_serializer
+from jurin.users.services import UserService
 
 
 class TeacherChannelAPI(APIView):
@@ -115,6 +120,8 @@ class TeacherChanneManagementAPI(APIView):
 
     class FilterSerializer(BaseSerializer):
         nickname = serializers.CharField(required=False, max_length=8, default=None)
+        cursor = serializers.CharField(required=False, default=None)
+        limit = serializers.IntegerField(required=False, min_value=1, max_value=100, default=50)
 
     class OutputSerializer(BaseSerializer):
         count = serializers.IntegerField()
@@ -128,26 +135,33 @@ class TeacherChanneManagementAPI(APIView):
             },
         )
 
+    class ListOutputSerializer(OutputSerializer):
+        next_cursor = serializers.CharField(allow_null=True)
+
     @swagger_auto_schema(
         tags=["선생님-채널"],
         operation_summary="선생님 채널 관리 조회",
         query_serializer=FilterSerializer,
         responses={
-            status.HTTP_200_OK: BaseResponseSerializer(data_serializer=OutputSerializer),
+            status.HTTP_200_OK: BaseResponseSerializer(data_serializer=ListOutputSerializer),
         },
     )
     def get(self, request: Request, channel_id: int) -> Response:
         """
-        선생님 권한의 유저가 자신의 채널에 가입한 학생들을 조회합니다.
+        선생님 권한의 유저가 자신의 채널에 가입한 학생들을 닉네임 순으로 조회합니다.
+        닉네임은 앞부분 일치로 검색하며, 응답의 next_cursor를 cursor로 전달하면 다음 페이지를 조회합니다.
         url: /teachers/api/v1/channels/<int:channel_id>/management
 
         Args:
             channel_id (int): 채널 ID
             FilterSerializer:
-                student_nickname (str): 학생 닉네임
+                nickname (str): 학생 닉네임 (앞부분 일치)
+                cursor (str): 다음 페이지 커서
+                limit (int): 조회할 학생 수
         Returns:
-            OutputSerializer:
-                count (int): 조회된 유저 수
+            ListOutputSerializer:
+                count (int): 조회 조건에 해당하는 유저 수
+                next_cursor (str): 다음 페이지 커서 (마지막 페이지면 null)
                 users (list):
                     id (int): 유저 채널 ID
                     nickname (str): 유저 닉네임
@@ -156,6 +170,9 @@ class TeacherChanneManagementAPI(APIView):
         """
         filter_serializer = self.FilterSerializer(data=request.query_params)
         filter_serializer.is_valid(raise_exception=True)
+        nickname = filter_serializer.validated_data["nickname"]
+        cursor = filter_serializer.validated_data["cursor"]
+        limit = filter_serializer.validated_data["limit"]
 
         # 유저가 채널을 가지고 있는지 검증
         channel_selector = ChannelSelector()
@@ -164,17 +181,45 @@ class TeacherChanneManagementAPI(APIView):
         if channel is None:
             raise NotFoundException(detail="Channel does not exist.", code="not_channel")
 
-        # 채널에 가입한 유저 채널 조회
+        # 커서 검증
+        if cursor is not None:
+            cursor = decode_cursor(cursor)
+
+            if len(cursor) != 2 or not isinstance(cursor[0], str) or not isinstance(cursor[1], int):
+                raise InvalidParameterFormatException("Cursor is invalid.")
+
+        # 채널에 가입한 유저 채널 조회 (다음 페이지 존재 여부 확인을 위해 하나 더 조회)
         user_channel_selector = UserChannelSelector()
-        user_channels = user_channel_selector.get_user_channel_queryset_exec_mine_with_user_by_channel_id_and_nickname_and_user(
-            channel_id=channel_id,
-            user=request.user,
-            **filter_serializer.validated_data,
+        user_channels = list(
+            user_channel_selector.get_user_channel_queryset_exec_mine_with_user_by_channel_id_and_nickname_and_user(
+                channel_id=channel_id,
+                nickname=nickname,
+                user=request.user,
+                cursor=cursor,
+            )[: limit + 1]
         )
-        user_channel_data = self.OutputSerializer(
+
+        next_cursor = None
+
+        if len(user_channels) > limit:
+            user_channels = user_channels[:limit]
+            next_cursor = encode_cursor([user_channels[-1].nickname, user_channels[-1].id])
+
+        # 검색 조건이 없으면 채널의 학생 수를 사용하고, 있으면 인덱스로 개수 조회
+        if nickname is None:
+            count = channel.member_count
+        else:
+            count = user_channel_selector.get_user_channel_queryset_exec_mine_with_user_by_channel_id_and_nickname_and_user(
+                channel_id=channel_id,
+                nickname=nickname,
+                user=request.user,
+            ).count()
+
+        user_channel_data = self.ListOutputSerializer(
             {
                 "users": user_channels,
-                "count": user_channels.count(),
+                "count": count,
+                "next_cursor": next_cursor,
             }
         ).data
         return create_response(user_channel_data, status_code=status.HTTP_200_OK)
@@ -221,7 +266,7 @@ class TeacherChanneManagementAPI(APIView):
         user_channel_data = self.OutputSerializer(
             {
                 "users": user_channels,
-                "count": user_channels.count(),
+                "count": len(user_channels),
             }
         ).data
         return create_response(user_channel_data, status_code=status.HTTP_200_OK)
@@ -256,3 +301,71 @@ class TeacherChanneManagementAPI(APIView):
             **input_serializer.validated_data,
         )
         return create_response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+class TeacherChannelStudentAPI(APIView):
+    authentication_classes = (CustomJWTAuthentication,)
+    permission_classes = (TeacherPermission,)
+
+    class InputSerializer(BaseSerializer):
+        students = inline_serializer(
+            many=True,
+            required=True,
+            allow_empty=False,
+            max_length=300,
+            fields={
+                "username": serializers.CharField(required=True, max_length=32),
+                "nickname": serializers.CharField(required=True, max_length=8),
+                "password": serializers.CharField(required=True, max_length=128),
+            },
+        )
+
+    class OutputSerializer(BaseSerializer):
+        count = serializers.IntegerField()
+        users = inline_serializer(
+            many=True,
+            fields={
+                "id": serializers.IntegerField(),
+                "username": serializers.CharField(),
+                "nickname": serializers.CharField(),
+            },
+        )
+
+    @swagger_auto_schema(
+        tags=["선생님-채널"],
+        operation_summary="선생님 채널 학생 일괄 생성",
+        request_body=InputSerializer,
+        responses={
+            status.HTTP_201_CREATED: BaseResponseSerializer(data_serializer=OutputSerializer),
+        },
+    )
+    def post(self, request: Request, channel_id: int) -> Response:
+        """
+        선생님 권한의 유저가 학생 계정들을 한 번에 생성하고 자신의 채널에 가입시킵니다.
+        url: /teachers/api/v1/channels/<int:channel_id>/students
+
+        Args:
+            channel_id (int): 채널 ID
+            InputSerializer:
+                students (list):
+                    username (str): 아이디
+                    nickname (str): 닉네임
+                    password (str): 비밀번호
+        Returns:
+            OutputSerializer:
+                count (int): 생성된 학생 수
+                users (list):
+                    id (int): 유저 ID
+                    username (str): 아이디
+                    nickname (str): 닉네임
+        """
+        input_serializer = self.InputSerializer(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+        user_service = UserService()
+        users = user_service.bulk_create_students(
+            channel_id=channel_id,
+            user=request.user,
+            **input_serializer.validated_data,
+        )
+        user_data = self.OutputSerializer({"users": users, "count": len(users)}).data
+        return create_response(user_data, status_code=status.HTTP_201_CREATED)
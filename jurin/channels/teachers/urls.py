@@ -3,6 +3,7 @@ from django.urls import path
 from jurin.channels.teachers.apis import (
     TeacherChannelAPI,
     TeacherChannelDetailAPI,
+    TeacherChannelStudentAPI,
     TeacherChanneManagementAPI,
 )
 
@@ -10,4 +11,5 @@ urlpatterns = [
     path("", TeacherChannelAPI.as_view(), name="teacher_channel_list"),
     path("/<int:channel_id>", TeacherChannelDetailAPI.as_view(), name="teacher_channel_detail"),
     path("/<int:channel_id>/management", TeacherChanneManagementAPI.as_view(), name="teacher_channel_management"),
+    path("/<int:channel_id>/students", TeacherChannelStudentAPI.as_view(), name="teacher_channel_student"),
 ]
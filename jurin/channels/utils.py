@@ -0,0 +1,120 @@
+import hashlib
+import hmac
+import string
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+
+
+class EntryCodeAllocator:
+    """
+    이 클래스는 채널 참여 코드를 중복 없이 발급하는 클래스입니다.
+    증가하는 순번을 비밀 키로 섞은 치환(Feistel 암호)에 통과시켜 6자리 코드로 변환합니다.
+    치환은 일대일 대응이므로 순번이 겹치지 않는 한 코드도 겹치지 않으며, 코드에서 순번을 추측할 수 없습니다.
+    """
+
+    CHARACTERS = string.ascii_lowercase + string.digits
+    CODE_LENGTH = 6
+    CODE_SPACE = len(CHARACTERS) ** CODE_LENGTH
+    HALF_BITS = 16
+    HALF_MASK = (1 << HALF_BITS) - 1
+    ROUNDS = 4
+    SEQUENCE_CACHE_KEY = "channels:entry_code:sequence"
+
+    def __init__(self):
+        self.key = hashlib.sha256(f"entry_code:{settings.SECRET_KEY}".encode()).digest()
+
+    def _round_function(self, round_index: int, value: int) -> int:
+        """
+        이 내장 함수는 Feistel 암호의 라운드 함수입니다.
+
+        Args:
+            round_index (int): 라운드 순번입니다.
+            value (int): 16비트 입력 값입니다.
+        Returns:
+            int: 16비트 출력 값입니다.
+        """
+        digest = hmac.new(self.key, f"{round_index}:{value}".encode(), hashlib.sha256).digest()
+        return int.from_bytes(digest[:2], "big")
+
+    def _feistel(self, value: int) -> int:
+        """
+        이 내장 함수는 32비트 값을 같은 범위의 다른 값으로 일대일 치환합니다.
+
+        Args:
+            value (int): 32비트 입력 값입니다.
+        Returns:
+            int: 32비트 출력 값입니다.
+        """
+        left, right = value >> self.HALF_BITS, value & self.HALF_MASK
+
+        for round_index in range(self.ROUNDS):
+            left, right = right, left ^ self._round_function(round_index, right)
+
+        return (left << self.HALF_BITS) | right
+
+    def permute(self, sequence: int) -> int:
+        """
+        이 함수는 순번을 코드 공간 안의 값으로 일대일 치환합니다.
+        32비트 치환 결과가 코드 공간을 벗어나면 다시 치환하여(cycle walking) 코드 공간 안의 값을 얻습니다.
+
+        Args:
+            sequence (int): 코드 공간 안의 순번입니다.
+        Returns:
+            int: 코드 공간 안의 치환된 값입니다.
+        """
+        value = self._feistel(sequence)
+
+        while value >= self.CODE_SPACE:
+            value = self._feistel(value)
+
+        return value
+
+    def encode(self, value: int) -> str:
+        """
+        이 함수는 코드 공간 안의 값을 6자리 참여 코드 문자열로 변환합니다.
+
+        Args:
+            value (int): 코드 공간 안의 값입니다.
+        Returns:
+            str: 6자리 참여 코드입니다.
+        """
+        characters = []
+
+        for _ in range(self.CODE_LENGTH):
+            value, index = divmod(value, len(self.CHARACTERS))
+            characters.append(self.CHARACTERS[index])
+
+        return "".join(reversed(characters))
+
+    def next_sequence(self, step: int = 1) -> int:
+        """
+        이 함수는 캐시의 원자적 증가 연산으로 다음 순번을 발급합니다.
+        캐시에 순번이 없으면 채널의 최대 아이디로 초기화합니다.
+        (캐시가 초기화된 경우 실패한 발급도 순번을 사용했으므로 이미 발급된 순번과 겹칠 수 있으며,
+        참여 코드의 유니크 인덱스가 최종 검증을 맡고 호출하는 쪽은 step을 늘려 재시도합니다.)
+
+        Args:
+            step (int): 순번을 증가시킬 크기입니다. 겹친 순번을 건너뛸 때 1보다 크게 사용합니다.
+        Returns:
+            int: 다음 순번입니다.
+        """
+        from jurin.channels.models import Channel
+
+        if cache.get(self.SEQUENCE_CACHE_KEY) is None:
+            max_channel_id = Channel.objects.aggregate(max_id=Max("id"))["max_id"] or 0
+            cache.add(self.SEQUENCE_CACHE_KEY, max_channel_id, timeout=None)
+
+        return cache.incr(self.SEQUENCE_CACHE_KEY, step)
+
+    def allocate(self, step: int = 1) -> str:
+        """
+        이 함수는 다음 순번으로 새로운 참여 코드를 발급합니다.
+
+        Args:
+            step (int): 순번을 증가시킬 크기입니다.
+        Returns:
+            str: 6자리 참여 코드입니다.
+        """
+        return self.encode(self.permute(self.next_sequence(step=step) % self.CODE_SPACE))
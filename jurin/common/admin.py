@@ -0,0 +1,12 @@
+from django.contrib import admin
+
+from jurin.common.models import SlowQuery
+
+
+@admin.register(SlowQuery)
+class SlowQueryAdmin(admin.ModelAdmin):
+    list_display = ("id", "source", "view", "calls", "total_duration", "max_duration", "last_seen_at")
+    list_filter = ("view",)
+    search_fields = ("fingerprint", "source", "view")
+    ordering = ("-total_duration",)
+    readonly_fields = [field.name for field in SlowQuery._meta.fields]
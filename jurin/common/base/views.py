@@ -0,0 +1,138 @@
+import asyncio
+from typing import Callable
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest
+from rest_framework import exceptions
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    기본 비동기 APIView 클래스입니다.
+    DRF(3.14)의 APIView는 동기 핸들러만 지원하므로, dispatch를 비동기로 구현하여 async def로 작성한 핸들러(get)를 ASGI 서버의 이벤트 루프에서 실행합니다.
+    핸들러가 데이터베이스와 캐시를 기다리는 동안 워커가 다른 요청을 처리하므로, 폴링이 많은 조회 API를 적은 워커로 처리할 수 있습니다.
+
+    인증과 권한은 aauthenticate, ahas_permission 비동기 메소드가 있으면 사용하고, 없으면 동기 메소드를 스레드에서 실행합니다.
+    동기 핸들러(post 등 쓰기 API)는 인증부터 핸들러까지 스레드에서 실행하므로, 같은 뷰에 동기 핸들러와 비동기 핸들러를 함께 둘 수 있습니다.
+    WSGI 서버에서도 동작하지만(요청마다 이벤트 루프를 생성) 이득이 없으므로 ASGI 서버(config.asgi)에서 사용합니다.
+    """
+
+    view_is_async = True
+
+    async def dispatch(self, request: HttpRequest, *args, **kwargs) -> Response:
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if asyncio.iscoroutinefunction(handler):
+                await self.ainitial(request, *args, **kwargs)
+                response = await handler(request, *args, **kwargs)
+
+            else:
+                response = await sync_to_async(self._handle_sync)(handler, request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    def _handle_sync(self, handler, request: Request, *args, **kwargs) -> Response:
+        self.initial(request, *args, **kwargs)
+        return handler(request, *args, **kwargs)
+
+    async def ainitial(self, request: Request, *args, **kwargs):
+        """
+        이 함수는 APIView의 initial 함수의 비동기 버전으로, 핸들러를 실행하기 전에 인증, 권한, 요청 제한을 확인합니다.
+
+        Args:
+            request (Request): Request 객체입니다.
+        """
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+
+        neg = self.perform_content_negotiation(request)
+        request.accepted_renderer, request.accepted_media_type = neg
+
+        version, scheme = self.determine_version(request, *args, **kwargs)
+        request.version, request.versioning_scheme = version, scheme
+
+        await self.aperform_authentication(request)
+        await self.acheck_permissions(request)
+
+        # 요청 제한은 캐시를 사용하므로 있는 경우에만 스레드에서 확인
+        if self.get_throttles():
+            await sync_to_async(self.check_throttles)(request)
+
+    async def aperform_authentication(self, request: Request):
+        """
+        이 함수는 Request의 인증(_authenticate)을 비동기로 처리하고, 결과를 request.user, request.auth에 설정합니다.
+
+        Args:
+            request (Request): Request 객체입니다.
+        """
+        for authenticator in request.authenticators:
+            try:
+                if hasattr(authenticator, "aauthenticate"):
+                    user_auth_tuple = await authenticator.aauthenticate(request)
+                else:
+                    user_auth_tuple = await sync_to_async(authenticator.authenticate)(request)
+
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+
+        request._not_authenticated()
+
+    async def acheck_permissions(self, request: Request):
+        """
+        이 함수는 APIView의 check_permissions 함수의 비동기 버전입니다.
+
+        Args:
+            request (Request): Request 객체입니다.
+        """
+        for permission in self.get_permissions():
+            if hasattr(permission, "ahas_permission"):
+                has_permission = await permission.ahas_permission(request, self)
+            else:
+                has_permission = await sync_to_async(permission.has_permission)(request, self)
+
+            if not has_permission:
+                self.permission_denied(
+                    request,
+                    message=getattr(permission, "message", None),
+                    code=getattr(permission, "code", None),
+                )
+
+
+def use_swagger_schema_of(view_method: Callable) -> Callable:
+    """
+    이 함수는 동기 뷰 메소드에 적용한 swagger 스키마(swagger_auto_schema)를 비동기 버전의 뷰 메소드에 그대로 적용하는 데코레이터입니다.
+    동기 뷰를 상속한 비동기 뷰(AsyncAPIView)에서 같은 스키마를 다시 작성하지 않도록 사용합니다.
+
+    Args:
+        view_method (Callable): swagger_auto_schema를 적용한 동기 뷰 메소드입니다.
+    Returns:
+        Callable: 데코레이터입니다.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func._swagger_auto_schema = view_method._swagger_auto_schema
+        return func
+
+    return decorator
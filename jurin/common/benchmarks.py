@@ -0,0 +1,88 @@
+import re
+from datetime import date
+from typing import Iterator, Optional
+
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework import serializers
+from rest_framework.views import APIView
+
+PATH_PARAM_RE = re.compile(r"<(?:\w+:)?(\w+)>")
+
+
+def get_api_endpoints(url_patterns: Optional[list] = None, prefix: str = "") -> Iterator[tuple[str, type[APIView]]]:
+    """
+    이 함수는 URL 설정을 따라가며 APIView로 등록된 모든 API의 경로 템플릿과 API 클래스를 반환합니다.
+
+    Args:
+        url_patterns (Optional[list]): URL 패턴 리스트입니다. 없으면 ROOT_URLCONF를 사용합니다.
+        prefix (str): 상위 URL 경로입니다.
+    Returns:
+        Iterator[tuple[str, type[APIView]]]: (경로 템플릿, API 클래스)입니다. (예: /students/api/v1/channels/<int:channel_id>/stocks)
+    """
+    if url_patterns is None:
+        url_patterns = get_resolver().url_patterns
+
+    for url_pattern in url_patterns:
+        route = prefix + str(url_pattern.pattern)
+
+        if isinstance(url_pattern, URLResolver):
+            yield from get_api_endpoints(url_patterns=url_pattern.url_patterns, prefix=route)
+
+        elif isinstance(url_pattern, URLPattern):
+            view_class = getattr(url_pattern.callback, "view_class", None)
+
+            if view_class is not None and issubclass(view_class, APIView):
+                yield "/" + route.lstrip("^").rstrip("$").lstrip("/"), view_class
+
+
+def build_api_path(path_template: str, path_params: dict) -> Optional[str]:
+    """
+    이 함수는 경로 템플릿의 경로 변수를 값으로 바꾸어 실제 경로를 만듭니다.
+
+    Args:
+        path_template (str): 경로 템플릿입니다.
+        path_params (dict): 경로 변수 이름과 값입니다.
+    Returns:
+        str | None: 실제 경로입니다. 값이 없는 경로 변수가 있으면 None을 반환합니다.
+    """
+    if any(name not in path_params for name in PATH_PARAM_RE.findall(path_template)):
+        return None
+
+    return PATH_PARAM_RE.sub(lambda match: str(path_params[match.group(1)]), path_template)
+
+
+def parse_key_value_options(options: Optional[list[str]]) -> dict:
+    """
+    이 함수는 key=value 형식의 커맨드 옵션 리스트를 딕셔너리로 변환합니다.
+
+    Args:
+        options (Optional[list[str]]): key=value 문자열 리스트입니다.
+    Returns:
+        dict: 변환된 딕셔너리입니다.
+    """
+    return dict(option.split("=", 1) for option in options or [])
+
+
+def get_default_query_params(view_class: type[APIView]) -> dict:
+    """
+    이 함수는 API를 호출하는 데 필요한 기본 쿼리 파라미터를 만듭니다.
+    목록 API는 최대 조회 개수를, 필수 날짜 필터는 넓은 조회 기간을 사용합니다.
+
+    Args:
+        view_class (type[APIView]): API 클래스입니다.
+    Returns:
+        dict: 쿼리 파라미터입니다.
+    """
+    query_params = {}
+    pagination_class = getattr(view_class, "Pagination", None)
+    filter_serializer_class = getattr(view_class, "FilterSerializer", None)
+
+    if pagination_class is not None:
+        query_params["limit"] = pagination_class.max_limit
+
+    if filter_serializer_class is not None:
+        for field_name, field in filter_serializer_class().fields.items():
+            if field.required and isinstance(field, serializers.DateField):
+                query_params[field_name] = "2000-01-01" if "start" in field_name else date.today().isoformat()
+
+    return query_params
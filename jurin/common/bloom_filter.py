@@ -0,0 +1,128 @@
+import hashlib
+import math
+from typing import Iterable, Optional
+
+from django_redis import get_redis_connection
+
+from config.django.base import logger
+
+
+class RedisBloomFilter:
+    """
+    이 클래스는 Redis의 비트맵에 저장하는 블룸 필터입니다.
+    값이 없다는 응답은 항상 정확하며, 값이 있다는 응답은 오탐률(error_rate)만큼 틀릴 수 있습니다.
+    필터가 아직 만들어지지 않았거나 Redis를 사용할 수 없으면 None을 반환하여 호출하는 쪽에서 데이터베이스를 조회하도록 합니다.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, key: str, capacity: int, error_rate: float):
+        self.key = key
+        self.bit_size = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_size / capacity * math.log(2)))
+
+    def _get_offsets(self, value: str) -> list[int]:
+        """
+        이 내장 함수는 값의 비트 위치 리스트를 구합니다. (두 개의 해시로 k개의 해시를 만드는 double hashing)
+        """
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first_hash = int.from_bytes(digest[:8], "big")
+        second_hash = int.from_bytes(digest[8:], "big") | 1
+        return [(first_hash + i * second_hash) % self.bit_size for i in range(self.hash_count)]
+
+    def _add_to_key(self, key: str, values: Iterable[str]) -> int:
+        """
+        이 내장 함수는 값들을 지정한 키의 필터에 추가합니다.
+
+        Returns:
+            int: 추가한 값의 개수입니다.
+        """
+        redis_connection = get_redis_connection("default")
+        pipeline = redis_connection.pipeline(transaction=False)
+        count = 0
+
+        for value in values:
+            for offset in self._get_offsets(value):
+                pipeline.setbit(key, offset, 1)
+
+            count += 1
+
+            if count % self.BATCH_SIZE == 0:
+                pipeline.execute()
+
+        pipeline.execute()
+        return count
+
+    def add(self, values: Iterable[str]):
+        """
+        이 함수는 값들을 필터에 추가합니다. 필터가 아직 만들어지지 않았으면 추가하지 않습니다.
+
+        Args:
+            values (Iterable[str]): 추가할 값들입니다.
+        """
+        try:
+            redis_connection = get_redis_connection("default")
+
+            if redis_connection.exists(self.key) == 0:
+                return
+
+            self._add_to_key(key=self.key, values=values)
+
+        except NotImplementedError:
+            return
+
+        except Exception as e:
+            logger.warning(f"Bloom filter {self.key} is unavailable. {e}")
+
+    def might_contain(self, value: str) -> Optional[bool]:
+        """
+        이 함수는 값이 필터에 있는지 조회합니다.
+
+        Args:
+            value (str): 조회할 값입니다.
+        Returns:
+            bool | None: 값이 없으면 False, 있을 수 있으면 True를 반환합니다.
+                         필터를 사용할 수 없으면 None을 반환합니다.
+        """
+        try:
+            redis_connection = get_redis_connection("default")
+            pipeline = redis_connection.pipeline(transaction=False)
+            pipeline.exists(self.key)
+
+            for offset in self._get_offsets(value):
+                pipeline.getbit(self.key, offset)
+
+            is_exists, *bits = pipeline.execute()
+
+        except NotImplementedError:
+            return None
+
+        except Exception as e:
+            logger.warning(f"Bloom filter {self.key} is unavailable. {e}")
+            return None
+
+        if is_exists == 0:
+            return None
+
+        return all(bits)
+
+    def rebuild(self, values: Iterable[str]) -> int:
+        """
+        이 함수는 임시 키에 필터를 새로 만든 후 기존 필터와 교체합니다.
+        교체는 RENAME으로 한 번에 이루어지므로 만드는 동안에도 기존 필터로 조회할 수 있습니다.
+
+        Args:
+            values (Iterable[str]): 필터에 넣을 모든 값들입니다.
+        Returns:
+            int: 필터에 넣은 값의 개수입니다.
+        """
+        redis_connection = get_redis_connection("default")
+        temp_key = f"{self.key}:rebuild"
+
+        redis_connection.delete(temp_key)
+        # 값이 없어도 필터가 만들어지도록 마지막 비트를 미리 할당
+        redis_connection.setbit(temp_key, self.bit_size - 1, 0)
+        count = self._add_to_key(key=temp_key, values=values)
+        redis_connection.rename(temp_key, self.key)
+
+        return count
@@ -0,0 +1,122 @@
+from collections.abc import Mapping
+from typing import Callable, Type
+
+from django.db.models.manager import BaseManager
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+_compiled_serializers: dict[Type[serializers.Serializer], Callable] = {}
+
+
+def _make_attribute_getter(field: serializers.Field) -> Callable:
+    """
+    이 내장 함수는 필드의 source를 따라가 값을 조회하는 함수를 생성합니다.
+    일반적인 속성 조회는 바로 처리하고, 호출 가능한 값이나 예외가 발생하면 DRF의 get_attribute로 다시 조회하여
+    기본값, allow_null, 메소드 호출 등의 동작을 DRF와 같게 유지합니다.
+    """
+    if field.source == "*":
+        return lambda instance: instance
+
+    source_attrs = tuple(field.source_attrs)
+    fallback = field.get_attribute
+
+    def get_attribute(instance):
+        value = instance
+
+        try:
+            for attr in source_attrs:
+                value = value[attr] if isinstance(value, Mapping) else getattr(value, attr)
+
+                if callable(value):
+                    return fallback(instance)
+
+        except Exception:
+            return fallback(instance)
+
+        return value
+
+    return get_attribute
+
+
+def _make_representation(field: serializers.Field) -> Callable:
+    """
+    이 내장 함수는 필드의 값을 응답 값으로 변환하는 함수를 생성합니다.
+    중첩된 시리얼라이저는 다시 컴파일하여 사용합니다.
+    """
+    if isinstance(field, serializers.ListSerializer) and isinstance(field.child, serializers.Serializer):
+        child_representation = _compile(field.child)
+
+        def to_representation(data):
+            iterable = data.all() if isinstance(data, BaseManager) else data
+            return [child_representation(item) for item in iterable]
+
+        return to_representation
+
+    if isinstance(field, serializers.Serializer):
+        return _compile(field)
+
+    if isinstance(field, serializers.SerializerMethodField):
+        return getattr(field.parent, field.method_name)
+
+    return field.to_representation
+
+
+def _compile(serializer: serializers.Serializer) -> Callable:
+    """
+    이 내장 함수는 시리얼라이저 객체의 읽기 필드를 (필드 이름, 값 조회 함수, 응답 값 변환 함수) 리스트로 만들고,
+    객체 하나를 응답 딕셔너리로 변환하는 함수를 반환합니다.
+    """
+    plan = [
+        (field.field_name, _make_attribute_getter(field), _make_representation(field))
+        for field in serializer.fields.values()
+        if not field.write_only
+    ]
+
+    def to_representation(instance) -> dict:
+        ret = {}
+
+        for field_name, get_attribute, field_to_representation in plan:
+            try:
+                attribute = get_attribute(instance)
+
+            except SkipField:
+                continue
+
+            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+
+            if check_for_none is None:
+                ret[field_name] = None
+
+            else:
+                ret[field_name] = field_to_representation(attribute)
+
+        return ret
+
+    return to_representation
+
+
+def compile_serializer(serializer_class: Type[serializers.Serializer]) -> Callable:
+    """
+    이 함수는 읽기 전용으로 사용하는 시리얼라이저 클래스를 객체 리스트를 응답 리스트로 변환하는 함수로 컴파일합니다.
+    DRF는 객체마다 필드 객체의 여러 메소드를 거쳐 값을 조회하지만, 컴파일된 함수는 필드마다 미리 만든 조회 함수와 변환 함수만 호출합니다.
+    결과는 serializer_class(instances, many=True).data와 같으며, 시리얼라이저 선언과 Swagger 문서는 그대로 사용합니다.
+    context를 사용하지 않는 출력 시리얼라이저에만 사용합니다.
+
+    Args:
+        serializer_class (Type[Serializer]): 시리얼라이저 클래스입니다.
+    Returns:
+        Callable: 객체 리스트를 받아 응답 딕셔너리 리스트를 반환하는 함수입니다.
+    """
+    compiled_serializer = _compiled_serializers.get(serializer_class)
+
+    if compiled_serializer is None:
+        to_representation = _compile(serializer_class())
+
+        def compiled_serializer(instances) -> list[dict]:
+            iterable = instances.all() if isinstance(instances, BaseManager) else instances
+            return [to_representation(instance) for instance in iterable]
+
+        _compiled_serializers[serializer_class] = compiled_serializer
+
+    return compiled_serializer
@@ -0,0 +1,190 @@
+import hashlib
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+
+from config.django.base import logger
+
+PRIMARY_DATABASE = "default"
+REPLICA_DATABASE_PREFIX = "replica"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# 현재 요청(또는 작업)의 읽기 라우팅 상태
+# (replica: 레플리카 사용 여부, stick_on_write: 쓰기 후 프라이머리 고정 여부, wrote: 쓰기 여부, database: 요청에서 처음 고른 레플리카)
+_routing_state: ContextVar[Optional[dict]] = ContextVar("routing_state", default=None)
+
+
+def _get_replica_databases() -> list[str]:
+    return [alias for alias in settings.DATABASES if alias.startswith(REPLICA_DATABASE_PREFIX)]
+
+
+@contextmanager
+def use_replica():
+    """
+    이 함수는 블록 안의 읽기 쿼리를 레플리카로 보내는 컨텍스트 매니저입니다. (@use_replica()로 데코레이터로도 사용 가능)
+    요청 밖에서 실행되는 집계 작업처럼 복제 지연이 허용되는 읽기에 사용합니다. 쓰기는 항상 프라이머리로 보냅니다.
+    """
+    token = _routing_state.set({"replica": True, "stick_on_write": False, "wrote": False})
+
+    try:
+        yield
+
+    finally:
+        _routing_state.reset(token)
+
+
+@contextmanager
+def use_primary():
+    """
+    이 함수는 블록 안의 읽기 쿼리를 프라이머리로 보내는 컨텍스트 매니저입니다. (@use_primary()로 데코레이터로도 사용 가능)
+    GET 요청 안에서도 방금 쓴 데이터를 읽어야 하는 경우에 사용합니다.
+    """
+    token = _routing_state.set({"replica": False, "stick_on_write": False, "wrote": False})
+
+    try:
+        yield
+
+    finally:
+        _routing_state.reset(token)
+
+
+class ReplicaRouter:
+    """
+    이 클래스는 읽기 쿼리를 레플리카로, 쓰기 쿼리를 프라이머리로 보내는 데이터베이스 라우터입니다.
+    레플리카는 ReplicaRoutingMiddleware가 설정한 GET 요청이나 use_replica 블록 안에서만 사용하고, 그 외(서비스의 쓰기 요청, Celery 작업)는 프라이머리를 사용합니다.
+    select_for_update, get_or_create 등 쓰기를 위한 조회는 Django가 db_for_write로 라우팅하므로 항상 프라이머리를 사용합니다.
+    """
+
+    def db_for_read(self, model, **hints) -> str:
+        state = _routing_state.get()
+
+        if state is None or state["replica"] is False:
+            return PRIMARY_DATABASE
+
+        # 레플리카는 요청(또는 use_replica 블록)마다 한 번만 골라, 한 요청의 쿼리(개수 조회와 목록 조회 등)가 같은 시점의 데이터를 읽도록 함
+        database = state.get("database")
+
+        if database is None:
+            replica_databases = _get_replica_databases()
+            database = state["database"] = random.choice(replica_databases) if replica_databases else PRIMARY_DATABASE
+
+        return database
+
+    def db_for_write(self, model, **hints) -> str:
+        state = _routing_state.get()
+
+        # 요청 중 쓰기가 발생하면 요청이 끝날 때까지 읽기도 프라이머리에서 (read-your-writes)
+        if state is not None:
+            state["wrote"] = True
+
+            if state["stick_on_write"]:
+                state["replica"] = False
+
+        return PRIMARY_DATABASE
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        # 레플리카는 프라이머리와 같은 데이터이므로 모든 관계를 허용
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> bool:
+        return db == PRIMARY_DATABASE
+
+
+class ReplicaRoutingMiddleware:
+    """
+    이 클래스는 GET 요청의 읽기 쿼리를 레플리카로 보내고, 쓰기가 있었던 요청 후 REPLICA_STICKY_SECONDS초 동안
+    같은 Authorization 헤더의 요청은 프라이머리에서 읽도록 하는 미들웨어입니다. (쓰기 직후 레플리카 지연으로 이전 데이터가 보이지 않도록)
+    인증은 DRF 뷰에서 하므로 유저 대신 Authorization 헤더의 해시를 키로 사용합니다.
+    ASGI 서버에서 비동기 뷰가 스레드를 거치지 않도록 비동기로도 동작합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _get_sticky_key(self, request: HttpRequest) -> Optional[str]:
+        authorization = request.headers.get("Authorization")
+
+        if not authorization:
+            return None
+
+        return f"db_router:sticky:{hashlib.sha256(authorization.encode()).hexdigest()[:32]}"
+
+    def _is_sticky(self, sticky_key: Optional[str]) -> bool:
+        if sticky_key is None:
+            return False
+
+        try:
+            return cache.get(sticky_key) is not None
+
+        except Exception as e:
+            # 캐시를 사용할 수 없으면 안전하게 프라이머리 사용
+            logger.warning(f"Failed to check replica stickiness. {e}")
+            return True
+
+    async def _ais_sticky(self, sticky_key: Optional[str]) -> bool:
+        if sticky_key is None:
+            return False
+
+        try:
+            return await cache.aget(sticky_key) is not None
+
+        except Exception as e:
+            logger.warning(f"Failed to check replica stickiness. {e}")
+            return True
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        sticky_key = self._get_sticky_key(request)
+        use_replica_database = request.method in SAFE_METHODS and not self._is_sticky(sticky_key)
+        state = {"replica": use_replica_database, "stick_on_write": True, "wrote": False}
+        token = _routing_state.set(state)
+
+        try:
+            response = self.get_response(request)
+
+        finally:
+            _routing_state.reset(token)
+
+        if sticky_key is not None and state["wrote"] and response.status_code < 400:
+            try:
+                cache.set(sticky_key, 1, timeout=settings.REPLICA_STICKY_SECONDS)
+
+            except Exception as e:
+                logger.warning(f"Failed to set replica stickiness. {e}")
+
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        sticky_key = self._get_sticky_key(request)
+        use_replica_database = request.method in SAFE_METHODS and not await self._ais_sticky(sticky_key)
+        state = {"replica": use_replica_database, "stick_on_write": True, "wrote": False}
+        token = _routing_state.set(state)
+
+        try:
+            response = await self.get_response(request)
+
+        finally:
+            _routing_state.reset(token)
+
+        if sticky_key is not None and state["wrote"] and response.status_code < 400:
+            try:
+                await cache.aset(sticky_key, 1, timeout=settings.REPLICA_STICKY_SECONDS)
+
+            except Exception as e:
+                logger.warning(f"Failed to set replica stickiness. {e}")
+
+        return response
@@ -49,3 +49,15 @@ class TaskFailedException(BaseAPIException):
     status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
     default_detail = "Task failed."
     default_code = "task_failed"
+
+
+class TooManyRequestsException(BaseAPIException):
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    default_detail = "Too many requests."
+    default_code = "too_many_requests"
+
+
+class ServiceUnavailableException(BaseAPIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Service is temporarily unavailable."
+    default_code = "service_unavailable"
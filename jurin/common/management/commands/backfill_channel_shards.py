@@ -0,0 +1,58 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+
+from jurin.channels.models import Channel, ChannelShard
+from jurin.channels.sharding import (
+    HOME_DATABASE,
+    check_channel_shard_auto_increment,
+    get_channel_shard_databases,
+)
+
+
+class Command(BaseCommand):
+    help = "채널 디렉토리에 없는 채널(샤딩 전 생성된 채널)을 채널이 저장된 샤드로 디렉토리에 등록합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 등록할 채널 수")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        total_count = 0
+
+        # 샤드의 아이디 범위가 겹치면 채널을 옮길 수 없으므로 등록 전에 확인
+        try:
+            check_channel_shard_auto_increment()
+
+        except ImproperlyConfigured as e:
+            raise CommandError(e)
+
+        for database in get_channel_shard_databases():
+            last_id = 0
+
+            while True:
+                channels = list(
+                    Channel.objects.using(database).filter(id__gt=last_id).order_by("id").values_list("id", "entry_code")[:batch_size]
+                )
+
+                if not channels:
+                    break
+
+                last_id = channels[-1][0]
+                registered_ids = set(
+                    ChannelShard.objects.using(HOME_DATABASE)
+                    .filter(id__in=[channel_id for channel_id, _ in channels])
+                    .values_list("id", flat=True)
+                )
+                channel_shards = [
+                    ChannelShard(id=channel_id, database=database, entry_code=entry_code)
+                    for channel_id, entry_code in channels
+                    if channel_id not in registered_ids
+                ]
+
+                # 채널 아이디를 디렉토리 아이디로 사용하므로 이후 생성되는 채널의 아이디는 등록된 채널 다음부터 할당
+                ChannelShard.objects.using(HOME_DATABASE).bulk_create(channel_shards)
+                total_count += len(channel_shards)
+
+            self.stdout.write(f"{database}: scanned channels up to id {last_id}")
+
+        self.stdout.write(self.style.SUCCESS(f"Registered {total_count} channels in the channel directory."))
@@ -0,0 +1,181 @@
+import json
+import statistics
+import time
+from contextlib import ExitStack
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from rest_framework.test import APIClient
+
+from jurin.authentication.jwt_claim_serializer import CustomTokenObtainPairSerializer
+from jurin.channels.models import Channel
+from jurin.common.benchmarks import (
+    build_api_path,
+    get_api_endpoints,
+    get_default_query_params,
+    parse_key_value_options,
+)
+from jurin.items.models import Item, UserItem
+from jurin.posts.models import Post
+from jurin.stocks.models import Stock
+from jurin.users.models import User
+
+
+class Command(BaseCommand):
+    help = "모든 학생, 선생님 GET API를 호출하여 p50/p95 응답 시간, 쿼리 수, 응답 크기를 측정하고 기준 결과와 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--teacher", required=True, help="선생님 API를 호출할 선생님 유저 아이디")
+        parser.add_argument("--student", required=True, help="학생 API를 호출할 학생 유저 아이디 (선생님 채널의 학생)")
+        parser.add_argument("--param", action="append", help="경로 변수 (예: stock_id=1, 여러 번 입력 가능)")
+        parser.add_argument("--iterations", type=int, default=30, help="API당 측정 횟수")
+        parser.add_argument("--warmup", type=int, default=3, help="API당 측정 전 호출 횟수")
+        parser.add_argument("--baseline", help="비교할 기준 결과 JSON 파일 경로")
+        parser.add_argument("--save", help="측정 결과를 저장할 JSON 파일 경로")
+        parser.add_argument("--threshold", type=float, default=0.2, help="p95가 기준보다 이 비율 이상 느려지면 회귀로 표시")
+        parser.add_argument("--fail-on-regression", action="store_true", help="회귀가 있으면 실패 코드로 종료")
+
+    def _get_path_params(self, teacher: User, student: User) -> tuple[dict, dict]:
+        """
+        이 내장 함수는 선생님 채널의 데이터로 경로 변수를 만듭니다.
+        학생의 보유 아이템 경로(/items/mine/<item_id>)는 학생이 보유한 아이템을 사용합니다.
+        """
+        channel = Channel.objects.filter(user=teacher, is_pending_deleted=False).order_by("id").first()
+
+        if channel is None:
+            raise CommandError("Teacher has no channel.")
+
+        path_params = {"channel_id": channel.id}
+        first_ids = {
+            "stock_id": Stock.objects.filter(channel=channel).order_by("id").values_list("id", flat=True).first(),
+            "item_id": Item.objects.filter(channel=channel, is_deleted=False).order_by("id").values_list("id", flat=True).first(),
+            "post_id": Post.objects.filter(channel=channel).order_by("id").values_list("id", flat=True).first(),
+        }
+        path_params.update({name: value for name, value in first_ids.items() if value is not None})
+
+        user_item_id = UserItem.objects.filter(user=student, item__channel=channel).order_by("id").values_list("item_id", flat=True).first()
+        mine_path_params = {**path_params, "item_id": user_item_id} if user_item_id is not None else path_params
+
+        return path_params, mine_path_params
+
+    def _measure(self, client: APIClient, path: str, query: dict, iterations: int, warmup: int) -> dict:
+        """
+        이 내장 함수는 API를 여러 번 호출하여 응답 시간, 쿼리 수, 응답 크기를 측정합니다.
+        쿼리 수는 레플리카와 채널 샤드를 포함한 모든 데이터베이스 연결의 쿼리를 셉니다.
+        """
+        for _ in range(warmup):
+            client.get(path, query)
+
+        latencies, query_counts = [], []
+        status_code, response_size = None, 0
+        query_stats = {"count": 0}
+
+        def count_query(execute, sql, params, many, context):
+            query_stats["count"] += 1
+            return execute(sql, params, many, context)
+
+        for _ in range(iterations):
+            query_stats["count"] = 0
+
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(count_query))
+
+                started_at = time.perf_counter()
+                response = client.get(path, query)
+                latencies.append((time.perf_counter() - started_at) * 1000)
+
+            query_counts.append(query_stats["count"])
+            status_code, response_size = response.status_code, len(response.content)
+
+        latencies.sort()
+
+        return {
+            "status": status_code,
+            "p50_ms": round(statistics.median(latencies), 3),
+            "p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3),
+            "queries": max(query_counts),
+            "bytes": response_size,
+        }
+
+    def _format_delta(self, value: float, baseline_value: float) -> str:
+        if not baseline_value:
+            return ""
+
+        return f"({(value - baseline_value) / baseline_value * 100:+.0f}%)"
+
+    def handle(self, *args, **options):
+        teacher = User.objects.filter(username=options["teacher"]).first()
+        student = User.objects.filter(username=options["student"]).first()
+
+        if teacher is None or student is None:
+            raise CommandError("User does not exist.")
+
+        if options["iterations"] <= 0:
+            raise CommandError("iterations must be positive.")
+
+        path_params, mine_path_params = self._get_path_params(teacher=teacher, student=student)
+        extra_path_params = parse_key_value_options(options["param"])
+        clients = {}
+
+        for prefix, user in [("/teachers/", teacher), ("/students/", student)]:
+            clients[prefix] = APIClient()
+            access_token = CustomTokenObtainPairSerializer.get_token(user).access_token
+            clients[prefix].credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+
+        baseline = {}
+
+        if options["baseline"]:
+            with open(options["baseline"]) as f:
+                baseline = json.load(f)
+
+        results, regressions = {}, []
+        self.stdout.write(f"{'endpoint':<80} {'status':>6} {'p50(ms)':>14} {'p95(ms)':>14} {'queries':>9} {'bytes':>8}")
+
+        for path_template, view_class in get_api_endpoints():
+            prefix = next((prefix for prefix in clients if path_template.startswith(prefix)), None)
+
+            if prefix is None or not hasattr(view_class, "get"):
+                continue
+
+            params = mine_path_params if "/mine/" in path_template else path_params
+            path = build_api_path(path_template, {**params, **extra_path_params})
+
+            if path is None:
+                self.stdout.write(f"{path_template:<80} skipped (missing path param)")
+                continue
+
+            result = self._measure(
+                client=clients[prefix],
+                path=path,
+                query=get_default_query_params(view_class),
+                iterations=options["iterations"],
+                warmup=options["warmup"],
+            )
+            results[path_template] = result
+            baseline_result = baseline.get(path_template, {})
+
+            self.stdout.write(
+                f"{path_template:<80} {result['status']:>6} "
+                f"{result['p50_ms']:>7.2f}{self._format_delta(result['p50_ms'], baseline_result.get('p50_ms')):>7} "
+                f"{result['p95_ms']:>7.2f}{self._format_delta(result['p95_ms'], baseline_result.get('p95_ms')):>7} "
+                f"{result['queries']:>4}{'(' + str(baseline_result['queries']) + ')' if 'queries' in baseline_result else '':>5} "
+                f"{result['bytes']:>8}"
+            )
+
+            if baseline_result and (
+                result["p95_ms"] > baseline_result["p95_ms"] * (1 + options["threshold"]) or result["queries"] > baseline_result["queries"]
+            ):
+                regressions.append(path_template)
+
+        if options["save"]:
+            with open(options["save"], "w") as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+
+            self.stdout.write(f"Saved results to {options['save']}")
+
+        if regressions:
+            self.stdout.write(self.style.WARNING(f"Regressions ({len(regressions)}): {', '.join(regressions)}"))
+
+            if options["fail_on_regression"]:
+                raise CommandError("Benchmark regressed against the baseline.")
@@ -0,0 +1,104 @@
+import sys
+import time
+from unittest import mock
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from jurin.common.benchmarks import (
+    build_api_path,
+    get_api_endpoints,
+    get_default_query_params,
+    parse_key_value_options,
+)
+from jurin.common.compiled_serializers import compile_serializer
+from jurin.users.models import User
+
+
+class Command(BaseCommand):
+    help = "목록 API마다 DRF 시리얼라이저와 컴파일된 시리얼라이저의 응답 변환 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", action="append", required=True, help="API를 호출할 유저 아이디 (여러 번 입력 가능)")
+        parser.add_argument("--param", action="append", help="경로 변수 (예: channel_id=1, 여러 번 입력 가능)")
+        parser.add_argument("--query", action="append", help="추가 쿼리 파라미터 (예: trade_type=1, 여러 번 입력 가능)")
+        parser.add_argument("--repeat", type=int, default=200, help="변환 반복 횟수")
+
+    def _capture_page(self, client: APIClient, users: list[User], path: str, query: dict, view_class):
+        """
+        이 내장 함수는 API를 호출하고, API가 get_paginated_data에 넘긴 시리얼라이저 클래스와 페이지 객체 리스트를 가져옵니다.
+        """
+        view_module = sys.modules[view_class.__module__]
+        get_paginated_data = view_module.get_paginated_data
+        captured = {}
+
+        def capture_paginated_data(**kwargs):
+            captured.update(kwargs)
+            return get_paginated_data(**kwargs)
+
+        with mock.patch.object(view_module, "get_paginated_data", capture_paginated_data):
+            for user in users:
+                client.force_authenticate(user=user)
+                response = client.get(path, query)
+
+                if response.status_code == 200 and captured:
+                    break
+
+        if not captured:
+            return None, None
+
+        paginator = captured["pagination_class"]()
+        page = paginator.paginate_queryset(captured["queryset"], captured["request"], view=captured["view"])
+
+        if page is None:
+            page = list(captured["queryset"])
+
+        return captured["serializer_class"], page
+
+    def _measure(self, func, repeat: int) -> float:
+        started_at = time.perf_counter()
+
+        for _ in range(repeat):
+            func()
+
+        return (time.perf_counter() - started_at) / repeat * 1000
+
+    def handle(self, *args, **options):
+        users = list(User.objects.filter(username__in=options["username"]))
+
+        if not users:
+            raise CommandError("User does not exist.")
+
+        path_params = parse_key_value_options(options["param"])
+        extra_query = parse_key_value_options(options["query"])
+        repeat = options["repeat"]
+        client = APIClient()
+        renderer = JSONRenderer()
+
+        self.stdout.write(f"{'endpoint':<75} {'rows':>5} {'drf(ms)':>9} {'compiled(ms)':>13} {'speedup':>8} identical")
+
+        for path_template, view_class in get_api_endpoints():
+            if not hasattr(view_class, "Pagination") or not hasattr(view_class, "get"):
+                continue
+
+            path = build_api_path(path_template, path_params)
+
+            if path is None:
+                self.stdout.write(f"{path_template:<75} skipped (missing path param)")
+                continue
+
+            query = {**get_default_query_params(view_class), **extra_query}
+            serializer_class, page = self._capture_page(client, users, path, query, view_class)
+
+            if serializer_class is None:
+                self.stdout.write(f"{path_template:<75} skipped (no paginated response)")
+                continue
+
+            compiled_serializer = compile_serializer(serializer_class)
+            drf_time = self._measure(lambda: serializer_class(page, many=True).data, repeat)
+            compiled_time = self._measure(lambda: compiled_serializer(page), repeat)
+            is_identical = renderer.render(serializer_class(page, many=True).data) == renderer.render(compiled_serializer(page))
+            speedup = drf_time / compiled_time if compiled_time else 0
+
+            self.stdout.write(f"{path_template:<75} {len(page):>5} {drf_time:>9.3f} {compiled_time:>13.3f} {speedup:>7.2f}x {is_identical}")
@@ -0,0 +1,333 @@
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from jurin.channels.models import Channel, UserChannel
+from jurin.items.models import Item, UserItem, UserItemLog
+from jurin.posts.models import Post
+from jurin.stocks.enums import TradeType
+from jurin.stocks.models import DailyPrice, Stock, UserStock, UserTradeInfo
+from jurin.users.enums import UserRole
+from jurin.users.models import User
+
+BASE36_CHARACTERS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _to_base36(value: int) -> str:
+    encoded = ""
+
+    while value > 0:
+        value, remainder = divmod(value, 36)
+        encoded = BASE36_CHARACTERS[remainder] + encoded
+
+    return encoded or "0"
+
+
+def _generate_channel(index: int, options: dict, id_bases: dict, password: str) -> dict:
+    """
+    이 내장 함수는 채널 하나와 채널의 선생님, 학생, 주식, 일별 시세, 거래 정보, 아이템, 아이템 사용 내역, 게시글을 생성합니다.
+    모든 아이디는 채널 순서로 계산하고 난수는 (시드, 채널 순서)로 만들기 때문에, 어느 프로세스에서 생성해도 결과가 같습니다.
+    """
+    rng = random.Random(f"{options['seed']}:{index}")
+    students = options["students"]
+    stocks = options["stocks"]
+    items = options["items"]
+    days = options["days"]
+    trades_per_day = options["trades_per_day"]
+    items_per_student = min(options["items_per_student"], items)
+    batch_size = options["batch_size"]
+    today = timezone.now().date()
+    trade_dates = [today - timedelta(days=days - day) for day in range(days)]
+
+    channel_id = id_bases["channel"] + index + 1
+    user_offset = id_bases["user"] + index * (students + 1)
+    teacher_id = user_offset + 1
+    student_ids = [user_offset + 2 + student for student in range(students)]
+    stock_ids = [id_bases["stock"] + index * stocks + stock + 1 for stock in range(stocks)]
+    item_ids = [id_bases["item"] + index * items + item + 1 for item in range(items)]
+
+    # 선생님, 학생
+    users = [User(id=teacher_id, username=f"{options['prefix']}{teacher_id}", nickname=f"선생님{index % 1000}", password=password)]
+    users += [
+        User(id=student_id, username=f"{options['prefix']}{student_id}", nickname=f"학생{student % 10000}", password=password)
+        for student, student_id in enumerate(student_ids)
+    ]
+    user_groups = [User.groups.through(user_id=teacher_id, group_id=UserRole.TEACHER.value)]
+    user_groups += [User.groups.through(user_id=student_id, group_id=UserRole.STUDENT.value) for student_id in student_ids]
+
+    # 채널, 유저 채널
+    channel = Channel(
+        id=channel_id,
+        name=f"채널{channel_id}"[:16],
+        entry_code=f"g{_to_base36(channel_id):0>6}",
+        user_id=teacher_id,
+        member_count=students,
+    )
+    user_channels = [
+        UserChannel(
+            id=id_bases["user_channel"] + index * (students + 1) + position + 1,
+            user_id=user.id,
+            channel_id=channel_id,
+            nickname=user.nickname,
+            point=0 if user.id == teacher_id else rng.randrange(0, 100000, 100),
+        )
+        for position, user in enumerate(users)
+    ]
+
+    # 주식, 일별 시세 (종가를 무작위로 움직임)
+    stock_objects, daily_prices = [], []
+
+    for position, stock_id in enumerate(stock_ids):
+        price = rng.randrange(1000, 50000, 100)
+        prices = []
+
+        for day, trade_date in enumerate(trade_dates):
+            price = max(100, int(price * (1 + rng.gauss(0, 0.03))))
+            prices.append(price)
+            volume = rng.randrange(0, students * trades_per_day + 1)
+            daily_prices.append(
+                DailyPrice(
+                    id=id_bases["daily_price"] + (index * stocks + position) * days + day + 1,
+                    trade_date=trade_date,
+                    price=price,
+                    volume=volume,
+                    transaction_amount=price * volume,
+                    stock_id=stock_id,
+                )
+            )
+
+        stock_objects.append(
+            Stock(
+                id=stock_id,
+                name=f"종목{position}",
+                purchase_price=prices[-1] if prices else price,
+                prev_day_purchase_price=prices[-2] if len(prices) > 1 else price,
+                next_day_purchase_price=max(100, int(price * (1 + rng.gauss(0, 0.03)))),
+                tax=rng.choice([0.1, 0.2, 0.3]),
+                standard=rng.randrange(0, 5),
+                content=f"{position}번 종목입니다.",
+                channel_id=channel_id,
+            )
+        )
+
+    # 거래 정보 (보유 수량보다 많이 매도하지 않도록 보유 수량을 계산하며 생성)
+    trade_infos, user_stocks = [], []
+
+    for student, student_id in enumerate(student_ids):
+        holdings = {}
+
+        if not stock_ids:
+            continue
+
+        for day, trade_date in enumerate(trade_dates):
+            for trade in range(trades_per_day):
+                position = rng.randrange(stocks)
+                amount = rng.randint(1, 10)
+                held_amount = holdings.get(stock_ids[position], 0)
+                trade_type = TradeType.SELL.value if held_amount >= amount and rng.random() < 0.4 else TradeType.BUY.value
+                holdings[stock_ids[position]] = held_amount + (amount if trade_type == TradeType.BUY.value else -amount)
+
+                trade_infos.append(
+                    UserTradeInfo(
+                        id=id_bases["user_trade_info"] + ((index * students + student) * days + day) * trades_per_day + trade + 1,
+                        trade_date=trade_date,
+                        trade_type=trade_type,
+                        price=daily_prices[position * days + day].price,
+                        amount=amount,
+                        user_id=student_id,
+                        stock_id=stock_ids[position],
+                    )
+                )
+
+        user_stocks += [
+            UserStock(stock_id=stock_id, total_stock_amount=amount, user_id=student_id)
+            for stock_id, amount in holdings.items()
+            if amount > 0
+        ]
+
+    # 아이템, 유저 아이템, 아이템 사용 내역
+    item_objects = [
+        Item(
+            id=item_id,
+            title=f"아이템{position}",
+            content=f"{position}번 아이템입니다.",
+            image_url=f"https://example.com/items/{item_id}.png",
+            amount=rng.randint(0, 100),
+            price=rng.randrange(100, 10000, 100),
+            channel_id=channel_id,
+        )
+        for position, item_id in enumerate(item_ids)
+    ]
+    user_items, user_item_logs = [], []
+
+    for student, student_id in enumerate(student_ids):
+        for position, item_id in enumerate(rng.sample(item_ids, items_per_student)):
+            user_item_id = id_bases["user_item"] + (index * students + student) * items_per_student + position + 1
+            used_amount = rng.randint(0, 3)
+            user_items.append(
+                UserItem(
+                    id=user_item_id,
+                    amount=rng.randint(0, 5),
+                    used_amount=used_amount,
+                    is_used=used_amount > 0,
+                    item_id=item_id,
+                    user_id=student_id,
+                )
+            )
+            user_item_logs += [
+                UserItemLog(
+                    user_item_id=user_item_id,
+                    used_at=timezone.now() - timedelta(days=rng.randrange(days or 1), minutes=rng.randrange(1440)),
+                )
+                for _ in range(used_amount)
+            ]
+
+    # 게시글
+    posts = [
+        Post(
+            id=id_bases["post"] + index * options["posts"] + position + 1,
+            main_title=f"공지{position}",
+            sub_title=f"{position}번째 공지입니다.",
+            content="수업 공지입니다.",
+            date=today - timedelta(days=rng.randrange(days or 1)),
+            channel_id=channel_id,
+        )
+        for position in range(options["posts"])
+    ]
+
+    with transaction.atomic():
+        User.objects.bulk_create(users, batch_size=batch_size)
+        User.groups.through.objects.bulk_create(user_groups, batch_size=batch_size)
+        Channel.objects.bulk_create([channel])
+        UserChannel.objects.bulk_create(user_channels, batch_size=batch_size)
+        Stock.objects.bulk_create(stock_objects, batch_size=batch_size)
+        DailyPrice.objects.bulk_create(daily_prices, batch_size=batch_size)
+        UserTradeInfo.objects.bulk_create(trade_infos, batch_size=batch_size)
+        UserStock.objects.bulk_create(user_stocks, batch_size=batch_size)
+        Item.objects.bulk_create(item_objects, batch_size=batch_size)
+        UserItem.objects.bulk_create(user_items, batch_size=batch_size)
+        UserItemLog.objects.bulk_create(user_item_logs, batch_size=batch_size)
+        Post.objects.bulk_create(posts, batch_size=batch_size)
+
+    return {
+        "user": len(users),
+        "stock": len(stock_objects),
+        "daily_price": len(daily_prices),
+        "user_trade_info": len(trade_infos),
+        "user_stock": len(user_stocks),
+        "item": len(item_objects),
+        "user_item": len(user_items),
+        "user_item_log": len(user_item_logs),
+        "post": len(posts),
+    }
+
+
+def _generate_channels(indexes: list[int], options: dict, id_bases: dict, password: str) -> dict:
+    """
+    이 내장 함수는 작업 프로세스에서 채널 순서 리스트의 채널들을 생성하고 생성한 행의 개수를 합쳐서 반환합니다.
+    """
+    counts = {}
+
+    for index in indexes:
+        for name, count in _generate_channel(index, options, id_bases, password).items():
+            counts[name] = counts.get(name, 0) + count
+
+    connections.close_all()
+
+    return counts
+
+
+class Command(BaseCommand):
+    help = "부하 테스트와 벤치마크에 사용할 채널, 선생님, 학생, 주식, 거래 정보, 아이템, 게시글 데이터를 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--channels", type=int, default=10, help="채널 수")
+        parser.add_argument("--students", type=int, default=30, help="채널당 학생 수")
+        parser.add_argument("--stocks", type=int, default=10, help="채널당 주식 종목 수")
+        parser.add_argument("--days", type=int, default=90, help="일별 시세와 거래 정보를 생성할 일 수")
+        parser.add_argument("--trades-per-day", type=int, default=2, help="학생당 하루 거래 수")
+        parser.add_argument("--items", type=int, default=10, help="채널당 아이템 수")
+        parser.add_argument("--items-per-student", type=int, default=3, help="학생당 보유 아이템 수")
+        parser.add_argument("--posts", type=int, default=20, help="채널당 게시글 수")
+        parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+        parser.add_argument("--workers", type=int, default=4, help="생성 프로세스 수 (SQLite는 1)")
+        parser.add_argument("--batch-size", type=int, default=5000, help="bulk_create 한 번에 넣을 행의 수")
+        parser.add_argument("--prefix", default="gen", help="생성할 유저 아이디의 접두사")
+        parser.add_argument("--password", default="password", help="생성할 유저의 비밀번호")
+
+    def _get_id_bases(self) -> dict:
+        """
+        이 내장 함수는 테이블마다 현재 가장 큰 아이디를 조회합니다. 생성할 데이터의 아이디는 이 값 다음부터 할당합니다.
+        """
+        models = {
+            "user": User,
+            "channel": Channel,
+            "user_channel": UserChannel,
+            "stock": Stock,
+            "daily_price": DailyPrice,
+            "user_trade_info": UserTradeInfo,
+            "item": Item,
+            "user_item": UserItem,
+            "post": Post,
+        }
+        return {name: model.objects.aggregate(max_id=Max("id"))["max_id"] or 0 for name, model in models.items()}
+
+    def _ensure_user_role_groups(self):
+        """
+        이 내장 함수는 생성할 유저가 참조하는 권한 그룹(UserRole)이 없으면 생성합니다. (그룹을 생성하는 마이그레이션이 없으므로 새 데이터베이스에서 필요)
+        """
+        for user_role in UserRole:
+            Group.objects.get_or_create(id=user_role.value, defaults={"name": user_role.name.lower()})
+
+    def handle(self, *args, **options):
+        if options["channels"] <= 0 or options["students"] < 0 or options["workers"] <= 0:
+            raise CommandError("channels and workers must be positive.")
+
+        if len(options["prefix"]) + 20 > User._meta.get_field("username").max_length:
+            raise CommandError("prefix is too long.")
+
+        started_at = time.monotonic()
+        self._ensure_user_role_groups()
+        id_bases = self._get_id_bases()
+        # 모든 유저가 같은 비밀번호를 사용하므로 한 번만 해시
+        password = make_password(options["password"])
+
+        workers = min(options["workers"], options["channels"])
+        chunks = [list(range(worker, options["channels"], workers)) for worker in range(workers)]
+        counts = {}
+
+        if workers == 1:
+            results = [_generate_channels(chunks[0], options, id_bases, password)]
+
+        else:
+            # 작업 프로세스가 부모 프로세스의 데이터베이스 연결을 공유하지 않도록 연결을 닫은 후 fork
+            connections.close_all()
+
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+                results = list(
+                    executor.map(
+                        _generate_channels,
+                        chunks,
+                        [options] * workers,
+                        [id_bases] * workers,
+                        [password] * workers,
+                    )
+                )
+
+        for result in results:
+            for name, count in result.items():
+                counts[name] = counts.get(name, 0) + count
+
+        elapsed = time.monotonic() - started_at
+        summary = ", ".join(f"{name}={count}" for name, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"Generated {options['channels']} channels in {elapsed:.1f}s ({summary})"))
+        self.stdout.write("Run rebuild_username_bloom_filter to add the generated usernames to the username bloom filter.")
@@ -0,0 +1,239 @@
+import time
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from jurin.channels.models import Channel, ChannelShard, PointLog, UserChannel
+from jurin.channels.sharding import (
+    HOME_DATABASE,
+    check_channel_shard_auto_increment,
+    get_channel_shard_databases,
+    invalidate_channel_shard,
+    mirror_users,
+)
+from jurin.common.utils import delete_queryset_in_batches
+from jurin.items.models import Item, UserItem, UserItemLog
+from jurin.posts.models import Post
+from jurin.stocks.models import DailyPrice, Stock, UserStock, UserTradeInfo
+from jurin.users.models import User
+
+# 채널 데이터 모델과 채널 아이디 조회 경로 (참조되는 모델부터)
+CHANNEL_MODELS = [
+    (Channel, "id"),
+    (UserChannel, "channel_id"),
+    (PointLog, "channel_id"),
+    (Stock, "channel_id"),
+    (DailyPrice, "stock__channel_id"),
+    (UserStock, "stock__channel_id"),
+    (UserTradeInfo, "stock__channel_id"),
+    (Item, "channel_id"),
+    (UserItem, "item__channel_id"),
+    (UserItemLog, "user_item__item__channel_id"),
+    (Post, "channel_id"),
+]
+
+# 채널 데이터가 참조하는 유저 필드
+USER_FIELDS = [
+    (Channel, "id", "user_id"),
+    (UserChannel, "channel_id", "user_id"),
+    (PointLog, "channel_id", "user_id"),
+    (PointLog, "channel_id", "actor_id"),
+    (UserStock, "stock__channel_id", "user_id"),
+    (UserTradeInfo, "stock__channel_id", "user_id"),
+    (UserItem, "item__channel_id", "user_id"),
+]
+
+
+class Command(BaseCommand):
+    help = "채널을 다른 샤드로 이동합니다. 채널 데이터를 복사하는 동안에는 채널을 계속 사용할 수 있고, 마지막 동기화와 디렉토리 변경 동안에만 채널의 쓰기 요청을 막습니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("channel_id", type=int, help="이동할 채널 아이디")
+        parser.add_argument("database", help="채널을 옮길 샤드의 데이터베이스 별칭")
+        parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 복사, 삭제할 행 수")
+        parser.add_argument("--drain-seconds", type=float, default=5.0, help="쓰기를 막은 후 진행 중인 요청이 끝나기를 기다리는 시간(초)")
+        parser.add_argument("--delete-source", action="store_true", help="이동 후 원래 샤드의 채널 데이터를 삭제")
+
+    def handle(self, *args, **options):
+        channel_id = options["channel_id"]
+        target = options["database"]
+        batch_size = options["batch_size"]
+
+        # 이동 가능 여부 확인
+        if target not in get_channel_shard_databases():
+            raise CommandError(f"Unknown shard database: {target} (CHANNEL_SHARD_DATABASES={get_channel_shard_databases()})")
+
+        try:
+            check_channel_shard_auto_increment()
+
+        except ImproperlyConfigured as e:
+            raise CommandError(e)
+
+        channel_shard = ChannelShard.objects.using(HOME_DATABASE).filter(id=channel_id).first()
+
+        if channel_shard is None:
+            raise CommandError(f"Channel {channel_id} is not in the channel directory. Run backfill_channel_shards first.")
+
+        if channel_shard.is_migrating:
+            raise CommandError(f"Channel {channel_id} is already being migrated.")
+
+        source = channel_shard.database
+
+        if source == target:
+            raise CommandError(f"Channel {channel_id} is already in {target}.")
+
+        if not Channel.objects.using(source).filter(id=channel_id).exists():
+            raise CommandError(f"Channel {channel_id} does not exist in {source}.")
+
+        self._check_collisions(channel_id=channel_id, source=source, target=target)
+
+        # 1. 채널을 사용하는 중에 전체 복사
+        started_at = time.monotonic()
+        copied_count = self._copy_channel(channel_id=channel_id, source=source, target=target, batch_size=batch_size)
+        self.stdout.write(f"Copied {copied_count} rows from {source} to {target}. ({time.monotonic() - started_at:.1f}s)")
+
+        switched = False
+
+        try:
+            # 2. 채널의 쓰기를 막고 진행 중인 요청이 끝나기를 대기
+            ChannelShard.objects.using(HOME_DATABASE).filter(id=channel_id).update(is_migrating=True)
+            invalidate_channel_shard(channel_id=channel_id)
+            time.sleep(options["drain_seconds"])
+
+            # 3. 복사 후 변경된 데이터를 다시 복사하고 원래 샤드에서 삭제된 데이터를 삭제
+            # (포인트, 보유 주식 등은 수정 일시를 갱신하지 않는 update()로 변경되므로 수정 일시로 변경분을 찾지 않고 전체를 다시 복사)
+            started_at = time.monotonic()
+            copied_count = self._copy_channel(channel_id=channel_id, source=source, target=target, batch_size=batch_size)
+            deleted_count = self._delete_missing_rows(channel_id=channel_id, source=source, target=target, batch_size=batch_size)
+            self.stdout.write(f"Synced {copied_count} rows and deleted {deleted_count} rows. ({time.monotonic() - started_at:.1f}s)")
+
+            # 4. 디렉토리의 샤드를 변경하고 쓰기 허용
+            ChannelShard.objects.using(HOME_DATABASE).filter(id=channel_id).update(database=target, is_migrating=False)
+            switched = True
+
+        finally:
+            if not switched:
+                ChannelShard.objects.using(HOME_DATABASE).filter(id=channel_id).update(is_migrating=False)
+
+            invalidate_channel_shard(channel_id=channel_id)
+
+        self.stdout.write(self.style.SUCCESS(f"Moved channel {channel_id} from {source} to {target}."))
+
+        if options["delete_source"]:
+            deleted_count = self._delete_channel(channel_id=channel_id, database=source, batch_size=batch_size)
+            self.stdout.write(f"Deleted {deleted_count} rows from {source}.")
+
+    def _check_collisions(self, channel_id: int, source: str, target: str):
+        """
+        이 내장 함수는 이동할 채널 데이터의 아이디가 대상 샤드의 다른 채널 데이터와 겹치는지 확인합니다.
+        샤드마다 아이디를 따로 할당하므로, 샤드의 자동 증가 값 범위가 겹치면 이동할 수 없습니다.
+        """
+        for model, lookup in CHANNEL_MODELS:
+            source_ids = list(model.objects.using(source).filter(**{lookup: channel_id}).values_list("id", flat=True))
+
+            for offset in range(0, len(source_ids), 1000):
+                collided_id = (
+                    model.objects.using(target)
+                    .filter(id__in=source_ids[offset : offset + 1000])
+                    .exclude(**{lookup: channel_id})
+                    .values_list("id", flat=True)
+                    .first()
+                )
+
+                if collided_id is not None:
+                    raise CommandError(
+                        f"{model._meta.db_table}.id={collided_id} already exists in {target} for another channel. "
+                        "Shards must use disjoint auto increment ranges."
+                    )
+
+    def _copy_channel(self, channel_id: int, source: str, target: str, batch_size: int) -> int:
+        """
+        이 내장 함수는 채널 데이터와 채널 데이터가 참조하는 유저를 대상 샤드에 복사(있으면 갱신)합니다.
+        """
+        user_ids = self._get_user_ids(channel_id=channel_id, database=source)
+
+        # 유저의 원본은 홈 샤드에 있음
+        for offset in range(0, len(user_ids), batch_size):
+            mirror_users(users=User.objects.using(HOME_DATABASE).filter(id__in=user_ids[offset : offset + batch_size]), database=target)
+
+        copied_count = 0
+
+        for model, lookup in CHANNEL_MODELS:
+            fields = model._meta.concrete_fields
+            queryset = model.objects.using(source).filter(**{lookup: channel_id}).order_by("id")
+            last_id = 0
+
+            while True:
+                rows = list(queryset.filter(id__gt=last_id)[:batch_size])
+
+                if not rows:
+                    break
+
+                last_id = rows[-1].id
+
+                with transaction.atomic(using=target):
+                    model.objects.using(target).bulk_create(
+                        [model(**{field.attname: getattr(row, field.attname) for field in fields}) for row in rows],
+                        update_conflicts=True,
+                        unique_fields=["id"],
+                        update_fields=[field.name for field in fields if not field.primary_key],
+                    )
+
+                copied_count += len(rows)
+
+        return copied_count
+
+    def _get_user_ids(self, channel_id: int, database: str) -> list[int]:
+        user_ids = set()
+
+        for model, lookup, field in USER_FIELDS:
+            user_ids.update(
+                model.objects.using(database).filter(**{lookup: channel_id}).exclude(**{field: None}).values_list(field, flat=True)
+            )
+
+        return sorted(user_ids)
+
+    def _delete_missing_rows(self, channel_id: int, source: str, target: str, batch_size: int) -> int:
+        """
+        이 내장 함수는 대상 샤드에 복사된 채널 데이터 중 원래 샤드에서 삭제된 데이터를 삭제합니다. (참조하는 모델부터)
+        """
+        deleted_count = 0
+
+        for model, lookup in reversed(CHANNEL_MODELS):
+            source_ids = set(model.objects.using(source).filter(**{lookup: channel_id}).values_list("id", flat=True))
+            target_ids = set(model.objects.using(target).filter(**{lookup: channel_id}).values_list("id", flat=True))
+            missing_ids = sorted(target_ids - source_ids)
+
+            if missing_ids:
+                deleted_count += delete_queryset_in_batches(
+                    queryset=model.objects.using(target).filter(id__in=missing_ids), batch_size=batch_size
+                )
+
+        return deleted_count
+
+    def _delete_channel(self, channel_id: int, database: str, batch_size: int) -> int:
+        """
+        이 내장 함수는 샤드에서 채널 데이터를 삭제하고, 홈 샤드가 아니면 더 이상 참조되지 않는 유저 사본도 삭제합니다.
+        """
+        user_ids = self._get_user_ids(channel_id=channel_id, database=database)
+        deleted_count = 0
+
+        for model, lookup in reversed(CHANNEL_MODELS):
+            deleted_count += delete_queryset_in_batches(
+                queryset=model.objects.using(database).filter(**{lookup: channel_id}), batch_size=batch_size
+            )
+
+        if database != HOME_DATABASE:
+            # 샤드의 다른 채널 데이터가 참조하는 유저 사본은 남김
+            referenced_user_ids = set()
+
+            for model, _, field in USER_FIELDS:
+                referenced_user_ids.update(model.objects.using(database).filter(**{f"{field}__in": user_ids}).values_list(field, flat=True))
+
+            unreferenced_user_ids = [user_id for user_id in user_ids if user_id not in referenced_user_ids]
+            deleted_count += delete_queryset_in_batches(
+                queryset=User.objects.using(database).filter(id__in=unreferenced_user_ids), batch_size=batch_size
+            )
+
+        return deleted_count
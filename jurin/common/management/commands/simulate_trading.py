@@ -0,0 +1,359 @@
+import multiprocessing
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import time as datetime_time
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection, connections, transaction
+from django.db.models import Count, Q, Sum
+from django.utils.crypto import get_random_string
+
+from jurin.channels.models import Channel, PointLog, UserChannel
+from jurin.common.exception.exceptions import BaseAPIException
+from jurin.items.models import Item
+from jurin.items.services import ItemService
+from jurin.stocks.enums import TradeType
+from jurin.stocks.models import Stock, UserStock, UserTradeInfo
+from jurin.stocks.services import StockService
+from jurin.users.enums import UserRole
+from jurin.users.models import User
+
+OPERATIONS = ("buy_stock", "sell_stock", "buy_item")
+LOWERCASE_AND_DIGITS = "abcdefghijklmnopqrstuvwxyz0123456789"
+
+
+def _classify_error(e: Exception) -> str:
+    """
+    이 내장 함수는 거래 중 발생한 예외를 결과 종류로 분류합니다.
+    서비스의 검증 예외는 정상적인 거절로, 데이터베이스의 데드락과 락 대기 시간 초과는 따로 분류합니다.
+    """
+    if isinstance(e, BaseAPIException):
+        return "rejected"
+
+    message = str(e).lower()
+
+    if isinstance(e, DatabaseError) and "deadlock" in message:
+        return "deadlock"
+
+    if isinstance(e, DatabaseError) and ("lock wait timeout" in message or "database is locked" in message):
+        return "lock_timeout"
+
+    return f"error:{type(e).__name__}"
+
+
+def _run_worker(worker: int, student_ids: list[int], fixture: dict, options: dict, start_at: float) -> dict:
+    """
+    이 내장 함수는 작업 스레드(또는 프로세스)에서 담당 학생들로 매수, 매도, 아이템 구매를 무작위로 반복하고,
+    거래 종류별 응답 시간과 결과 수를 반환합니다. 모든 작업이 start_at에 동시에 거래를 시작하여 장 시작 직후의 몰림을 재현합니다.
+    """
+    rng = random.Random(f"{options['seed']}:{worker}")
+    stock_service = StockService()
+    item_service = ItemService()
+    students = list(User.objects.filter(id__in=student_ids))
+    holdings = {student.id: {} for student in students}
+    latencies = {operation: [] for operation in OPERATIONS}
+    outcomes = {operation: {} for operation in OPERATIONS}
+    weights = [options["buy_stock_weight"], options["sell_stock_weight"], options["buy_item_weight"]]
+
+    time.sleep(max(0.0, start_at - time.time()))
+
+    for _ in range(options["trades"]):
+        student = rng.choice(students)
+        operation = rng.choices(OPERATIONS, weights=weights)[0]
+        amount = rng.randint(1, options["max_amount"])
+        held_stocks = [stock_id for stock_id, held_amount in holdings[student.id].items() if held_amount > 0]
+
+        # 보유한 주식이 없으면 매수
+        if operation == "sell_stock" and not held_stocks:
+            operation = "buy_stock"
+
+        started_at = time.perf_counter()
+
+        try:
+            if operation == "buy_stock":
+                stock_id = rng.choice(fixture["stock_ids"])
+                stock_service.buy_stock(stock_id=stock_id, user=student, channel_id=fixture["channel_id"], amount=amount)
+                holdings[student.id][stock_id] = holdings[student.id].get(stock_id, 0) + amount
+
+            elif operation == "sell_stock":
+                stock_id = rng.choice(held_stocks)
+                amount = min(amount, holdings[student.id][stock_id])
+                stock_service.sell_stock(stock_id=stock_id, user=student, channel_id=fixture["channel_id"], amount=amount)
+                holdings[student.id][stock_id] -= amount
+
+            else:
+                item_id = rng.choice(fixture["item_ids"])
+                item_service.buy_item(
+                    channel_id=fixture["channel_id"],
+                    item_id=item_id,
+                    price=fixture["item_prices"][item_id],
+                    amount=amount,
+                    user=student,
+                )
+
+            outcome = "ok"
+
+        except Exception as e:
+            outcome = _classify_error(e)
+
+        latencies[operation].append(time.perf_counter() - started_at)
+        outcomes[operation][outcome] = outcomes[operation].get(outcome, 0) + 1
+
+    connections.close_all()
+
+    return {"latencies": latencies, "outcomes": outcomes}
+
+
+class Command(BaseCommand):
+    help = "한 채널의 학생들이 동시에 주식 매수, 매도, 아이템 구매를 하는 상황을 재현하고 처리량, 응답 시간, 락 충돌, 데이터 정합성을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=8, help="동시에 거래하는 작업 수")
+        parser.add_argument("--processes", action="store_true", help="스레드 대신 프로세스로 실행 (SQLite 제외)")
+        parser.add_argument("--students", type=int, default=30, help="채널 학생 수 (작업 수 이상)")
+        parser.add_argument("--trades", type=int, default=200, help="작업당 거래 수")
+        parser.add_argument("--stocks", type=int, default=3, help="주식 종목 수")
+        parser.add_argument("--items", type=int, default=2, help="아이템 수")
+        parser.add_argument("--item-amount", type=int, default=100, help="아이템별 수량 (적을수록 품절 경쟁이 심해짐)")
+        parser.add_argument("--point", type=int, default=100000, help="학생별 시작 포인트")
+        parser.add_argument("--max-amount", type=int, default=5, help="거래 한 번의 최대 수량")
+        parser.add_argument("--buy-stock-weight", type=float, default=0.45, help="주식 매수 비중")
+        parser.add_argument("--sell-stock-weight", type=float, default=0.35, help="주식 매도 비중")
+        parser.add_argument("--buy-item-weight", type=float, default=0.2, help="아이템 구매 비중")
+        parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+        parser.add_argument("--keep", action="store_true", help="실행 후 생성한 채널, 유저 데이터를 삭제하지 않음")
+
+    def _create_fixture(self, options: dict) -> dict:
+        """
+        이 내장 함수는 시뮬레이션 전용 채널과 선생님, 학생, 주식, 아이템을 생성합니다.
+        거래 시간 검증을 통과하도록 채널의 시장 시간은 하루 전체로 설정합니다.
+        """
+        run_id = get_random_string(6, LOWERCASE_AND_DIGITS)
+        password = make_password(None)
+
+        with transaction.atomic():
+            teacher = User.objects.create(username=f"sim{run_id}t", nickname="시뮬레이션", password=password)
+            teacher.groups.add(UserRole.TEACHER.value)
+            User.objects.bulk_create(
+                [User(username=f"sim{run_id}s{index}", nickname=f"학생{index}", password=password) for index in range(options["students"])]
+            )
+            # bulk_create가 아이디를 반환하지 않는 데이터베이스(MySQL)를 위해 다시 조회
+            students = list(User.objects.filter(username__startswith=f"sim{run_id}s").order_by("id"))
+            User.groups.through.objects.bulk_create(
+                [User.groups.through(user_id=student.id, group_id=UserRole.STUDENT.value) for student in students]
+            )
+
+            channel = Channel.objects.create(
+                name=f"시뮬레이션{run_id}",
+                entry_code=f"s{run_id}",
+                user=teacher,
+                market_opening_at=datetime_time.min,
+                market_closing_at=datetime_time(23, 59, 59),
+                member_count=len(students),
+            )
+            UserChannel.objects.bulk_create(
+                [UserChannel(user=teacher, channel=channel, nickname=teacher.nickname)]
+                + [UserChannel(user=student, channel=channel, nickname=student.nickname, point=options["point"]) for student in students]
+            )
+
+            for index in range(options["stocks"]):
+                Stock.objects.create(
+                    channel=channel,
+                    name=f"종목{index}",
+                    purchase_price=1000 * (index + 1),
+                    prev_day_purchase_price=1000 * (index + 1),
+                    next_day_purchase_price=1000 * (index + 1),
+                    tax=0.1,
+                    standard=0,
+                    content="시뮬레이션 종목입니다.",
+                )
+
+            for index in range(options["items"]):
+                Item.objects.create(
+                    channel=channel,
+                    title=f"아이템{index}",
+                    content="시뮬레이션 아이템입니다.",
+                    image_url="https://example.com/item.png",
+                    amount=options["item_amount"],
+                    price=500 * (index + 1),
+                )
+
+        return {
+            "teacher_id": teacher.id,
+            "channel_id": channel.id,
+            "student_ids": [student.id for student in students],
+            "stock_ids": list(Stock.objects.filter(channel=channel).values_list("id", flat=True)),
+            "item_ids": list(Item.objects.filter(channel=channel).values_list("id", flat=True)),
+            "item_prices": dict(Item.objects.filter(channel=channel).values_list("id", "price")),
+        }
+
+    def _delete_fixture(self, fixture: dict):
+        """
+        이 내장 함수는 시뮬레이션 전용 채널과 유저를 삭제합니다. (채널의 주식, 아이템, 거래 내역, 포인트 내역은 함께 삭제됩니다.)
+        """
+        with transaction.atomic():
+            Channel.objects.filter(id=fixture["channel_id"]).delete()
+            User.objects.filter(id__in=[fixture["teacher_id"], *fixture["student_ids"]]).delete()
+
+    def _get_lock_status(self) -> dict:
+        """
+        이 내장 함수는 MySQL(InnoDB)의 행 락 대기 횟수와 대기 시간(ms)을 조회합니다. 다른 데이터베이스는 빈 딕셔너리를 반환합니다.
+        """
+        if connection.vendor != "mysql":
+            return {}
+
+        with connection.cursor() as cursor:
+            cursor.execute("SHOW GLOBAL STATUS WHERE Variable_name IN ('Innodb_row_lock_waits', 'Innodb_row_lock_time')")
+            return {name: int(value) for name, value in cursor.fetchall()}
+
+    def _check_invariants(self, fixture: dict, options: dict) -> list[str]:
+        """
+        이 내장 함수는 시뮬레이션 후 데이터 정합성을 검사하고 위반 내역 리스트를 반환합니다.
+        - 포인트가 음수이거나, 시작 포인트 + 포인트 내역 합계와 다른 학생
+        - 수량이 음수이거나, 남은 수량 + 학생 보유 수량이 처음 수량과 다른(초과 판매된) 아이템
+        - 보유 수량이 음수이거나, 매수 수량 - 매도 수량과 다른 유저 주식, 같은 종목이 여러 행인 유저 주식
+        """
+        violations = []
+        channel_id = fixture["channel_id"]
+        point_log_sums = dict(
+            PointLog.objects.filter(channel_id=channel_id).values("user_id").annotate(total=Sum("point")).values_list("user_id", "total")
+        )
+
+        for user_id, point in UserChannel.objects.filter(channel_id=channel_id, user_id__in=fixture["student_ids"]).values_list(
+            "user_id", "point"
+        ):
+            expected_point = options["point"] + (point_log_sums.get(user_id) or 0)
+
+            if point < 0 or point != expected_point:
+                violations.append(f"user {user_id}: point={point}, expected={expected_point}")
+
+        for item in Item.objects.filter(channel_id=channel_id).annotate(sold_amount=Sum("user_item_pivot__amount")):
+            sold_amount = item.sold_amount or 0
+
+            if item.amount < 0 or item.amount + sold_amount != options["item_amount"]:
+                violations.append(f"item {item.id}: amount={item.amount}, sold={sold_amount}, initial={options['item_amount']}")
+
+        trade_sums = {
+            (user_id, stock_id): (bought or 0) - (sold or 0)
+            for user_id, stock_id, bought, sold in UserTradeInfo.objects.filter(stock__channel_id=channel_id)
+            .values("user_id", "stock_id")
+            .annotate(
+                bought=Sum("amount", filter=Q(trade_type=TradeType.BUY.value)),
+                sold=Sum("amount", filter=Q(trade_type=TradeType.SELL.value)),
+            )
+            .values_list("user_id", "stock_id", "bought", "sold")
+        }
+        user_stocks = (
+            UserStock.objects.filter(stock__channel_id=channel_id)
+            .values("user_id", "stock_id")
+            .annotate(rows=Count("id"), total=Sum("total_stock_amount"))
+            .values_list("user_id", "stock_id", "rows", "total")
+        )
+        held_amounts = {}
+
+        for user_id, stock_id, rows, total in user_stocks:
+            held_amounts[(user_id, stock_id)] = total
+
+            if rows > 1:
+                violations.append(f"user {user_id} stock {stock_id}: {rows} user stock rows")
+
+        for key in set(trade_sums) | set(held_amounts):
+            held_amount, expected_amount = held_amounts.get(key, 0), trade_sums.get(key, 0)
+
+            if held_amount < 0 or held_amount != expected_amount:
+                violations.append(f"user {key[0]} stock {key[1]}: amount={held_amount}, expected={expected_amount}")
+
+        return violations
+
+    def handle(self, *args, **options):
+        if options["workers"] <= 0 or options["trades"] <= 0:
+            raise CommandError("workers and trades must be positive.")
+
+        if options["students"] < options["workers"]:
+            raise CommandError("students must be greater than or equal to workers.")
+
+        if options["stocks"] <= 0 or options["items"] <= 0:
+            raise CommandError("stocks and items must be positive.")
+
+        if options["processes"] and connection.vendor == "sqlite":
+            raise CommandError("processes cannot be used with SQLite.")
+
+        fixture = self._create_fixture(options)
+        workers = options["workers"]
+        chunks = [fixture["student_ids"][worker::workers] for worker in range(workers)]
+        lock_status = self._get_lock_status()
+
+        try:
+            if options["processes"]:
+                # 작업 프로세스가 부모 프로세스의 데이터베이스 연결을 공유하지 않도록 연결을 닫은 후 fork
+                connections.close_all()
+                executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+
+            else:
+                executor = ThreadPoolExecutor(max_workers=workers)
+
+            # 모든 작업이 준비된 후 동시에 시작
+            start_at = time.time() + 1.0 + workers * 0.05
+
+            with executor:
+                futures = [executor.submit(_run_worker, worker, chunks[worker], fixture, options, start_at) for worker in range(workers)]
+                results = [future.result() for future in futures]
+
+            elapsed = time.time() - start_at
+            violations = self._check_invariants(fixture, options)
+            lock_status = {name: value - lock_status.get(name, 0) for name, value in self._get_lock_status().items()}
+
+        finally:
+            if not options["keep"]:
+                self._delete_fixture(fixture)
+
+        self._report(results, elapsed, lock_status, violations)
+
+    def _report(self, results: list[dict], elapsed: float, lock_status: dict, violations: list[str]):
+        """
+        이 내장 함수는 거래 종류별 처리량, 응답 시간 분포, 결과 수와 정합성 위반 내역을 출력합니다.
+        """
+        total_count, total_ok = 0, 0
+        self.stdout.write(
+            f"{'operation':<12} {'count':>7} {'ops/s':>8} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'max(ms)':>9}  outcomes"
+        )
+
+        for operation in OPERATIONS:
+            latencies = sorted(latency * 1000 for result in results for latency in result["latencies"][operation])
+            outcomes = {}
+
+            for result in results:
+                for outcome, count in result["outcomes"][operation].items():
+                    outcomes[outcome] = outcomes.get(outcome, 0) + count
+
+            if not latencies:
+                continue
+
+            total_count += len(latencies)
+            total_ok += outcomes.get("ok", 0)
+            percentiles = [latencies[min(len(latencies) - 1, int(len(latencies) * ratio))] for ratio in (0.95, 0.99)]
+            self.stdout.write(
+                f"{operation:<12} {len(latencies):>7} {len(latencies) / elapsed:>8.1f} {statistics.median(latencies):>9.2f} "
+                f"{percentiles[0]:>9.2f} {percentiles[1]:>9.2f} {latencies[-1]:>9.2f}  "
+                + ", ".join(f"{outcome}={count}" for outcome, count in sorted(outcomes.items()))
+            )
+
+        self.stdout.write(f"Total: {total_count} trades ({total_ok} succeeded) in {elapsed:.2f}s, {total_count / elapsed:.1f} trades/s")
+
+        if lock_status:
+            self.stdout.write(
+                f"InnoDB row lock waits: {lock_status.get('Innodb_row_lock_waits', 0)}, "
+                f"row lock time: {lock_status.get('Innodb_row_lock_time', 0)}ms"
+            )
+
+        if violations:
+            self.stdout.write(self.style.ERROR(f"Invariant violations ({len(violations)}):"))
+
+            for violation in violations:
+                self.stdout.write(f"  {violation}")
+
+        else:
+            self.stdout.write(self.style.SUCCESS("No invariant violations."))
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+
+from jurin.common.models import SlowQuery
+
+ORDERINGS = {
+    "total": "-total_duration",
+    "max": "-max_duration",
+    "calls": "-calls",
+    "recent": "-last_seen_at",
+}
+
+
+class Command(BaseCommand):
+    help = "SlowQueryMiddleware가 기록한 느린 쿼리를 핑거프린트, 뷰, 셀렉터 메소드별로 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=20, help="출력할 기록 수")
+        parser.add_argument("--order-by", choices=ORDERINGS.keys(), default="total", help="정렬 기준")
+        parser.add_argument("--view", help="뷰 이름에 포함된 문자열로 필터링")
+        parser.add_argument("--explain", action="store_true", help="예시 쿼리와 실행 계획도 출력")
+        parser.add_argument("--clear", action="store_true", help="기록을 모두 삭제")
+
+    def handle(self, *args, **options):
+        if options["clear"]:
+            deleted_count, _ = SlowQuery.objects.all().delete()
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted_count} slow queries."))
+            return
+
+        slow_queries = SlowQuery.objects.order_by(ORDERINGS[options["order_by"]], "-id")
+
+        if options["view"]:
+            slow_queries = slow_queries.filter(view__icontains=options["view"])
+
+        for slow_query in slow_queries[: options["limit"]]:
+            average_duration = slow_query.total_duration / slow_query.calls if slow_query.calls else 0.0
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(
+                    f"#{slow_query.id} calls={slow_query.calls} total={slow_query.total_duration:.1f}ms "
+                    f"avg={average_duration:.1f}ms max={slow_query.max_duration:.1f}ms last={slow_query.last_seen_at:%Y-%m-%d %H:%M:%S}"
+                )
+            )
+            self.stdout.write(f"  view:   {slow_query.view or '-'}")
+            self.stdout.write(f"  source: {slow_query.source or '-'}")
+            self.stdout.write(f"  query:  {slow_query.fingerprint}")
+
+            if options["explain"]:
+                self.stdout.write(f"  sample: {slow_query.sample_sql}")
+                self.stdout.write("  explain:")
+
+                for line in (slow_query.explain or "-").splitlines():
+                    self.stdout.write(f"    {line}")
@@ -0,0 +1,317 @@
+import glob
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import ExitStack
+from typing import Callable
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from config.django.base import logger
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # seconds
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)  # bytes
+
+HISTOGRAMS = {
+    "jurin_http_request_duration_seconds": ("요청 처리 시간", LATENCY_BUCKETS),
+    "jurin_http_request_db_queries": ("요청당 SQL 쿼리 수", QUERY_COUNT_BUCKETS),
+    "jurin_http_request_db_duration_seconds": ("요청당 SQL 실행 시간", LATENCY_BUCKETS),
+    "jurin_http_request_render_duration_seconds": ("응답 렌더링 시간", LATENCY_BUCKETS),
+    "jurin_http_response_size_bytes": ("응답 크기", SIZE_BUCKETS),
+}
+COUNTER_NAME = "jurin_http_requests_total"
+QUERY_BUDGET_COUNTER_NAME = "jurin_http_query_budget_exceeded_total"
+
+# 수집 함수(register_collector)로 저장할 때마다 현재 값을 가져오는 지표 (워커별 값을 합쳐서 응답)
+COLLECTED_METRICS = {
+    "jurin_password_verification_in_flight": ("gauge", "비밀번호 검증 풀에서 실행 및 대기 중인 작업 수"),
+    "jurin_password_verification_queue_depth": ("gauge", "비밀번호 검증 풀의 대기열 깊이"),
+    "jurin_password_verification_rejected_total": ("counter", "비밀번호 검증 풀이 가득 차서 거절된 작업 수"),
+    "jurin_password_verification_completed_total": ("counter", "비밀번호 검증 풀에서 끝난 작업 수"),
+}
+
+
+class MetricsRegistry:
+    """
+    이 클래스는 프로세스 안에서 API별 요청 지표를 히스토그램과 카운터로 모으는 클래스입니다.
+    gunicorn 워커마다 따로 모이므로 주기적으로 공유 디렉토리에 프로세스별 스냅샷 파일로 저장하고,
+    /metrics 요청 시 모든 스냅샷을 합쳐서 Prometheus 형식으로 변환합니다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms = {}
+        self.counters = {}
+        self.collectors = []
+        self.flushed_at = 0.0
+
+    def observe(self, name: str, labels: tuple, value: float):
+        buckets = HISTOGRAMS[name][1]
+
+        with self.lock:
+            key = json.dumps([name, labels])
+            histogram = self.histograms.get(key)
+
+            if histogram is None:
+                histogram = self.histograms[key] = {"buckets": [0] * (len(buckets) + 1), "sum": 0.0, "count": 0}
+
+            histogram["buckets"][bisect_left(buckets, value)] += 1
+            histogram["sum"] += value
+            histogram["count"] += 1
+
+    def increment(self, name: str, labels: tuple):
+        with self.lock:
+            key = json.dumps([name, labels])
+            self.counters[key] = self.counters.get(key, 0) + 1
+
+    def register_collector(self, collector: Callable[[], dict[str, float]]):
+        """
+        이 함수는 저장할 때마다 호출하여 지표(COLLECTED_METRICS)의 현재 값을 가져올 수집 함수를 등록합니다.
+
+        Args:
+            collector (Callable[[], dict[str, float]]): 지표 이름과 값을 반환하는 함수입니다.
+        """
+        with self.lock:
+            self.collectors.append(collector)
+
+    def flush(self, force: bool = False):
+        """
+        이 함수는 현재 프로세스의 지표를 스냅샷 파일로 저장합니다.
+        다른 워커가 절반만 쓰인 파일을 읽지 않도록 임시 파일에 쓴 후 교체합니다.
+
+        Args:
+            force (bool): 저장 주기와 관계없이 저장할지 여부입니다.
+        """
+        now = time.monotonic()
+
+        if force is False and now - self.flushed_at < settings.METRICS_FLUSH_INTERVAL:
+            return
+
+        with self.lock:
+            self.flushed_at = now
+            collectors = list(self.collectors)
+
+        collected = {}
+
+        for collector in collectors:
+            collected.update(collector())
+
+        with self.lock:
+            snapshot = json.dumps({"histograms": self.histograms, "counters": self.counters, "collected": collected})
+
+        os.makedirs(settings.METRICS_DIRECTORY, exist_ok=True)
+        path = os.path.join(settings.METRICS_DIRECTORY, f"{os.getpid()}.json")
+        temp_path = f"{path}.tmp"
+
+        with open(temp_path, "w") as f:
+            f.write(snapshot)
+
+        os.replace(temp_path, path)
+
+
+metrics_registry = MetricsRegistry()
+
+
+def _is_process_alive(pid: int) -> bool:
+    """
+    이 내장 함수는 프로세스 아이디의 프로세스가 실행 중인지 확인합니다.
+    """
+    try:
+        os.kill(pid, 0)
+
+    except ProcessLookupError:
+        return False
+
+    except PermissionError:
+        return True
+
+    return True
+
+
+def _merge_snapshots() -> tuple[dict, dict, dict]:
+    """
+    이 내장 함수는 모든 워커의 스냅샷 파일을 읽어 히스토그램, 카운터, 수집한 지표를 합칩니다.
+    종료된 워커의 파일도 누적 값으로 합쳐서 카운터가 줄어들지 않도록 하고,
+    게이지는 현재 값이므로 실행 중인 워커의 값만 합칩니다.
+    """
+    histograms, counters, collected = {}, {}, {}
+
+    for path in glob.glob(os.path.join(settings.METRICS_DIRECTORY, "*.json")):
+        try:
+            with open(path) as f:
+                snapshot = json.load(f)
+
+        except (OSError, ValueError):
+            continue
+
+        for key, histogram in snapshot["histograms"].items():
+            merged = histograms.setdefault(key, {"buckets": [0] * len(histogram["buckets"]), "sum": 0.0, "count": 0})
+            merged["buckets"] = [a + b for a, b in zip(merged["buckets"], histogram["buckets"])]
+            merged["sum"] += histogram["sum"]
+            merged["count"] += histogram["count"]
+
+        for key, value in snapshot["counters"].items():
+            counters[key] = counters.get(key, 0) + value
+
+        pid = os.path.splitext(os.path.basename(path))[0]
+        is_alive = pid.isdigit() and _is_process_alive(int(pid))
+
+        for name, value in snapshot.get("collected", {}).items():
+            metric_type = COLLECTED_METRICS.get(name, ("gauge", ""))[0]
+
+            if metric_type == "gauge" and is_alive is False:
+                continue
+
+            collected[name] = collected.get(name, 0) + value
+
+    return histograms, counters, collected
+
+
+def _format_labels(label_names: tuple, labels: list, **extra_labels) -> str:
+    """
+    이 내장 함수는 라벨을 Prometheus 형식으로 변환합니다. (역슬래시, 큰따옴표, 줄바꿈은 이스케이프)
+    """
+    pairs = [*zip(label_names, labels), *extra_labels.items()]
+    escaped_pairs = [(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for name, value in pairs]
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped_pairs) + "}"
+
+
+def render_metrics() -> str:
+    """
+    이 함수는 모든 워커의 지표를 Prometheus 텍스트 형식으로 변환합니다.
+
+    Returns:
+        str: Prometheus 텍스트 형식의 지표입니다.
+    """
+    histograms, counters, collected = _merge_snapshots()
+    label_names = ("method", "route")
+    lines = []
+
+    for name, (description, buckets) in HISTOGRAMS.items():
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+
+        for key, histogram in sorted(histograms.items()):
+            histogram_name, labels = json.loads(key)
+
+            if histogram_name != name:
+                continue
+
+            cumulative_count = 0
+
+            for upper_bound, bucket_count in zip([*buckets, "+Inf"], histogram["buckets"]):
+                cumulative_count += bucket_count
+                lines.append(f"{name}_bucket{_format_labels(label_names, labels, le=upper_bound)} {cumulative_count}")
+
+            lines.append(f"{name}_sum{_format_labels(label_names, labels)} {histogram['sum']}")
+            lines.append(f"{name}_count{_format_labels(label_names, labels)} {histogram['count']}")
+
+    for name, description, counter_label_names in [
+        (COUNTER_NAME, "요청 수", ("method", "route", "status")),
+        (QUERY_BUDGET_COUNTER_NAME, "쿼리 수 제한을 넘은 요청 수", ("method", "route")),
+    ]:
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+
+        for key, value in sorted(counters.items()):
+            counter_name, labels = json.loads(key)
+
+            if counter_name == name:
+                lines.append(f"{name}{_format_labels(counter_label_names, labels)} {value}")
+
+    for name, (metric_type, description) in COLLECTED_METRICS.items():
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} {metric_type}"]
+
+        if name in collected:
+            lines.append(f"{name} {collected[name]}")
+
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    이 함수는 모든 워커의 지표를 Prometheus 텍스트 형식으로 응답합니다.
+    METRICS_TOKEN이 설정되어 있으면 Authorization 헤더의 Bearer 토큰을 확인합니다.
+    url: /metrics
+    """
+    if settings.METRICS_TOKEN and request.headers.get("Authorization") != f"Bearer {settings.METRICS_TOKEN}":
+        return HttpResponse(status=401)
+
+    metrics_registry.flush(force=True)
+
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+class MetricsMiddleware:
+    """
+    이 클래스는 요청마다 SQL 쿼리 수, SQL 실행 시간, 응답 렌더링 시간, 응답 크기, 처리 시간을 API 경로별로 기록하는 미들웨어입니다.
+    쿼리 수가 METRICS_QUERY_BUDGET을 넘으면 경고 로그를 남겨 N+1 쿼리를 바로 알 수 있도록 합니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def process_template_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        # DRF Response는 이 다음에 렌더링되므로 렌더링이 끝난 시간을 기록
+        request._metrics_render_started_at = time.perf_counter()
+        response.add_post_render_callback(lambda rendered_response: setattr(request, "_metrics_render_ended_at", time.perf_counter()))
+        return response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        query_stats = {"count": 0, "duration": 0.0}
+
+        def record_query(execute, sql, params, many, context):
+            started_at = time.perf_counter()
+
+            try:
+                return execute(sql, params, many, context)
+
+            finally:
+                query_stats["count"] += 1
+                query_stats["duration"] += time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(record_query))
+
+            response = self.get_response(request)
+
+        duration = time.perf_counter() - started_at
+
+        resolver_match = getattr(request, "resolver_match", None)
+
+        if resolver_match is None or resolver_match.url_name == "metrics":
+            return response
+
+        route = "/" + resolver_match.route.lstrip("/")
+        labels = (request.method, route)
+
+        render_duration = getattr(request, "_metrics_render_ended_at", 0.0) - getattr(request, "_metrics_render_started_at", 0.0)
+        response_size = 0 if response.streaming else len(response.content)
+
+        metrics_registry.observe("jurin_http_request_duration_seconds", labels, duration)
+        metrics_registry.observe("jurin_http_request_db_queries", labels, query_stats["count"])
+        metrics_registry.observe("jurin_http_request_db_duration_seconds", labels, query_stats["duration"])
+        metrics_registry.observe("jurin_http_request_render_duration_seconds", labels, max(render_duration, 0.0))
+        metrics_registry.observe("jurin_http_response_size_bytes", labels, response_size)
+        metrics_registry.increment(COUNTER_NAME, (*labels, response.status_code))
+
+        if query_stats["count"] > settings.METRICS_QUERY_BUDGET:
+            metrics_registry.increment(QUERY_BUDGET_COUNTER_NAME, labels)
+            logger.warning(
+                f"Query budget exceeded: {request.method} {route} executed {query_stats['count']} queries "
+                f"(budget: {settings.METRICS_QUERY_BUDGET}, db: {query_stats['duration'] * 1000:.1f}ms)"
+            )
+
+        try:
+            metrics_registry.flush()
+
+        except OSError as e:
+            logger.warning(f"Failed to flush metrics. {e}")
+
+        return response
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlowQuery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='느린 쿼리 고유 아이디')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성 일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정 일시')),
+                ('fingerprint_key', models.CharField(max_length=64, unique=True, verbose_name='핑거프린트 키')),
+                ('fingerprint', models.TextField(verbose_name='핑거프린트')),
+                ('view', models.CharField(default='', max_length=255, verbose_name='뷰')),
+                ('source', models.CharField(default='', max_length=255, verbose_name='쿼리 실행 위치')),
+                ('sample_sql', models.TextField(verbose_name='예시 쿼리')),
+                ('explain', models.TextField(default='', verbose_name='실행 계획')),
+                ('calls', models.PositiveBigIntegerField(default=0, verbose_name='기록 횟수')),
+                ('total_duration', models.FloatField(default=0.0, verbose_name='총 실행 시간(ms)')),
+                ('max_duration', models.FloatField(default=0.0, verbose_name='최대 실행 시간(ms)')),
+                ('last_seen_at', models.DateTimeField(verbose_name='마지막 기록 일시')),
+            ],
+            options={
+                'verbose_name': 'slow query',
+                'verbose_name_plural': 'slow queries',
+                'db_table': 'slow_query',
+                'indexes': [models.Index(fields=['total_duration'], name='slow_query_total_duration_idx')],
+            },
+        ),
+    ]
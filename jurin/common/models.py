@@ -0,0 +1,28 @@
+from django.db import models
+
+from jurin.common.base.models import BaseModel
+
+
+class SlowQuery(BaseModel):
+    id = models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="느린 쿼리 고유 아이디")
+    fingerprint_key = models.CharField(max_length=64, unique=True, verbose_name="핑거프린트 키")
+    fingerprint = models.TextField(verbose_name="핑거프린트")
+    view = models.CharField(max_length=255, default="", verbose_name="뷰")
+    source = models.CharField(max_length=255, default="", verbose_name="쿼리 실행 위치")
+    sample_sql = models.TextField(verbose_name="예시 쿼리")
+    explain = models.TextField(default="", verbose_name="실행 계획")
+    calls = models.PositiveBigIntegerField(default=0, verbose_name="기록 횟수")
+    total_duration = models.FloatField(default=0.0, verbose_name="총 실행 시간(ms)")
+    max_duration = models.FloatField(default=0.0, verbose_name="최대 실행 시간(ms)")
+    last_seen_at = models.DateTimeField(verbose_name="마지막 기록 일시")
+
+    def __str__(self):
+        return f"[{self.id}]: {self.source or self.view} ({self.calls} calls, max {self.max_duration:.1f}ms)"
+
+    class Meta:
+        db_table = "slow_query"
+        verbose_name = "slow query"
+        verbose_name_plural = "slow queries"
+        indexes = [
+            models.Index(fields=["total_duration"], name="slow_query_total_duration_idx"),
+        ]
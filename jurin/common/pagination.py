@@ -1,7 +1,23 @@
+import base64
+import binascii
+import hashlib
+import json
 from collections import OrderedDict
+from typing import Optional
 
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.db.models.query import QuerySet
+from rest_framework.pagination import BasePagination
 from rest_framework.pagination import LimitOffsetPagination as _LimitOffsetPagination
+from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from jurin.common.compiled_serializers import compile_serializer
+from jurin.common.exception.exceptions import InvalidParameterFormatException
 
 
 def get_paginated_data(*, pagination_class, serializer_class, queryset, request, view):
@@ -16,20 +32,77 @@ def get_paginated_data(*, pagination_class, serializer_class, queryset, request,
         view (View): View 객체입니다.
 
     Returns:
-        serializer.data: 페이징된 데이터를 담는 시리얼라이저 객체입니다.
+        OrderedDict | list: 페이징된 데이터입니다. 시리얼라이저는 컴파일하여 사용합니다. (compile_serializer)
 
     """
     paginator = pagination_class()
+    serialize = compile_serializer(serializer_class)
 
     page = paginator.paginate_queryset(queryset, request, view=view)
 
     if page is not None:
-        serializer = serializer_class(page, many=True)
-        return paginator.get_paginated_data(serializer.data)
+        return paginator.get_paginated_data(serialize(page))
+
+    return serialize(queryset)
+
+
+async def aget_paginated_data(*, pagination_class, serializer_class, queryset, request, view):
+    """
+    이 함수는 get_paginated_data 함수의 비동기 버전으로, 비동기 뷰(AsyncAPIView)에서 사용합니다.
+    쿼리셋은 비동기 ORM으로 조회하며, 페이징 클래스는 apaginate_queryset 함수를 구현해야 합니다.
+
+    Args:
+        pagination_class (class): 페이징 클래스입니다.
+        serializer_class (class): 시리얼라이저 클래스입니다.
+        queryset (QuerySet): 쿼리셋입니다.
+        request (Request): Request 객체입니다.
+        view (View): View 객체입니다.
+
+    Returns:
+        OrderedDict | list: 페이징된 데이터입니다.
+    """
+    paginator = pagination_class()
+    serialize = compile_serializer(serializer_class)
+
+    page = await paginator.apaginate_queryset(queryset, request, view=view)
+
+    if page is not None:
+        return paginator.get_paginated_data(serialize(page))
+
+    return serialize([obj async for obj in queryset])
+
+
+def encode_cursor(values: list) -> str:
+    """
+    이 함수는 키셋 페이징의 마지막 위치 값을 불투명한 커서 문자열로 변환합니다.
+
+    Args:
+        values (list): 정렬 기준 컬럼들의 마지막 위치 값입니다.
+    Returns:
+        str: 커서 문자열입니다.
+    """
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":"), cls=DjangoJSONEncoder).encode()).decode()
 
-    serializer = serializer_class(queryset, many=True)
 
-    return serializer.data
+def decode_cursor(cursor: str) -> list:
+    """
+    이 함수는 커서 문자열을 키셋 페이징의 마지막 위치 값으로 변환합니다.
+
+    Args:
+        cursor (str): 커서 문자열입니다.
+    Returns:
+        list: 정렬 기준 컬럼들의 마지막 위치 값입니다.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+
+    except (ValueError, binascii.Error):
+        raise InvalidParameterFormatException("Cursor is invalid.")
+
+    if not isinstance(values, list):
+        raise InvalidParameterFormatException("Cursor is invalid.")
+
+    return values
 
 
 class LimitOffsetPagination(_LimitOffsetPagination):
@@ -40,6 +113,27 @@ class LimitOffsetPagination(_LimitOffsetPagination):
     default_limit = 10
     max_limit = 50
 
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> Optional[list]:
+        """
+        이 함수는 paginate_queryset 함수의 비동기 버전입니다.
+        """
+        self.request = request
+        self.limit = self.get_limit(request)
+
+        if self.limit is None:
+            return None
+
+        self.count = await queryset.acount()
+        self.offset = self.get_offset(request)
+
+        if self.count > self.limit and self.template is not None:
+            self.display_page_controls = True
+
+        if self.count == 0 or self.offset > self.count:
+            return []
+
+        return [obj async for obj in queryset[self.offset : self.offset + self.limit]]
+
     def get_paginated_data(self, data):
         return OrderedDict(
             [
@@ -65,3 +159,174 @@ class LimitOffsetPagination(_LimitOffsetPagination):
                 ]
             )
         )
+
+
+class CursorPagination(BasePagination):
+    """
+    이 클래스는 정렬 기준 컬럼들의 마지막 위치 값으로 다음 페이지를 조회하는 키셋 페이징 클래스입니다.
+    OFFSET을 사용하지 않으므로 뒤쪽 페이지도 앞쪽 페이지와 같은 속도로 조회됩니다.
+    응답 형식은 LimitOffsetPagination과 같으며, offset과 previous는 항상 None입니다.
+
+    ordering은 NULL이 없는 컬럼이어야 하고, 마지막 컬럼은 고유한 값(id)이어야 합니다.
+    count는 기본적으로 조회하지 않으며(None), count_cache_timeout을 설정하면 조회한 값을 그 시간 동안 캐시합니다.
+    """
+
+    default_limit = 10
+    max_limit = 50
+    limit_query_param = "limit"
+    cursor_query_param = "cursor"
+    ordering = ("-id",)
+    count_cache_timeout = None  # seconds
+
+    COUNT_CACHE_KEY = "pagination:count:{query_hash}"
+
+    def _get_limit(self, request: Request) -> int:
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+
+        except (KeyError, ValueError):
+            return self.default_limit
+
+        if limit <= 0:
+            return self.default_limit
+
+        return min(limit, self.max_limit)
+
+    def _get_cursor_filter(self, values: list) -> Q:
+        """
+        이 내장 함수는 마지막 위치 값 이후의 행을 조회하는 조건을 생성합니다.
+        (a, b) > (x, y) 를 a > x OR (a = x AND b > y) 로 풀어서 컬럼마다 다른 정렬 방향을 지원합니다.
+        """
+        if len(values) != len(self.ordering):
+            raise InvalidParameterFormatException("Cursor is invalid.")
+
+        cursor_filter = Q()
+        equal_filter = Q()
+
+        for ordering, value in zip(self.ordering, values):
+            field_name = ordering.lstrip("-")
+            lookup = "lt" if ordering.startswith("-") else "gt"
+            cursor_filter |= equal_filter & Q(**{f"{field_name}__{lookup}": value})
+            equal_filter &= Q(**{field_name: value})
+
+        return cursor_filter
+
+    def _get_position(self, obj) -> list:
+        """
+        이 내장 함수는 객체의 정렬 기준 컬럼 값들을 조회합니다. (stock__name 처럼 연관 객체의 컬럼도 지원)
+        """
+        values = []
+
+        for ordering in self.ordering:
+            value = obj
+
+            for attr in ordering.lstrip("-").split("__"):
+                value = getattr(value, attr)
+
+            values.append(value)
+
+        return values
+
+    def _get_count(self, queryset: QuerySet) -> Optional[int]:
+        """
+        이 내장 함수는 전체 개수를 조회합니다. 캐시 시간이 설정되지 않으면 조회하지 않습니다.
+        """
+        if self.count_cache_timeout is None:
+            return None
+
+        cache_key = self._get_count_cache_key(queryset)
+        count = cache.get(cache_key)
+
+        if count is None:
+            count = queryset.count()
+            cache.set(cache_key, count, timeout=self.count_cache_timeout)
+
+        return count
+
+    async def _aget_count(self, queryset: QuerySet) -> Optional[int]:
+        if self.count_cache_timeout is None:
+            return None
+
+        cache_key = self._get_count_cache_key(queryset)
+        count = await cache.aget(cache_key)
+
+        if count is None:
+            count = await queryset.acount()
+            await cache.aset(cache_key, count, timeout=self.count_cache_timeout)
+
+        return count
+
+    def _get_count_cache_key(self, queryset: QuerySet) -> str:
+        sql, params = queryset.query.sql_with_params()
+        query_hash = hashlib.md5(f"{sql}{params}".encode()).hexdigest()
+        return self.COUNT_CACHE_KEY.format(query_hash=query_hash)
+
+    def _get_page_queryset(self, queryset: QuerySet, request: Request) -> QuerySet:
+        """
+        이 내장 함수는 커서 다음 위치부터 limit + 1개를 조회하는 쿼리셋을 생성합니다. (다음 페이지가 있는지 확인하기 위해 하나 더 조회)
+        """
+        queryset = queryset.order_by(*self.ordering)
+        cursor = request.query_params.get(self.cursor_query_param)
+
+        if cursor:
+            try:
+                queryset = queryset.filter(self._get_cursor_filter(decode_cursor(cursor)))
+
+            except (ValidationError, ValueError, TypeError):
+                raise InvalidParameterFormatException("Cursor is invalid.")
+
+        return queryset[: self.limit + 1]
+
+    def _get_page(self, page: list) -> list:
+        self.next_cursor = None
+
+        if len(page) > self.limit:
+            page = page[: self.limit]
+            self.next_cursor = encode_cursor(self._get_position(page[-1]))
+
+        return page
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> list:
+        self.request = request
+        self.limit = self._get_limit(request)
+        self.offset = None
+        self.count = self._get_count(queryset)
+
+        return self._get_page(list(self._get_page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> list:
+        """
+        이 함수는 paginate_queryset 함수의 비동기 버전입니다.
+        """
+        self.request = request
+        self.limit = self._get_limit(request)
+        self.offset = None
+        self.count = await self._aget_count(queryset)
+
+        return self._get_page([obj async for obj in self._get_page_queryset(queryset, request)])
+
+    def get_next_link(self) -> Optional[str]:
+        if self.next_cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_previous_link(self) -> Optional[str]:
+        return None
+
+    def get_paginated_data(self, data):
+        return OrderedDict(
+            [
+                ("limit", self.limit),
+                ("offset", self.offset),
+                ("count", self.count),
+                ("next", self.get_next_link()),
+                ("previous", self.get_previous_link()),
+                ("results", data),
+            ]
+        )
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
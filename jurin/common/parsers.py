@@ -0,0 +1,35 @@
+import json
+
+from django.conf import settings
+from djangorestframework_camel_case.parser import (
+    CamelCaseJSONParser as _CamelCaseJSONParser,
+)
+from djangorestframework_camel_case.util import underscoreize as _underscoreize
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from jurin.common.utils import underscoreize
+
+
+class CamelCaseJSONParser(JSONParser):
+    """
+    이 클래스는 djangorestframework_camel_case의 CamelCaseJSONParser를 대체하는 파서입니다.
+    키 변환 결과를 재사용하며, ignore_fields, ignore_keys 설정이 있으면 기존 underscoreize를 사용합니다.
+    """
+
+    json_underscoreize = _CamelCaseJSONParser.json_underscoreize
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            data = json.loads(stream.read().decode(encoding))
+
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+        if self.json_underscoreize.get("ignore_fields") or self.json_underscoreize.get("ignore_keys"):
+            return _underscoreize(data, **self.json_underscoreize)
+
+        return underscoreize(data)
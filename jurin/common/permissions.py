@@ -5,6 +5,42 @@ from rest_framework.views import APIView
 from jurin.users.enums import UserRole
 
 
+def get_user_role_id(request: Request) -> int:
+    """
+    이 함수는 요청한 유저의 권한 아이디를 반환합니다.
+    인증 시 검증된 토큰의 권한 정보를 사용하므로 쿼리가 발생하지 않습니다.
+    권한 정보가 없는 이전 토큰인 경우에만 유저의 그룹을 조회합니다.
+
+    Args:
+        request (Request): Request 객체입니다.
+    Returns:
+        int: 유저의 권한 아이디입니다.
+    """
+    user_role = request.auth.get("user_role") if request.auth is not None else None
+
+    if user_role is not None:
+        return user_role["id"]
+
+    return request.user.groups.first().id
+
+
+async def aget_user_role_id(request: Request) -> int:
+    """
+    이 함수는 get_user_role_id 함수의 비동기 버전으로, 비동기 뷰(AsyncAPIView)의 권한 확인에 사용합니다.
+
+    Args:
+        request (Request): Request 객체입니다.
+    Returns:
+        int: 유저의 권한 아이디입니다.
+    """
+    user_role = request.auth.get("user_role") if request.auth is not None else None
+
+    if user_role is not None:
+        return user_role["id"]
+
+    return (await request.user.groups.afirst()).id
+
+
 class TeacherPermission(permissions.BasePermission):
     def has_permission(self, request: Request, view: APIView):
         """
@@ -17,7 +53,7 @@ class TeacherPermission(permissions.BasePermission):
             bool: 유저의 권한이 선생님이면 True, 아니면 False를 반환합니다.
         """
         try:
-            if request.user.groups.first().id == UserRole.TEACHER.value:
+            if get_user_role_id(request) == UserRole.TEACHER.value:
                 return True
 
             return False
@@ -25,6 +61,13 @@ class TeacherPermission(permissions.BasePermission):
         except Exception:
             return False
 
+    async def ahas_permission(self, request: Request, view: APIView):
+        try:
+            return await aget_user_role_id(request) == UserRole.TEACHER.value
+
+        except Exception:
+            return False
+
 
 class StudentPermission(permissions.BasePermission):
     def has_permission(self, request: Request, view: APIView):
@@ -38,10 +81,17 @@ class StudentPermission(permissions.BasePermission):
             bool: 유저의 권한이 학생이면 True, 아니면 False를 반환합니다.
         """
         try:
-            if request.user.groups.first().id == UserRole.STUDENT.value:
+            if get_user_role_id(request) == UserRole.STUDENT.value:
                 return True
 
             return False
 
         except Exception:
             return False
+
+    async def ahas_permission(self, request: Request, view: APIView):
+        try:
+            return await aget_user_role_id(request) == UserRole.STUDENT.value
+
+        except Exception:
+            return False
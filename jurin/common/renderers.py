@@ -0,0 +1,26 @@
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as _CamelCaseJSONRenderer,
+)
+from djangorestframework_camel_case.util import camelize as _camelize
+from rest_framework.renderers import JSONRenderer
+
+from jurin.common.utils import camelize
+
+
+class CamelCaseJSONRenderer(JSONRenderer):
+    """
+    이 클래스는 djangorestframework_camel_case의 CamelCaseJSONRenderer를 대체하는 렌더러입니다.
+    키 변환 결과를 재사용하여 같은 응답을 더 빠르게 만들며, JSON 인코딩은 기존과 같이 표준 라이브러리의 C 인코더를 사용합니다.
+    ignore_fields, ignore_keys 설정이 있으면 기존 camelize를 사용합니다.
+    """
+
+    json_underscoreize = _CamelCaseJSONRenderer.json_underscoreize
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if self.json_underscoreize.get("ignore_fields") or self.json_underscoreize.get("ignore_keys"):
+            data = _camelize(data, **self.json_underscoreize)
+
+        else:
+            data = camelize(data)
+
+        return super().render(data, accepted_media_type, renderer_context)
@@ -0,0 +1,205 @@
+import hashlib
+import os
+import random
+import re
+import sys
+import time
+from contextlib import ExitStack
+from typing import Optional
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, connections, transaction
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import Greatest
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+
+import jurin
+from config.django.base import logger
+from jurin.common.models import SlowQuery
+
+JURIN_DIRECTORY = os.path.dirname(jurin.__file__) + os.sep
+SELECTORS_DIRECTORY = f"{os.sep}selectors{os.sep}"
+# 쿼리 실행 위치를 찾을 때 건너뛸 계측 모듈
+INSTRUMENTATION_FILES = {__file__, os.path.join(JURIN_DIRECTORY, "common", "metrics.py")}
+
+_STRING_PATTERN = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER_PATTERN = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_PATTERN = re.compile(r"\bIN \(\?(?:, \?)*\)", re.IGNORECASE)
+_VALUES_LIST_PATTERN = re.compile(r"\(\?(?:, \?)*\)(?:, \(\?(?:, \?)*\))+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def fingerprint_sql(sql: str) -> str:
+    """
+    이 함수는 SQL을 핑거프린트로 정규화합니다.
+    문자열, 숫자, 파라미터 자리를 ?로 바꾸고, IN 목록과 여러 행의 VALUES 목록은 개수와 관계없이 하나로 합칩니다.
+
+    Args:
+        sql (str): SQL입니다.
+    Returns:
+        str: 정규화된 SQL입니다.
+    """
+    fingerprint = _WHITESPACE_PATTERN.sub(" ", sql).strip()
+    fingerprint = _STRING_PATTERN.sub("?", fingerprint)
+    fingerprint = _NUMBER_PATTERN.sub("?", fingerprint.replace("%s", "?"))
+    fingerprint = _IN_LIST_PATTERN.sub("IN (...)", fingerprint)
+    return _VALUES_LIST_PATTERN.sub("(...)", fingerprint)
+
+
+def _find_source() -> str:
+    """
+    이 내장 함수는 호출 스택에서 쿼리를 실행한 셀렉터 메소드를 찾습니다.
+    셀렉터가 쿼리셋만 반환하고 다른 곳에서 평가된 경우처럼 셀렉터가 스택에 없으면, 가장 가까운 프로젝트 코드(서비스, API, 시리얼라이저)를 반환합니다.
+    """
+    frame = sys._getframe(1)
+    nearest_source = ""
+
+    while frame is not None:
+        filename = frame.f_code.co_filename
+
+        if filename.startswith(JURIN_DIRECTORY) and filename not in INSTRUMENTATION_FILES:
+            source = f"{frame.f_globals.get('__name__')}.{frame.f_code.co_qualname}"
+
+            if SELECTORS_DIRECTORY in filename:
+                return source
+
+            nearest_source = nearest_source or source
+
+        frame = frame.f_back
+
+    return nearest_source
+
+
+def _get_view_name(request: HttpRequest) -> str:
+    resolver_match = getattr(request, "resolver_match", None)
+
+    if resolver_match is None:
+        return ""
+
+    view = getattr(resolver_match.func, "view_class", resolver_match.func)
+    return f"{request.method} {view.__module__}.{view.__qualname__}"
+
+
+def _explain(alias: str, sql: str, params: Optional[tuple]) -> str:
+    """
+    이 내장 함수는 SELECT 쿼리의 실행 계획을 조회합니다. 실패해도 요청 트랜잭션에 영향을 주지 않도록 세이브포인트 안에서 실행합니다.
+    """
+    if params is None or not sql.lstrip().upper().startswith("SELECT"):
+        return ""
+
+    connection = connections[alias]
+
+    try:
+        with transaction.atomic(using=alias), connection.cursor() as cursor:
+            cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+            return "\n".join(" | ".join(str(column) for column in row) for row in cursor.fetchall())
+
+    except DatabaseError as e:
+        return f"EXPLAIN failed: {e}"
+
+
+def record_slow_query(alias: str, sql: str, params: Optional[tuple], duration: float, view: str, source: str):
+    """
+    이 함수는 느린 쿼리를 (핑거프린트, 뷰, 실행 위치)별로 누적합니다.
+    처음 기록되는 핑거프린트만 EXPLAIN을 실행하고, 기록이 SLOW_QUERY_TOP_N개를 넘으면 총 실행 시간이 가장 작은 기록부터 삭제합니다.
+
+    Args:
+        alias (str): 쿼리를 실행한 데이터베이스 별칭입니다.
+        sql (str): SQL입니다.
+        params (Optional[tuple]): SQL 파라미터입니다. executemany로 실행한 쿼리는 None입니다.
+        duration (float): 실행 시간(ms)입니다.
+        view (str): 쿼리를 실행한 뷰입니다.
+        source (str): 쿼리를 실행한 셀렉터 메소드 또는 코드 위치입니다.
+    """
+    fingerprint = fingerprint_sql(sql)
+    fingerprint_key = hashlib.sha256(f"{fingerprint}\n{view}\n{source}".encode()).hexdigest()
+    now = timezone.now()
+
+    def update_slow_query() -> int:
+        return SlowQuery.objects.filter(fingerprint_key=fingerprint_key).update(
+            calls=F("calls") + 1,
+            total_duration=F("total_duration") + duration,
+            max_duration=Greatest("max_duration", Value(duration, output_field=FloatField())),
+            last_seen_at=now,
+        )
+
+    if update_slow_query() > 0:
+        return
+
+    # 같은 핑거프린트의 실행 계획이 이미 있으면 재사용
+    explain = SlowQuery.objects.filter(fingerprint=fingerprint).exclude(explain="").values_list("explain", flat=True).first()
+
+    if explain is None:
+        explain = _explain(alias, sql, params)
+
+    try:
+        with transaction.atomic():
+            SlowQuery.objects.create(
+                fingerprint_key=fingerprint_key,
+                fingerprint=fingerprint,
+                view=view[:255],
+                source=source[:255],
+                sample_sql=sql,
+                explain=explain,
+                calls=1,
+                total_duration=duration,
+                max_duration=duration,
+                last_seen_at=now,
+            )
+
+    except IntegrityError:
+        # 다른 워커가 먼저 생성한 경우
+        update_slow_query()
+        return
+
+    stale_ids = list(SlowQuery.objects.order_by("-total_duration", "-id").values_list("id", flat=True)[settings.SLOW_QUERY_TOP_N :])
+
+    if stale_ids:
+        SlowQuery.objects.filter(id__in=stale_ids).delete()
+
+
+class SlowQueryMiddleware:
+    """
+    이 클래스는 요청 중 실행 시간이 SLOW_QUERY_THRESHOLD(ms) 이상인 쿼리를 SLOW_QUERY_SAMPLE_RATE 비율로 수집하고,
+    응답이 끝난 후 뷰와 셀렉터 메소드별로 SlowQuery에 기록하는 미들웨어입니다.
+    기록은 요청의 쿼리가 모두 끝난 후에 하므로 요청의 트랜잭션과 락에 영향을 주지 않습니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        slow_queries = []
+
+        def record_query(execute, sql, params, many, context):
+            started_at = time.perf_counter()
+
+            try:
+                return execute(sql, params, many, context)
+
+            finally:
+                duration = (time.perf_counter() - started_at) * 1000
+
+                if duration >= settings.SLOW_QUERY_THRESHOLD and random.random() < settings.SLOW_QUERY_SAMPLE_RATE:
+                    slow_queries.append((context["connection"].alias, sql, None if many else params, duration, _find_source()))
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(record_query))
+
+            response = self.get_response(request)
+
+        if not slow_queries:
+            return response
+
+        view = _get_view_name(request)
+
+        for alias, sql, params, duration, source in slow_queries:
+            try:
+                record_slow_query(alias=alias, sql=sql, params=params, duration=duration, view=view, source=source)
+
+            except DatabaseError as e:
+                logger.warning(f"Failed to record slow query. {e}")
+
+        return response
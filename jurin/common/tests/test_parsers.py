@@ -0,0 +1,38 @@
+import io
+import json
+
+from django.test import SimpleTestCase
+from djangorestframework_camel_case.parser import (
+    CamelCaseJSONParser as LibraryCamelCaseJSONParser,
+)
+from rest_framework.exceptions import ParseError
+
+from jurin.common.parsers import CamelCaseJSONParser
+from jurin.common.tests.test_renderers import read_golden_file
+
+
+class CamelCaseJSONParserTest(SimpleTestCase):
+    """
+    CamelCaseJSONParser가 djangorestframework_camel_case의 파서와 같은 요청 데이터를 만드는지 골든 파일로 확인합니다.
+    파싱 결과는 키 순서를 유지한 JSON으로 변환하여 바이트 단위로 비교합니다.
+    """
+
+    def _parse(self, parser, body: bytes):
+        return parser.parse(io.BytesIO(body), parser_context={"encoding": "utf-8"})
+
+    def test_parse_matches_golden_file(self):
+        body = read_golden_file("parser_input.json")
+        data = self._parse(CamelCaseJSONParser(), body)
+
+        self.assertEqual(json.dumps(data, ensure_ascii=False).encode(), read_golden_file("parser_output.json"))
+
+    def test_parse_matches_library_parser(self):
+        body = read_golden_file("parser_input.json")
+        data = self._parse(CamelCaseJSONParser(), body)
+        library_data = self._parse(LibraryCamelCaseJSONParser(), body)
+
+        self.assertEqual(json.dumps(data, ensure_ascii=False), json.dumps(library_data, ensure_ascii=False))
+
+    def test_parse_invalid_json(self):
+        with self.assertRaises(ParseError):
+            self._parse(CamelCaseJSONParser(), b'{"tradeType": ')
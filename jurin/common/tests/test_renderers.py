@@ -0,0 +1,76 @@
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer,
+)
+
+from jurin.common.renderers import CamelCaseJSONRenderer
+
+GOLDEN_DIRECTORY = Path(__file__).resolve().parent / "golden"
+
+
+def read_golden_file(name: str) -> bytes:
+    """
+    이 함수는 골든 파일을 읽습니다. (end-of-file-fixer가 추가하는 마지막 줄바꿈은 제외)
+    """
+    return (GOLDEN_DIRECTORY / name).read_bytes().removesuffix(b"\n")
+
+
+# 응답 형식(create_response)과 키 변환의 경계 사례(숫자, 밑줄, 대문자, 문자열이 아닌 키)를 포함한 응답 데이터
+RESPONSE_DATA = {
+    "success": True,
+    "code": "request_success",
+    "message": gettext_lazy("Request was successful."),
+    "data": {
+        "count": 2,
+        "next": None,
+        "previous": "http://testserver/students/api/v1/channels/1/stocks?limit=1",
+        "results": [
+            {
+                "id": 1,
+                "name": "주린 전자",
+                "days_range_rate": "-1.25%",
+                "purchase_price": 10000,
+                "tax": 0.1,
+                "trade_date": date(2024, 3, 1),
+                "created_at": datetime(2024, 3, 1, 9, 30, 15, 123456),
+                "transaction_amount": Decimal("12345.60"),
+                "image_url": "https://example.com/images/stock_1.png",
+                "daily_price": [{"trade_date": date(2024, 2, 29), "price": 9800, "volume": 0}],
+            },
+            {
+                "id": 2,
+                "name": 'Jurin "Quote" & <Tag>',
+                "address_line_1": "line",
+                "_private_field": "leading underscore",
+                "already_camelCase": "mixed",
+                "HTTP_status": 200,
+                "is_deleted": False,
+                "empty_dict": {},
+                "empty_list": [],
+                "tuple_value": ("first_value", {"nested_key": 1}),
+                1: "integer key",
+            },
+        ],
+    },
+}
+
+
+class CamelCaseJSONRendererTest(SimpleTestCase):
+    """
+    CamelCaseJSONRenderer가 djangorestframework_camel_case의 렌더러와 바이트 단위로 같은 응답을 만드는지 골든 파일로 확인합니다.
+    """
+
+    def test_render_matches_golden_file(self):
+        rendered = CamelCaseJSONRenderer().render(RESPONSE_DATA)
+
+        self.assertEqual(rendered, read_golden_file("renderer_output.json"))
+
+    def test_render_matches_library_renderer(self):
+        rendered = CamelCaseJSONRenderer().render(RESPONSE_DATA)
+
+        self.assertEqual(rendered, LibraryCamelCaseJSONRenderer().render(RESPONSE_DATA))
@@ -1,5 +1,16 @@
-from typing import Type
+import re
+from functools import lru_cache
+from typing import Any, Type
 
+from django.db.models.query import QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from djangorestframework_camel_case.settings import api_settings as camel_case_settings
+from djangorestframework_camel_case.util import (
+    camel_to_underscore,
+    camelize_re,
+    underscore_to_camel,
+)
 from rest_framework import serializers
 
 
@@ -42,6 +53,109 @@ def inline_serializer(*, fields: dict, data: dict | None = None, **kwargs) -> se
     return serializer_class(**kwargs)
 
 
+######################################################
+# Database utils
+######################################################
+def delete_queryset_in_batches(queryset: QuerySet, batch_size: int = 1000) -> int:
+    """
+    이 함수는 쿼리셋을 기본 키 순서로 일정 개수씩 나누어 삭제합니다.
+    한 번의 삭제가 잠그는 행의 수를 제한하기 위해 사용합니다.
+    연관 객체를 수집하지 않고 바로 삭제하므로, 참조하는 테이블부터 먼저 삭제해야 합니다.
+
+    Args:
+        queryset (QuerySet): 삭제할 쿼리셋입니다.
+        batch_size (int): 한 번에 삭제할 최대 개수입니다.
+    Returns:
+        int: 삭제된 행의 개수입니다.
+    """
+    model = queryset.model
+    deleted_count = 0
+
+    while True:
+        ids = list(queryset.order_by("pk").values_list("pk", flat=True)[:batch_size])
+
+        if not ids:
+            break
+
+        deleted_count += model._base_manager.filter(pk__in=ids)._raw_delete(queryset.db)
+
+    return deleted_count
+
+
+######################################################
+# Camel case utils
+######################################################
+@lru_cache(maxsize=4096)
+def camelize_key(key: str) -> str:
+    """
+    이 함수는 snake_case 키를 camelCase 키로 변환합니다.
+    응답의 키는 대부분 같은 필드 이름이 반복되므로 변환 결과를 저장하여 다시 사용합니다.
+    """
+    if "_" not in key:
+        return key
+
+    return re.sub(camelize_re, underscore_to_camel, key)
+
+
+@lru_cache(maxsize=4096)
+def underscoreize_key(key: str) -> str:
+    """
+    이 함수는 camelCase 키를 snake_case 키로 변환합니다.
+    변환 결과를 저장하여 다시 사용합니다.
+    """
+    return camel_to_underscore(key, no_underscore_before_number=camel_case_settings.JSON_UNDERSCOREIZE.get("no_underscore_before_number"))
+
+
+def camelize(data: Any) -> Any:
+    """
+    이 함수는 djangorestframework_camel_case의 camelize와 같은 결과를 반환하며, 키 변환 결과를 재사용합니다.
+    dict는 OrderedDict 대신 dict로 만들지만 키 순서가 같으므로 JSON으로 변환한 결과는 같습니다.
+    """
+    if isinstance(data, dict):
+        return {(camelize_key(key) if isinstance(key, str) else _camelize_other_key(key)): camelize(value) for key, value in data.items()}
+
+    if isinstance(data, (list, tuple)):
+        return [camelize(item) for item in data]
+
+    if data is None or isinstance(data, (str, int, float)):
+        return data
+
+    if isinstance(data, Promise):
+        return force_str(data)
+
+    try:
+        iterator = iter(data)
+
+    except TypeError:
+        return data
+
+    return [camelize(item) for item in iterator]
+
+
+def _camelize_other_key(key: Any) -> Any:
+    """
+    이 내장 함수는 문자열이 아닌 키를 변환합니다. (지연 번역 문자열은 문자열로 바꾼 후 변환)
+    """
+    if isinstance(key, Promise):
+        return camelize_key(force_str(key))
+
+    return key
+
+
+def underscoreize(data: Any) -> Any:
+    """
+    이 함수는 JSON으로 파싱한 데이터의 키를 snake_case로 변환합니다.
+    djangorestframework_camel_case의 underscoreize와 같은 결과를 반환하며, 키 변환 결과를 재사용합니다.
+    """
+    if isinstance(data, dict):
+        return {(underscoreize_key(key) if isinstance(key, str) else key): underscoreize(value) for key, value in data.items()}
+
+    if isinstance(data, list):
+        return [underscoreize(item) for item in data]
+
+    return data
+
+
 ######################################################
 # Common utils
 ######################################################
@@ -2,9 +2,12 @@ from django.db import transaction
 from django.db.models import F
 from django.utils import timezone
 
-from jurin.channels.models import UserChannel
+from jurin.channels.caches import ChannelResponseCache
+from jurin.channels.enums import PointLogType
+from jurin.channels.models import PointLog, UserChannel
 from jurin.channels.selectors.channels import ChannelSelector
 from jurin.channels.selectors.user_channels import UserChannelSelector
+from jurin.channels.sharding import get_current_channel_shard_database
 from jurin.common.exception.exceptions import NotFoundException, ValidationException
 from jurin.items.models import Item, UserItem, UserItemLog
 from jurin.items.selectors.items import ItemSelector
@@ -18,6 +21,7 @@ class ItemService:
         self.channel_selector = ChannelSelector()
         self.user_channel_selector = UserChannelSelector()
         self.user_item_selector = UserItemSelector()
+        self.channel_response_cache = ChannelResponseCache()
 
     def create_item(self, channel_id: int, title: str, image_url: str, amount: int, price: int, content: str, user: User) -> Item:
         """
@@ -54,6 +58,9 @@ class ItemService:
             channel=channel,
         )
 
+        # 채널 응답 캐시 무효화
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
+
         return item
 
     def update_item(
@@ -98,6 +105,9 @@ class ItemService:
         item.content = content
         item.save()
 
+        # 채널 응답 캐시 무효화
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
+
         return item
 
     def delete_item(self, channel_id: int, item_id: int, user: User):
@@ -130,6 +140,9 @@ class ItemService:
         item.deleted_at = timezone.now()
         item.save(update_fields=["is_deleted", "deleted_at"])
 
+        # 채널 응답 캐시 무효화
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
+
     def delete_items(self, channel_id: int, item_ids: list[int], user: User):
         """
         이 함수는 채널 아이디와 아이템 아이디들과 유저를 받아 검증 후 아이템들을 삭제합니다.
@@ -158,6 +171,9 @@ class ItemService:
         # 아이템들 삭제
         items.update(is_deleted=True, deleted_at=timezone.now())
 
+        # 채널 응답 캐시 무효화
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
+
     def buy_item(self, channel_id: int, item_id: int, price: int, amount: int, user: User) -> Item:
         """
         이 함수는 채널 아이디와 아이템 아이디와 가격과 수량과 유저를 받아 검증 후 아이템을 구매합니다.
@@ -197,11 +213,20 @@ class ItemService:
         if user_channel.point < total_price:
             raise ValidationException("Insufficient points.")
 
-        with transaction.atomic():
+        with transaction.atomic(using=get_current_channel_shard_database()):
             # 유저 포인트 차감 및 아이템 수량 차감
             UserChannel.objects.filter(id=user_channel.id).update(point=F("point") - total_price)
             Item.objects.select_for_update().filter(id=item.id).update(amount=F("amount") - amount)
 
+            # 포인트 차감 내역 기록
+            PointLog.objects.create(
+                user=user,
+                channel_id=channel_id,
+                actor=user,
+                log_type=PointLogType.ITEM_BUY.value,
+                point=-total_price,
+            )
+
             # 유저 아이템이 존재하면 수량 수정, 없으면 생성
             user_item = self.user_item_selector.get_user_item_by_item_id_and_user(item_id=item.id, user=user)
 
@@ -226,6 +251,9 @@ class ItemService:
                 # 아이템 데이터 갱신
                 item.refresh_from_db()
 
+        # 채널 응답 캐시 무효화
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
+
         return item
 
     def use_item(self, item_id: int, amount: int, user: User, channel_id: int) -> UserItem:
@@ -256,7 +284,7 @@ class ItemService:
         if user_item.amount < amount:
             raise ValidationException("The amount of the user item is insufficient.")
 
-        with transaction.atomic():
+        with transaction.atomic(using=get_current_channel_shard_database()):
             # 유저 아이템 수량 차감 및 사용량 증가
             UserItem.objects.filter(id=user_item.id).update(amount=F("amount") - amount, used_amount=F("used_amount") + amount)
 
@@ -274,4 +302,7 @@ class ItemService:
                 used_at=timezone.now(),
             )
 
+        # 채널 응답 캐시 무효화
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
+
         return user_item
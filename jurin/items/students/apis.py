@@ -1,4 +1,4 @@
-from django.db.models import Count
+from django.db.models import Count, QuerySet
 from django.db.models.functions import TruncDate
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import serializers, status
@@ -7,13 +7,20 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from jurin.authentication.services import CustomJWTAuthentication
+from jurin.channels.caches import cache_channel_response
 from jurin.channels.selectors.user_channels import UserChannelSelector
 from jurin.common.base.serializers import BaseResponseSerializer, BaseSerializer
+from jurin.common.base.views import AsyncAPIView, use_swagger_schema_of
 from jurin.common.exception.exceptions import NotFoundException
-from jurin.common.pagination import LimitOffsetPagination, get_paginated_data
+from jurin.common.pagination import (
+    LimitOffsetPagination,
+    aget_paginated_data,
+    get_paginated_data,
+)
 from jurin.common.permissions import StudentPermission
 from jurin.common.response import create_response
 from jurin.common.utils import inline_serializer
+from jurin.items.models import Item
 from jurin.items.selectors.items import ItemSelector
 from jurin.items.selectors.user_item_logs import UserItemLogSelector
 from jurin.items.selectors.user_items import UserItemSelector
@@ -38,6 +45,22 @@ class StudentItemListAPI(APIView):
         amount = serializers.IntegerField()
         price = serializers.IntegerField()
 
+    def get_item_queryset(self, request: Request, channel_id: int) -> QuerySet[Item]:
+        """
+        이 함수는 필터를 검증하고 조회할 채널의 아이템 쿼리셋을 반환합니다. (get의 동기, 비동기 버전에서 함께 사용)
+
+        Args:
+            request (Request): 요청 객체입니다.
+            channel_id (int): 채널 아이디입니다.
+        Returns:
+            QuerySet[Item]: 아이템 쿼리셋입니다.
+        """
+        filter_serializer = self.FilterSerializer(data=request.query_params)
+        filter_serializer.is_valid(raise_exception=True)
+
+        item_selector = ItemSelector()
+        return item_selector.get_undeleted_item_queryset_by_channel_id(channel_id=channel_id)
+
     @swagger_auto_schema(
         tags=["학생-아이템"],
         operation_summary="힉셍 채널 아이템 목록 조회",
@@ -46,6 +69,7 @@ class StudentItemListAPI(APIView):
             status.HTTP_200_OK: BaseResponseSerializer(data_serializer=OutputSerializer, pagination_serializer=True),
         },
     )
+    @cache_channel_response()
     def get(self, request: Request, channel_id: int) -> Response:
         """
         학생 권한의 유저가 채널의 아이템 목록을 조회합니다.
@@ -64,8 +88,7 @@ class StudentItemListAPI(APIView):
                 amount (int): 수량
                 price (int): 가격
         """
-        filter_serializer = self.FilterSerializer(data=request.query_params)
-        filter_serializer.is_valid(raise_exception=True)
+        items = self.get_item_queryset(request=request, channel_id=channel_id)
 
         # 유저 채널이 존재하는지 검증
         user_channel_selector = UserChannelSelector()
@@ -74,8 +97,6 @@ class StudentItemListAPI(APIView):
         if user_channel is None:
             raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
 
-        item_selector = ItemSelector()
-        items = item_selector.get_undeleted_item_queryset_by_channel_id(channel_id=channel_id)
         pagination_items_data = get_paginated_data(
             pagination_class=self.Pagination,
             serializer_class=self.OutputSerializer,
@@ -86,6 +107,35 @@ class StudentItemListAPI(APIView):
         return create_response(pagination_items_data, status_code=status.HTTP_200_OK)
 
 
+class StudentItemListAsyncAPI(AsyncAPIView, StudentItemListAPI):
+    @use_swagger_schema_of(StudentItemListAPI.get)
+    @cache_channel_response()
+    async def get(self, request: Request, channel_id: int) -> Response:
+        """
+        StudentItemListAPI의 비동기 버전입니다. (ASGI 서버에서 사용)
+        url: /students/api/v1/channels/<int:channel_id>/items
+        """
+        items = self.get_item_queryset(request=request, channel_id=channel_id)
+
+        # 유저 채널이 존재하는지 검증
+        user_channel_selector = UserChannelSelector()
+        user_channel = await user_channel_selector.aget_user_channel_by_channel_id_and_user_for_student(
+            user=request.user, channel_id=channel_id
+        )
+
+        if user_channel is None:
+            raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
+
+        pagination_items_data = await aget_paginated_data(
+            pagination_class=self.Pagination,
+            serializer_class=self.OutputSerializer,
+            queryset=items,
+            request=request,
+            view=self,
+        )
+        return create_response(pagination_items_data, status_code=status.HTTP_200_OK)
+
+
 class StudentDetailAPI(APIView):
     authentication_classes = (CustomJWTAuthentication,)
     permission_classes = (StudentPermission,)
@@ -1,15 +1,18 @@
+from django.conf import settings
 from django.urls import path
 
 from jurin.items.students.apis import (
     StudentDetailAPI,
     StudentItemListAPI,
+    StudentItemListAsyncAPI,
     StudentMyItemDetailAPI,
     StudentMyItemDetailLogAPI,
     StudentMyItemListAPI,
 )
 
+# ASGI 서버에서는 폴링이 많은 학생 조회 API를 비동기 뷰로 제공
 urlpatterns = [
-    path("", StudentItemListAPI.as_view(), name="student_item_list"),
+    path("", (StudentItemListAsyncAPI if settings.ASYNC_READ_APIS_ENABLED else StudentItemListAPI).as_view(), name="student_item_list"),
     path("/<int:item_id>", StudentDetailAPI.as_view(), name="student_item_detail"),
     path("/mine", StudentMyItemListAPI.as_view(), name="student_item_mine_list"),
     path("/mine/<int:item_id>", StudentMyItemDetailAPI.as_view(), name="student_mine_item_detail"),
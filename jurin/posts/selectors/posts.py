@@ -38,6 +38,24 @@ class PostSelector:
         except Post.DoesNotExist:
             return None
 
+    async def aget_post_by_id_and_channel_id(self, post_id: int, channel_id: int) -> Optional[Post]:
+        """
+        이 함수는 get_post_by_id_and_channel_id 함수의 비동기 버전입니다.
+
+        Args:
+            post_id (int): 게시물 아이디입니다.
+            channel_id (int): 채널 아이디입니다.
+        Returns:
+            Optional[Post]: 게시물 모델입니다. 없을 경우 None입니다.
+        """
+        try:
+            return await Post.objects.filter(
+                id=post_id,
+                channel_id=channel_id,
+            ).aget()
+        except Post.DoesNotExist:
+            return None
+
     def get_post_queryset_by_ids_and_channel_id(self, post_ids: list[int], channel_id: int) -> QuerySet[Post]:
         """
         이 함수는 채널 아이디로 게시물들을 조회합니다.
@@ -1,3 +1,4 @@
+from jurin.channels.caches import ChannelResponseCache
 from jurin.channels.selectors.channels import ChannelSelector
 from jurin.common.exception.exceptions import NotFoundException
 from jurin.posts.models import Post
@@ -9,6 +10,7 @@ class PostService:
     def __init__(self):
         self.post_selector = PostSelector()
         self.channel_selector = ChannelSelector()
+        self.channel_response_cache = ChannelResponseCache()
 
     def create_post(self, user: User, channel_id: int, main_title: str, sub_title: str, content: str, date: str) -> Post:
         """
@@ -38,6 +40,9 @@ class PostService:
             channel=channel,
         )
 
+        # 채널 응답 캐시 무효화
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
+
         return post
 
     def update_post(self, user: User, post_id: int, channel_id: int, main_title: str, sub_title: str, content: str, date: str) -> Post:
@@ -73,6 +78,9 @@ class PostService:
         post.content = content
         post.save()
 
+        # 채널 응답 캐시 무효화
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
+
         return post
 
     def delete_post(self, user: User, post_id: int, channel_id: int):
@@ -99,6 +107,9 @@ class PostService:
         # 게시글 삭제
         post.delete()
 
+        # 채널 응답 캐시 무효화
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
+
     def delete_posts(self, user: User, channel_id: int, post_ids: list[int]):
         """
         이 함수는 채널과 게시글이 존재하는지 검증 후 채널의 게시글들을 삭제합니다
@@ -121,3 +132,6 @@ class PostService:
 
         # 게시글들 삭제
         posts.delete()
+
+        # 채널 응답 캐시 무효화
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
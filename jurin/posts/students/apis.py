@@ -1,3 +1,4 @@
+from django.db.models import QuerySet
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import serializers, status
 from rest_framework.request import Request
@@ -5,12 +6,19 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from jurin.authentication.services import CustomJWTAuthentication
+from jurin.channels.caches import cache_channel_response
 from jurin.channels.selectors.user_channels import UserChannelSelector
 from jurin.common.base.serializers import BaseResponseSerializer, BaseSerializer
+from jurin.common.base.views import AsyncAPIView, use_swagger_schema_of
 from jurin.common.exception.exceptions import NotFoundException
-from jurin.common.pagination import LimitOffsetPagination, get_paginated_data
+from jurin.common.pagination import (
+    LimitOffsetPagination,
+    aget_paginated_data,
+    get_paginated_data,
+)
 from jurin.common.permissions import StudentPermission
 from jurin.common.response import create_response
+from jurin.posts.models import Post
 from jurin.posts.selectors.posts import PostSelector
 
 
@@ -31,6 +39,22 @@ class StudentPostListAPI(APIView):
         sub_title = serializers.CharField()
         date = serializers.DateField()
 
+    def get_post_queryset(self, request: Request, channel_id: int) -> QuerySet[Post]:
+        """
+        이 함수는 필터를 검증하고 조회할 채널의 게시글 쿼리셋을 반환합니다. (get의 동기, 비동기 버전에서 함께 사용)
+
+        Args:
+            request (Request): 요청 객체입니다.
+            channel_id (int): 채널 아이디입니다.
+        Returns:
+            QuerySet[Post]: 게시글 쿼리셋입니다.
+        """
+        filter_serializer = self.FilterSerializer(data=request.query_params)
+        filter_serializer.is_valid(raise_exception=True)
+
+        post_selector = PostSelector()
+        return post_selector.get_recent_posts_queryset_by_channel_id(channel_id=channel_id)
+
     @swagger_auto_schema(
         tags=["학생-게시글"],
         operation_summary="학생 채널 게시글 목록 조회",
@@ -39,6 +63,7 @@ class StudentPostListAPI(APIView):
             status.HTTP_200_OK: BaseResponseSerializer(data_serializer=OutputSerializer, pagination_serializer=True),
         },
     )
+    @cache_channel_response()
     def get(self, request: Request, channel_id: int) -> Response:
         """
         학생 권한의 유저가 채널의 게시글 목록을 조회합니다.
@@ -56,8 +81,7 @@ class StudentPostListAPI(APIView):
                 sub_title (str): 서브 제목
                 date (date): 날짜
         """
-        filter_serializer = self.FilterSerializer(data=request.query_params)
-        filter_serializer.is_valid(raise_exception=True)
+        posts = self.get_post_queryset(request=request, channel_id=channel_id)
 
         # 유저 채널이 존재하는지 검증
         user_channel_selector = UserChannelSelector()
@@ -69,8 +93,6 @@ class StudentPostListAPI(APIView):
         if user_channel is None:
             raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
 
-        post_selector = PostSelector()
-        posts = post_selector.get_recent_posts_queryset_by_channel_id(channel_id=channel_id)
         pagination_posts_data = get_paginated_data(
             pagination_class=self.Pagination,
             serializer_class=self.OutputSerializer,
@@ -81,6 +103,36 @@ class StudentPostListAPI(APIView):
         return create_response(pagination_posts_data, status_code=status.HTTP_200_OK)
 
 
+class StudentPostListAsyncAPI(AsyncAPIView, StudentPostListAPI):
+    @use_swagger_schema_of(StudentPostListAPI.get)
+    @cache_channel_response()
+    async def get(self, request: Request, channel_id: int) -> Response:
+        """
+        StudentPostListAPI의 비동기 버전입니다. (ASGI 서버에서 사용)
+        url: /students/api/v1/channels/<int:channel_id>/posts
+        """
+        posts = self.get_post_queryset(request=request, channel_id=channel_id)
+
+        # 유저 채널이 존재하는지 검증
+        user_channel_selector = UserChannelSelector()
+        user_channel = await user_channel_selector.aget_user_channel_by_channel_id_and_user_for_student(
+            channel_id=channel_id,
+            user=request.user,
+        )
+
+        if user_channel is None:
+            raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
+
+        pagination_posts_data = await aget_paginated_data(
+            pagination_class=self.Pagination,
+            serializer_class=self.OutputSerializer,
+            queryset=posts,
+            request=request,
+            view=self,
+        )
+        return create_response(pagination_posts_data, status_code=status.HTTP_200_OK)
+
+
 class StudentPostDetailAPI(APIView):
     authentication_classes = (CustomJWTAuthentication,)
     permission_classes = (StudentPermission,)
@@ -99,6 +151,7 @@ class StudentPostDetailAPI(APIView):
             status.HTTP_200_OK: BaseResponseSerializer(data_serializer=OutputSerializer),
         },
     )
+    @cache_channel_response()
     def get(self, request: Request, channel_id: int, post_id: int) -> Response:
         """
         학생 권한의 유저가 채널의 게시글 상세를 조회합니다.
@@ -133,3 +186,31 @@ class StudentPostDetailAPI(APIView):
 
         output_serializer = self.OutputSerializer(post)
         return create_response(output_serializer.data, status_code=status.HTTP_200_OK)
+
+
+class StudentPostDetailAsyncAPI(AsyncAPIView, StudentPostDetailAPI):
+    @use_swagger_schema_of(StudentPostDetailAPI.get)
+    @cache_channel_response()
+    async def get(self, request: Request, channel_id: int, post_id: int) -> Response:
+        """
+        StudentPostDetailAPI의 비동기 버전입니다. (ASGI 서버에서 사용)
+        url: /students/api/v1/channels/<int:channel_id>/posts/<int:post_id>
+        """
+        # 유저 채널이 존재하는지 검증
+        user_channel_selector = UserChannelSelector()
+        user_channel = await user_channel_selector.aget_user_channel_by_channel_id_and_user_for_student(
+            channel_id=channel_id,
+            user=request.user,
+        )
+
+        if user_channel is None:
+            raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
+
+        post_selector = PostSelector()
+        post = await post_selector.aget_post_by_id_and_channel_id(post_id=post_id, channel_id=channel_id)
+
+        if post is None:
+            raise NotFoundException(detail="Post does not exist.", code="not_post")
+
+        output_serializer = self.OutputSerializer(post)
+        return create_response(output_serializer.data, status_code=status.HTTP_200_OK)
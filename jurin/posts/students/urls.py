@@ -1,8 +1,19 @@
+from django.conf import settings
 from django.urls import path
 
-from jurin.posts.students.apis import StudentPostDetailAPI, StudentPostListAPI
+from jurin.posts.students.apis import (
+    StudentPostDetailAPI,
+    StudentPostDetailAsyncAPI,
+    StudentPostListAPI,
+    StudentPostListAsyncAPI,
+)
 
+# ASGI 서버에서는 폴링이 많은 학생 조회 API를 비동기 뷰로 제공
 urlpatterns = [
-    path("", StudentPostListAPI.as_view(), name="student_post_list"),
-    path("/<int:post_id>", StudentPostDetailAPI.as_view(), name="student_post_detail"),
+    path("", (StudentPostListAsyncAPI if settings.ASYNC_READ_APIS_ENABLED else StudentPostListAPI).as_view(), name="student_post_list"),
+    path(
+        "/<int:post_id>",
+        (StudentPostDetailAsyncAPI if settings.ASYNC_READ_APIS_ENABLED else StudentPostDetailAPI).as_view(),
+        name="student_post_detail",
+    ),
 ]
@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from jurin.authentication.services import CustomJWTAuthentication
+from jurin.channels.caches import cache_channel_response
 from jurin.channels.selectors.channels import ChannelSelector
 from jurin.common.base.serializers import BaseResponseSerializer, BaseSerializer
 from jurin.common.exception.exceptions import NotFoundException
@@ -40,6 +41,7 @@ class TeacherPostListAPI(APIView):
             status.HTTP_200_OK: BaseResponseSerializer(data_serializer=OutputSerializer, pagination_serializer=True),
         },
     )
+    @cache_channel_response()
     def get(self, request: Request, channel_id: int) -> Response:
         """
         선생님 권한의 유저가 채널의 게시글 목록을 조회합니다.
@@ -173,6 +175,7 @@ class TeacherPostDetailAPI(APIView):
             status.HTTP_200_OK: BaseResponseSerializer(data_serializer=OutputSerializer),
         },
     )
+    @cache_channel_response()
     def get(self, request: Request, channel_id: int, post_id: int) -> Response:
         """
         선생님 권한의 유저가 채널의 게시글 상세를 조회합니다.
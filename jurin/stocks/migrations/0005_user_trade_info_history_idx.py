@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0004_alter_stock_standard'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usertradeinfo',
+            index=models.Index(fields=['user', 'stock', 'trade_date', 'id'], name='user_trade_info_history_idx'),
+        ),
+    ]
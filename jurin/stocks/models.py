@@ -61,6 +61,9 @@ class UserTradeInfo(BaseModel):
         db_table = "user_trade_info"
         verbose_name = "user trade info"
         verbose_name_plural = "user trade infos"
+        indexes = [
+            models.Index(fields=["user", "stock", "trade_date", "id"], name="user_trade_info_history_idx"),
+        ]
 
 
 class UserStock(BaseModel):
@@ -24,6 +24,24 @@ class StockSelector:
         except Stock.DoesNotExist:
             return None
 
+    async def aget_stock_by_id_and_channel_id(self, stock_id: int, channel_id: int) -> Optional[Stock]:
+        """
+        이 함수는 get_stock_by_id_and_channel_id 함수의 비동기 버전입니다.
+
+        Args:
+            stock_id (int): 주식 종목 아이디
+            channel_id (int): 채널 아이디
+        Returns:
+            Optional[Stock]: 주식 종목 모델입니다. 없을 경우 None입니다.
+        """
+        try:
+            return await Stock.objects.filter(
+                id=stock_id,
+                channel_id=channel_id,
+            ).aget()
+        except Stock.DoesNotExist:
+            return None
+
     def get_stock_queryset_by_channel_id(self, channel_id: int) -> QuerySet[Stock]:
         """
         이 함수는 채널 아이디를 받아 주식 종목 쿼리셋을 조회합니다.
@@ -5,14 +5,25 @@ from django.db.models import F, Sum
 from django.utils import timezone
 
 from config.django.base import logger
+from jurin.channels.caches import ChannelResponseCache
+from jurin.channels.enums import PointLogType
+from jurin.channels.models import PointLog
 from jurin.channels.selectors.channels import ChannelSelector
 from jurin.channels.selectors.user_channels import UserChannelSelector
+from jurin.channels.sharding import (
+    get_channel_shard,
+    get_channel_shard_databases,
+    get_current_channel_shard_database,
+    use_channel_shard,
+)
+from jurin.common.db_routers import use_replica
 from jurin.common.exception.exceptions import NotFoundException, ValidationException
 from jurin.stocks.enums import TradeType
 from jurin.stocks.models import DailyPrice, Stock, UserStock, UserTradeInfo
 from jurin.stocks.selectors.stocks import StockSelector
 from jurin.stocks.selectors.user_stocks import UserStockSelector
 from jurin.stocks.selectors.user_trade_infos import UserTradeInfoSelector
+from jurin.stocks.streams import publish_stock_event
 from jurin.stocks.tasks import updatae_stock_purchase_price_task
 from jurin.users.models import User
 
@@ -24,6 +35,7 @@ class StockService:
         self.user_stock_selector = UserStockSelector()
         self.user_channel_selector = UserChannelSelector()
         self.user_trade_info_selector = UserTradeInfoSelector()
+        self.channel_response_cache = ChannelResponseCache()
 
     def create_stock(
         self,
@@ -70,6 +82,10 @@ class StockService:
             standard=standard,
             content=content,
         )
+
+        # 주식 종목 생성 이벤트 발행 및 채널 응답 캐시 무효화
+        self._publish_stock_event(channel_id=channel_id, event="stock_created", stock=stock)
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
         return stock
 
     def update_stock(
@@ -116,7 +132,7 @@ class StockService:
         if stock is None:
             raise NotFoundException(detail="Stock does not exist.", code="not_stock")
 
-        with transaction.atomic():
+        with transaction.atomic(using=get_current_channel_shard_database()):
             # 주식 종목 수정
             stock.name = name
             stock.tax = tax
@@ -146,6 +162,10 @@ class StockService:
                 # 주식 기준 업데이트
                 stock.standard = standard
             stock.save()
+
+            # 주식 종목 수정 이벤트 발행 및 채널 응답 캐시 무효화 (커밋 후)
+            self._publish_stock_event(channel_id=channel_id, event="stock_updated", stock=stock)
+            self.channel_response_cache.bump_generation(channel_id=channel_id)
         return stock
 
     def delete_stock(self, stock_id: int, user: User, channel_id: int):
@@ -176,6 +196,10 @@ class StockService:
         # 주식 종목 삭제
         stock.delete()
 
+        # 주식 종목 삭제 이벤트 발행 및 채널 응답 캐시 무효화
+        publish_stock_event(channel_id=channel_id, event="stock_deleted", data={"ids": [stock_id]})
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
+
     def delete_stocks(self, stock_ids: list[int], user: User, channel_id: int):
         """
         이 함수는 주식 종목 아이디 리스트를 받아 주식 종목들을 삭제합니다.
@@ -204,6 +228,10 @@ class StockService:
         # 주식 종목들 삭제
         stocks.delete()
 
+        # 주식 종목 삭제 이벤트 발행 및 채널 응답 캐시 무효화
+        publish_stock_event(channel_id=channel_id, event="stock_deleted", data={"ids": stock_ids})
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
+
     def buy_stock(self, stock_id: int, user: User, channel_id: int, amount: int) -> tuple[int, int]:
         """
         이 함수는 주식 종목 아이디와 유저 객체와 채널 아이디와 수량을 받아 검증 후 주식을 매수합니다.
@@ -239,13 +267,22 @@ class StockService:
         if user_channel.point < stock.purchase_price * amount:
             raise ValidationException("User does not have enough points.")
 
-        with transaction.atomic():
+        with transaction.atomic(using=get_current_channel_shard_database()):
             # 유저 포인트 차감
             total_purchase_price = stock.purchase_price * amount
             user_channel.point = F("point") - total_purchase_price
             user_channel.save()
             user_channel.refresh_from_db()
 
+            # 포인트 차감 내역 기록
+            PointLog.objects.create(
+                user=user,
+                channel_id=channel_id,
+                actor=user,
+                log_type=PointLogType.STOCK_BUY.value,
+                point=-total_purchase_price,
+            )
+
             # 유저 주식 종목이 있으면 수량 증가, 없으면 생성
             user_stock = self.user_stock_selector.get_user_stock_by_user_and_stock_id(
                 user=user,
@@ -264,7 +301,7 @@ class StockService:
                 )
 
             # 주식 거래 내역 생성
-            UserTradeInfo.objects.create(
+            trade_info = UserTradeInfo.objects.create(
                 user=user,
                 stock=stock,
                 trade_date=timezone.now().date(),
@@ -272,6 +309,10 @@ class StockService:
                 amount=amount,
                 price=stock.purchase_price,
             )
+
+            # 주식 거래 이벤트 발행 및 채널 응답 캐시 무효화 (커밋 후)
+            self._publish_trade_event(channel_id=channel_id, trade_info=trade_info)
+            self.channel_response_cache.bump_generation(channel_id=channel_id)
         return user_channel.point, user_stock.total_stock_amount
 
     def sell_stock(self, stock_id: int, user: User, channel_id: int, amount: int) -> tuple[int, int]:
@@ -305,7 +346,7 @@ class StockService:
         if stock is None:
             raise NotFoundException(detail="Stock does not exist.", code="not_stock")
 
-        with transaction.atomic():
+        with transaction.atomic(using=get_current_channel_shard_database()):
             # 유저 포인트 증가 (세금 계산, 소수점 버림)
             total_purchase_price = stock.purchase_price * amount
             total_tax_price = total_purchase_price * (stock.tax / 100)
@@ -316,6 +357,15 @@ class StockService:
             user_channel.save()
             user_channel.refresh_from_db()
 
+            # 포인트 증가 내역 기록
+            PointLog.objects.create(
+                user=user,
+                channel_id=channel_id,
+                actor=user,
+                log_type=PointLogType.STOCK_SELL.value,
+                point=total_price,
+            )
+
             # 유저 주식 종목이 있으면 수량 감소, 없거나 수량이 부족하면 에러
             user_stock = self.user_stock_selector.get_user_stock_by_user_and_stock_id(
                 user=user,
@@ -333,7 +383,7 @@ class StockService:
             user_stock.refresh_from_db()
 
             # 주식 거래 내역 생성
-            UserTradeInfo.objects.create(
+            trade_info = UserTradeInfo.objects.create(
                 user=user,
                 stock=stock,
                 trade_date=timezone.now().date(),
@@ -341,6 +391,10 @@ class StockService:
                 amount=amount,
                 price=stock.purchase_price,
             )
+
+            # 주식 거래 이벤트 발행 및 채널 응답 캐시 무효화 (커밋 후)
+            self._publish_trade_event(channel_id=channel_id, trade_info=trade_info)
+            self.channel_response_cache.bump_generation(channel_id=channel_id)
         return user_channel.point, user_stock.total_stock_amount
 
     def update_stock_purchase_price(self, stock_id: int, channel_id: int):
@@ -368,39 +422,87 @@ class StockService:
         stock.purchase_price = stock.next_day_purchase_price
         stock.save()
 
+        # 주식 매수가 변경 이벤트 발행 및 채널 응답 캐시 무효화
+        self._publish_stock_event(channel_id=channel_id, event="purchase_price_updated", stock=stock)
+        self.channel_response_cache.bump_generation(channel_id=channel_id)
+
     def create_daily_price(self):
         """
         이 함수는 모든 채널의 주식 종목들의 일별 시세를 생성합니다.
         """
         today = timezone.now().date()
 
-        channels_with_stock = self.channel_selector.get_channel_queryset_with_stock()
-
-        with transaction.atomic():
-            # 모든 채널의 주식 종목들의 일별 시세 생성
-            for channel in channels_with_stock:
-                stocks = channel.stocks.all()
-
-                for stock in stocks:
-                    try:
-                        trade_infos = self.user_trade_info_selector.get_user_trade_info_queryset_by_trade_date_and_stock_id(
-                            trade_date=today,
-                            stock_id=stock.id,
-                        ).aggregate(volume=Sum("amount"))
-
-                        if trade_infos["volume"] is None:
-                            trade_infos["volume"] = 0
-
-                        volume = trade_infos["volume"]
-                        transaction_amount = stock.purchase_price * volume
-
-                        DailyPrice.objects.create(
-                            trade_date=today,
-                            price=stock.purchase_price,
-                            volume=volume,
-                            transaction_amount=transaction_amount,
-                            stock=stock,
-                        )
-                    except Exception as e:
-                        logger.warning(e)
-                        continue
+        # 샤드마다 채널의 주식 종목들의 일별 시세 생성
+        for database in get_channel_shard_databases():
+            with use_channel_shard(database=database):
+                channels_with_stock = self.channel_selector.get_channel_queryset_with_stock()
+
+                # 주식 종목과 거래 내역 집계는 레플리카에서 조회하고, 일별 시세 생성은 프라이머리에서 처리
+                with use_replica(), transaction.atomic(using=database):
+                    # 모든 채널의 주식 종목들의 일별 시세 생성
+                    for channel in channels_with_stock:
+                        # 다른 샤드로 이동한 후 원래 샤드에 남아 있는 채널 데이터는 무시
+                        if get_channel_shard(channel_id=channel.id)[0] != database:
+                            continue
+
+                        stocks = channel.stocks.all()
+
+                        for stock in stocks:
+                            try:
+                                trade_infos = self.user_trade_info_selector.get_user_trade_info_queryset_by_trade_date_and_stock_id(
+                                    trade_date=today,
+                                    stock_id=stock.id,
+                                ).aggregate(volume=Sum("amount"))
+
+                                if trade_infos["volume"] is None:
+                                    trade_infos["volume"] = 0
+
+                                volume = trade_infos["volume"]
+                                transaction_amount = stock.purchase_price * volume
+
+                                DailyPrice.objects.create(
+                                    trade_date=today,
+                                    price=stock.purchase_price,
+                                    volume=volume,
+                                    transaction_amount=transaction_amount,
+                                    stock=stock,
+                                )
+                            except Exception as e:
+                                logger.warning(e)
+                                continue
+
+                        # 일별 시세 생성 이벤트 발행 및 채널 응답 캐시 무효화 (커밋 후)
+                        publish_stock_event(channel_id=channel.id, event="daily_price_created", data={"trade_date": today})
+                        self.channel_response_cache.bump_generation(channel_id=channel.id)
+
+    def _publish_stock_event(self, channel_id: int, event: str, stock: Stock):
+        """
+        이 내장 함수는 학생 주식 종목 목록에 필요한 주식 종목 필드를 이벤트로 발행합니다.
+        """
+        publish_stock_event(
+            channel_id=channel_id,
+            event=event,
+            data={
+                "id": stock.id,
+                "name": stock.name,
+                "purchase_price": stock.purchase_price,
+                "prev_day_purchase_price": stock.prev_day_purchase_price,
+                "tax": stock.tax,
+            },
+        )
+
+    def _publish_trade_event(self, channel_id: int, trade_info: UserTradeInfo):
+        """
+        이 내장 함수는 주식 거래를 이벤트로 발행합니다. (거래한 유저는 포함하지 않음)
+        """
+        publish_stock_event(
+            channel_id=channel_id,
+            event="trade",
+            data={
+                "stock_id": trade_info.stock_id,
+                "trade_type": trade_info.trade_type,
+                "amount": trade_info.amount,
+                "price": trade_info.price,
+                "trade_date": trade_info.trade_date,
+            },
+        )
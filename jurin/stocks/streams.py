@@ -0,0 +1,204 @@
+import asyncio
+import json
+from typing import Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django_redis import get_redis_connection
+from redis import asyncio as aioredis
+
+from config.django.base import logger
+from jurin.channels.sharding import get_current_channel_shard_database
+from jurin.common.utils import camelize
+
+STOCK_STREAM_KEY = "stocks:stream:{channel_id}"
+STOCK_STREAM_KEY_PREFIX = "stocks:stream:"
+
+# 큐가 가득 찬(이벤트를 따라오지 못하는) 연결에 보내는 신호, 클라이언트는 목록을 다시 조회한 후 재연결
+RESYNC = "resync"
+
+
+def format_stock_event(event: str, data: dict) -> str:
+    """
+    이 함수는 이벤트를 SSE 메시지 형식으로 변환합니다.
+    REST API 응답과 같이 데이터의 키를 카멜 케이스로 변환하여, 클라이언트가 조회한 목록에 바로 반영할 수 있도록 합니다.
+
+    Args:
+        event (str): 이벤트 이름입니다.
+        data (dict): 이벤트 데이터입니다.
+    Returns:
+        str: SSE 메시지입니다.
+    """
+    return f"event: {event}\ndata: {json.dumps(camelize(data), cls=DjangoJSONEncoder, ensure_ascii=False)}\n\n"
+
+
+def publish_stock_event(channel_id: int, event: str, data: dict):
+    """
+    이 함수는 채널의 주식 변경 이벤트를 Redis pub/sub으로 발행합니다.
+    트랜잭션 안에서 호출하면 커밋 후에 발행하여 롤백된 변경이 전달되지 않도록 하고,
+    발행에 실패해도 요청은 실패하지 않습니다. (클라이언트는 재연결 시 목록을 다시 조회)
+
+    Args:
+        channel_id (int): 채널 아이디입니다.
+        event (str): 이벤트 이름입니다.
+        data (dict): 이벤트 데이터입니다.
+    """
+    if settings.STOCK_STREAM_ENABLED is False:
+        return
+
+    message = format_stock_event(event=event, data=data)
+
+    def _publish():
+        try:
+            get_redis_connection("default").publish(STOCK_STREAM_KEY.format(channel_id=channel_id), message)
+
+        except Exception as e:
+            logger.warning(f"Failed to publish stock event. {e}")
+
+    transaction.on_commit(_publish, using=get_current_channel_shard_database())
+
+
+class StockStreamHub:
+    """
+    이 클래스는 프로세스(ASGI 워커)마다 하나의 Redis pub/sub 연결로 채널을 구독하고, 받은 이벤트를 채널에 연결된 클라이언트의 큐로 나누어 보냅니다.
+    연결마다 Redis 연결을 만들지 않으므로, 대기 중인 연결은 큐 하나와 이벤트 루프의 태스크 하나만 사용합니다.
+    채널의 첫 연결에서 채널을 구독하고, 마지막 연결이 끊기면 구독을 해제합니다.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._redis = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribers: dict[int, set[asyncio.Queue]] = {}
+
+    def _reset(self):
+        self._loop = asyncio.get_running_loop()
+        self._lock = asyncio.Lock()
+        self._redis = None
+        self._pubsub = None
+        self._listener = None
+        self._subscribers = {}
+
+    async def subscribe(self, channel_id: int) -> asyncio.Queue:
+        """
+        이 함수는 채널의 이벤트를 받을 큐를 등록합니다. Redis에 연결할 수 없으면 예외가 발생합니다.
+
+        Args:
+            channel_id (int): 채널 아이디입니다.
+        Returns:
+            asyncio.Queue: SSE 메시지를 받을 큐입니다.
+        """
+        # 이벤트 루프가 바뀌면(테스트 등) 이전 루프의 연결은 사용할 수 없으므로 초기화
+        if self._loop is not asyncio.get_running_loop():
+            self._reset()
+
+        queue = asyncio.Queue(maxsize=settings.STOCK_STREAM_QUEUE_SIZE)
+
+        async with self._lock:
+            if self._pubsub is None:
+                self._redis = aioredis.from_url(settings.CACHES["default"]["LOCATION"], decode_responses=True)
+                self._pubsub = self._redis.pubsub()
+
+            subscribers = self._subscribers.setdefault(channel_id, set())
+
+            if not subscribers:
+                try:
+                    await self._pubsub.subscribe(STOCK_STREAM_KEY.format(channel_id=channel_id))
+
+                except Exception:
+                    del self._subscribers[channel_id]
+                    raise
+
+            subscribers.add(queue)
+
+            if self._listener is None or self._listener.done():
+                self._listener = asyncio.create_task(self._listen())
+
+        return queue
+
+    async def unsubscribe(self, channel_id: int, queue: asyncio.Queue):
+        """
+        이 함수는 채널의 큐를 해제하고, 채널에 남은 연결이 없으면 채널 구독을 해제합니다.
+
+        Args:
+            channel_id (int): 채널 아이디입니다.
+            queue (asyncio.Queue): subscribe에서 받은 큐입니다.
+        """
+        if self._loop is not asyncio.get_running_loop():
+            return
+
+        async with self._lock:
+            subscribers = self._subscribers.get(channel_id)
+
+            if subscribers is None or queue not in subscribers:
+                return
+
+            subscribers.discard(queue)
+
+            if not subscribers:
+                del self._subscribers[channel_id]
+
+                try:
+                    await self._pubsub.unsubscribe(STOCK_STREAM_KEY.format(channel_id=channel_id))
+
+                except Exception as e:
+                    logger.warning(f"Failed to unsubscribe stock stream. {e}")
+
+    async def _listen(self):
+        """
+        이 내장 함수는 구독한 채널의 메시지를 받아 채널에 연결된 큐에 넣습니다.
+        큐가 가득 찬 연결은 쌓인 메시지를 버리고 RESYNC를 보내며, Redis 연결이 끊기면 모든 연결에 RESYNC를 보내고 종료합니다.
+        """
+        while True:
+            try:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+
+            except Exception as e:
+                logger.warning(f"Stock stream listener stopped. {e}")
+                await self._close()
+                return
+
+            if message is None or message["type"] != "message":
+                continue
+
+            channel_id = int(message["channel"][len(STOCK_STREAM_KEY_PREFIX) :])
+
+            for queue in list(self._subscribers.get(channel_id, ())):
+                try:
+                    queue.put_nowait(message["data"])
+
+                except asyncio.QueueFull:
+                    while not queue.empty():
+                        queue.get_nowait()
+
+                    queue.put_nowait(RESYNC)
+
+    async def _close(self):
+        """
+        이 내장 함수는 모든 연결에 RESYNC를 보내고 Redis 연결을 닫습니다. (다음 연결에서 다시 연결)
+        """
+        async with self._lock:
+            for subscribers in self._subscribers.values():
+                for queue in subscribers:
+                    while not queue.empty():
+                        queue.get_nowait()
+
+                    queue.put_nowait(RESYNC)
+
+            pubsub, redis_connection = self._pubsub, self._redis
+            self._subscribers = {}
+            self._pubsub = None
+            self._redis = None
+
+        try:
+            await pubsub.aclose()
+            await redis_connection.aclose()
+
+        except Exception as e:
+            logger.warning(f"Failed to close stock stream connection. {e}")
+
+
+stock_stream_hub = StockStreamHub()
@@ -1,3 +1,11 @@
+import asyncio
+from typing import Iterable
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import serializers, status
@@ -5,20 +13,36 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from jurin.authentication.services import CustomJWTAuthentication
+from config.django.base import logger
+from jurin.authentication.services import (
+    CustomJWTAuthentication,
+    StreamTicketAuthentication,
+)
+from jurin.channels.caches import cache_channel_response
 from jurin.channels.selectors.user_channels import UserChannelSelector
 from jurin.common.base.serializers import BaseResponseSerializer, BaseSerializer
-from jurin.common.exception.exceptions import NotFoundException
-from jurin.common.pagination import LimitOffsetPagination, get_paginated_data
+from jurin.common.base.views import AsyncAPIView, use_swagger_schema_of
+from jurin.common.exception.exceptions import (
+    NotFoundException,
+    ServiceUnavailableException,
+)
+from jurin.common.pagination import (
+    CursorPagination,
+    LimitOffsetPagination,
+    aget_paginated_data,
+    get_paginated_data,
+)
 from jurin.common.permissions import StudentPermission
 from jurin.common.response import create_response
 from jurin.common.utils import inline_serializer
 from jurin.stocks.enums import TradeType
+from jurin.stocks.models import DailyPrice, Stock, UserTradeInfo
 from jurin.stocks.selectors.daily_prices import DailyPriceSelector
 from jurin.stocks.selectors.stocks import StockSelector
 from jurin.stocks.selectors.user_stocks import UserStockSelector
 from jurin.stocks.selectors.user_trade_infos import UserTradeInfoSelector
 from jurin.stocks.services import StockService
+from jurin.stocks.streams import RESYNC, format_stock_event, stock_stream_hub
 
 
 class StudentStockListAPI(APIView):
@@ -42,6 +66,22 @@ class StudentStockListAPI(APIView):
             days_range_rate = (obj.prev_day_purchase_price - obj.purchase_price) / obj.purchase_price * 100
             return f"{days_range_rate:.2f}%"
 
+    def get_stock_queryset(self, request: Request, channel_id: int) -> QuerySet[Stock]:
+        """
+        이 함수는 필터를 검증하고 조회할 채널의 주식 종목 쿼리셋을 반환합니다. (get의 동기, 비동기 버전에서 함께 사용)
+
+        Args:
+            request (Request): 요청 객체입니다.
+            channel_id (int): 채널 아이디입니다.
+        Returns:
+            QuerySet[Stock]: 주식 종목 쿼리셋입니다.
+        """
+        filter_serializer = self.FilterSerializer(data=request.query_params)
+        filter_serializer.is_valid(raise_exception=True)
+
+        stock_selector = StockSelector()
+        return stock_selector.get_stock_queryset_by_channel_id(channel_id=channel_id)
+
     @swagger_auto_schema(
         tags=["학생-주식"],
         operation_summary="학생 주식 종목 목록 조회",
@@ -50,6 +90,7 @@ class StudentStockListAPI(APIView):
             status.HTTP_200_OK: BaseResponseSerializer(data_serializer=OutputSerializer, pagination_serializer=True),
         },
     )
+    @cache_channel_response()
     def get(self, request: Request, channel_id: int) -> Response:
         """
         학생 권한의 유저가 주식 종목 목록을 조회합니다.
@@ -68,8 +109,7 @@ class StudentStockListAPI(APIView):
                 purchase_price (int): 매수가
 
         """
-        filter_serializer = self.FilterSerializer(data=request.query_params)
-        filter_serializer.is_valid(raise_exception=True)
+        stocks = self.get_stock_queryset(request=request, channel_id=channel_id)
 
         # 유저 채널이 존재하는지 검증
         user_channel_selector = UserChannelSelector()
@@ -78,8 +118,6 @@ class StudentStockListAPI(APIView):
         if user_channel is None:
             raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
 
-        stock_selector = StockSelector()
-        stocks = stock_selector.get_stock_queryset_by_channel_id(channel_id=channel_id)
         pagination_stocks_data = get_paginated_data(
             pagination_class=self.Pagination,
             serializer_class=self.OutputSerializer,
@@ -90,6 +128,35 @@ class StudentStockListAPI(APIView):
         return create_response(pagination_stocks_data, status_code=status.HTTP_200_OK)
 
 
+class StudentStockListAsyncAPI(AsyncAPIView, StudentStockListAPI):
+    @use_swagger_schema_of(StudentStockListAPI.get)
+    @cache_channel_response()
+    async def get(self, request: Request, channel_id: int) -> Response:
+        """
+        StudentStockListAPI의 비동기 버전입니다. (ASGI 서버에서 사용)
+        url: /students/api/v1/channels/<int:channel_id>/stocks
+        """
+        stocks = self.get_stock_queryset(request=request, channel_id=channel_id)
+
+        # 유저 채널이 존재하는지 검증
+        user_channel_selector = UserChannelSelector()
+        user_channel = await user_channel_selector.aget_user_channel_by_channel_id_and_user_for_student(
+            user=request.user, channel_id=channel_id
+        )
+
+        if user_channel is None:
+            raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
+
+        pagination_stocks_data = await aget_paginated_data(
+            pagination_class=self.Pagination,
+            serializer_class=self.OutputSerializer,
+            queryset=stocks,
+            request=request,
+            view=self,
+        )
+        return create_response(pagination_stocks_data, status_code=status.HTTP_200_OK)
+
+
 class StudentStockTradeTodayListAPI(APIView):
     authentication_classes = (CustomJWTAuthentication,)
     permission_classes = (StudentPermission,)
@@ -126,6 +193,27 @@ class StudentStockTradeTodayListAPI(APIView):
             elif obj.trade_type == TradeType.SELL.value:
                 return TradeType.SELL.name
 
+    def get_user_trade_info_queryset(self, request: Request, channel_id: int) -> QuerySet[UserTradeInfo]:
+        """
+        이 함수는 필터를 검증하고 조회할 채널의 오늘의 거래 내역 쿼리셋을 반환합니다. (get의 동기, 비동기 버전에서 함께 사용)
+
+        Args:
+            request (Request): 요청 객체입니다.
+            channel_id (int): 채널 아이디입니다.
+        Returns:
+            QuerySet[UserTradeInfo]: 유저 거래 내역 쿼리셋입니다.
+        """
+        filter_serializer = self.FilterSerializer(data=request.query_params)
+        filter_serializer.is_valid(raise_exception=True)
+        trade_type = filter_serializer.validated_data.get("trade_type")
+
+        user_trade_info_selector = UserTradeInfoSelector()
+        return user_trade_info_selector.get_user_trade_info_queryset_with_stock_by_trade_date_and_channel_id_and_trade_type(
+            trade_date=timezone.now().date(),
+            channel_id=channel_id,
+            trade_type=trade_type,
+        )
+
     @swagger_auto_schema(
         tags=["학생-주식"],
         operation_summary="학생 오늘의 거래 주식 종목 목록 조회",
@@ -134,6 +222,7 @@ class StudentStockTradeTodayListAPI(APIView):
             status.HTTP_200_OK: BaseResponseSerializer(data_serializer=OutputSerializer, pagination_serializer=True),
         },
     )
+    @cache_channel_response()
     def get(self, request: Request, channel_id: int) -> Response:
         """
         학생 권한의 유저가 오늘의 거래 주식 종목 목록을 조회합니다.
@@ -153,8 +242,7 @@ class StudentStockTradeTodayListAPI(APIView):
                 purchase_price (int): 매수가
                 trade_type (str): 거래 타입 (BUY, SELL)
         """
-        filter_serializer = self.FilterSerializer(data=request.query_params)
-        filter_serializer.is_valid(raise_exception=True)
+        user_trade_infos = self.get_user_trade_info_queryset(request=request, channel_id=channel_id)
 
         # 유저 채널이 존재하는지 검증
         user_channel_selector = UserChannelSelector()
@@ -163,15 +251,36 @@ class StudentStockTradeTodayListAPI(APIView):
         if user_channel is None:
             raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
 
-        trade_type = filter_serializer.validated_data.get("trade_type")
+        pagination_user_trade_info_data = get_paginated_data(
+            pagination_class=self.Pagination,
+            serializer_class=self.OutputSerializer,
+            queryset=user_trade_infos,
+            request=request,
+            view=self,
+        )
+        return create_response(pagination_user_trade_info_data, status_code=status.HTTP_200_OK)
 
-        user_trade_info_selector = UserTradeInfoSelector()
-        user_trade_infos = user_trade_info_selector.get_user_trade_info_queryset_with_stock_by_trade_date_and_channel_id_and_trade_type(
-            trade_date=timezone.now().date(),
-            channel_id=channel_id,
-            trade_type=trade_type,
+
+class StudentStockTradeTodayListAsyncAPI(AsyncAPIView, StudentStockTradeTodayListAPI):
+    @use_swagger_schema_of(StudentStockTradeTodayListAPI.get)
+    @cache_channel_response()
+    async def get(self, request: Request, channel_id: int) -> Response:
+        """
+        StudentStockTradeTodayListAPI의 비동기 버전입니다. (ASGI 서버에서 사용)
+        url: /students/api/v1/channels/<int:channel_id>/stocks/trades/today
+        """
+        user_trade_infos = self.get_user_trade_info_queryset(request=request, channel_id=channel_id)
+
+        # 유저 채널이 존재하는지 검증
+        user_channel_selector = UserChannelSelector()
+        user_channel = await user_channel_selector.aget_user_channel_by_channel_id_and_user_for_student(
+            user=request.user, channel_id=channel_id
         )
-        pagination_user_trade_info_data = get_paginated_data(
+
+        if user_channel is None:
+            raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
+
+        pagination_user_trade_info_data = await aget_paginated_data(
             pagination_class=self.Pagination,
             serializer_class=self.OutputSerializer,
             queryset=user_trade_infos,
@@ -276,6 +385,35 @@ class StudentStockDetailAPI(APIView):
             },
         )
 
+    def get_daily_price_queryset(self, stock_id: int) -> QuerySet[DailyPrice]:
+        """
+        이 함수는 주식 종목의 최근 15일 일별 가격 쿼리셋을 반환합니다. (get의 동기, 비동기 버전에서 함께 사용)
+
+        Args:
+            stock_id (int): 주식 종목 아이디입니다.
+        Returns:
+            QuerySet[DailyPrice]: 일별 가격 쿼리셋입니다.
+        """
+        daily_price_selector = DailyPriceSelector()
+        return daily_price_selector.get_daily_price_queryset_within_15_days_by_stock_id(stock_id=stock_id)
+
+    def get_stock_data(self, stock: Stock, daily_prices: Iterable[DailyPrice]) -> dict:
+        """
+        이 함수는 주식 종목과 일별 가격을 응답 데이터로 변환합니다. (get의 동기, 비동기 버전에서 함께 사용)
+
+        Args:
+            stock (Stock): 주식 종목 객체입니다.
+            daily_prices (Iterable[DailyPrice]): 일별 가격 리스트입니다.
+        Returns:
+            dict: 주식 종목 상세 데이터입니다.
+        """
+        return self.GetOutputSerializer(
+            {
+                "stock": stock,
+                "daily_price": daily_prices,
+            }
+        ).data
+
     @swagger_auto_schema(
         tags=["학생-주식"],
         operation_summary="학생 주식 종목 상세 조회",
@@ -283,6 +421,7 @@ class StudentStockDetailAPI(APIView):
             status.HTTP_200_OK: BaseResponseSerializer(data_serializer=GetOutputSerializer),
         },
     )
+    @cache_channel_response()
     def get(self, request: Request, channel_id: int, stock_id: int) -> Response:
         """
         학생 권한의 유저가 주식 종목 상세 정보를 조회합니다.
@@ -325,15 +464,9 @@ class StudentStockDetailAPI(APIView):
             raise NotFoundException(detail="Stock does not exist.", code="not_stock")
 
         # 주식 종목의 일별 가격을 조회
-        daily_price_selector = DailyPriceSelector()
-        daily_prices = daily_price_selector.get_daily_price_queryset_within_15_days_by_stock_id(stock_id=stock_id)
+        daily_prices = self.get_daily_price_queryset(stock_id=stock_id)
 
-        stock_data = self.GetOutputSerializer(
-            {
-                "stock": stock,
-                "daily_price": daily_prices,
-            }
-        ).data
+        stock_data = self.get_stock_data(stock=stock, daily_prices=daily_prices)
         return create_response(stock_data, status_code=status.HTTP_200_OK)
 
     class PostInputSerializer(BaseSerializer):
@@ -397,6 +530,44 @@ class StudentStockDetailAPI(APIView):
         return create_response(stock_data, status_code=status.HTTP_200_OK)
 
 
+class StudentStockDetailAsyncAPI(AsyncAPIView, StudentStockDetailAPI):
+    """
+    주식 종목 상세 조회(GET)만 비동기로 처리하고, 주식 거래(POST)는 StudentStockDetailAPI의 동기 핸들러를 사용합니다.
+    """
+
+    @use_swagger_schema_of(StudentStockDetailAPI.get)
+    @cache_channel_response()
+    async def get(self, request: Request, channel_id: int, stock_id: int) -> Response:
+        """
+        StudentStockDetailAPI.get의 비동기 버전입니다. (ASGI 서버에서 사용)
+        url: /students/api/v1/channels/<int:channel_id>/stocks/<int:stock_id>
+        """
+        # 유저 채널이 존재하는지 검증
+        user_channel_selector = UserChannelSelector()
+        user_channel = await user_channel_selector.aget_user_channel_by_channel_id_and_user_for_student(
+            user=request.user, channel_id=channel_id
+        )
+
+        if user_channel is None:
+            raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
+
+        # 주식 종목이 존재하는지 검증
+        stock_selector = StockSelector()
+        stock = await stock_selector.aget_stock_by_id_and_channel_id(
+            stock_id=stock_id,
+            channel_id=channel_id,
+        )
+
+        if stock is None:
+            raise NotFoundException(detail="Stock does not exist.", code="not_stock")
+
+        # 주식 종목의 일별 가격을 조회
+        daily_prices = self.get_daily_price_queryset(stock_id=stock_id)
+
+        stock_data = self.get_stock_data(stock=stock, daily_prices=[daily_price async for daily_price in daily_prices])
+        return create_response(stock_data, status_code=status.HTTP_200_OK)
+
+
 class StudentMyStockDetailAPI(APIView):
     authentication_classes = (CustomJWTAuthentication,)
     permission_classes = (StudentPermission,)
@@ -479,12 +650,13 @@ class StudentMyStockTradeInfoListAPI(APIView):
     authentication_classes = (CustomJWTAuthentication,)
     permission_classes = (StudentPermission,)
 
-    class Pagination(LimitOffsetPagination):
+    class Pagination(CursorPagination):
         default_limit = 15
+        ordering = ("-trade_date", "-id")
 
     class FilterSerializer(BaseSerializer):
         limit = serializers.IntegerField(required=False, min_value=1, max_value=50, default=15)
-        offset = serializers.IntegerField(required=False, min_value=0)
+        cursor = serializers.CharField(required=False, help_text="다음 페이지 커서 (이전 응답의 next에 포함)")
         start_date = serializers.DateField(required=True)
         end_date = serializers.DateField(required=True)
 
@@ -525,7 +697,7 @@ class StudentMyStockTradeInfoListAPI(APIView):
             stock_id (int): 주식 종목 아이디
             FilterSerializer:
                 limit (int): 조회할 개수
-                offset (int): 조회 시작 위치
+                cursor (str): 다음 페이지 커서
                 start_date (date): 조회 시작 일자
                 end_date (date): 조회 종료 일자
         Returns:
@@ -602,6 +774,45 @@ class StudentStockTradeListAPI(APIView):
             },
         )
 
+    def get_recent_user_trade_info_querysets(self, stock_id: int) -> tuple[QuerySet[UserTradeInfo], QuerySet[UserTradeInfo]]:
+        """
+        이 함수는 주식 종목의 최근 매도, 매수 거래 내역 쿼리셋(7개씩)을 반환합니다. (get의 동기, 비동기 버전에서 함께 사용)
+
+        Args:
+            stock_id (int): 주식 종목 아이디입니다.
+        Returns:
+            tuple[QuerySet[UserTradeInfo], QuerySet[UserTradeInfo]]: 매도, 매수 거래 내역 쿼리셋입니다.
+        """
+        user_trade_info_selector = UserTradeInfoSelector()
+        sell_user_trade_infos = user_trade_info_selector.get_recent_user_trade_info_queryset_by_stock_id_and_trade_type(
+            stock_id=stock_id,
+            trade_type=TradeType.SELL.value,
+        )
+        buy_user_trade_infos = user_trade_info_selector.get_recent_user_trade_info_queryset_by_stock_id_and_trade_type(
+            stock_id=stock_id,
+            trade_type=TradeType.BUY.value,
+        )
+        return sell_user_trade_infos[:7], buy_user_trade_infos[:7]
+
+    def get_user_trade_info_data(
+        self, sell_user_trade_infos: Iterable[UserTradeInfo], buy_user_trade_infos: Iterable[UserTradeInfo]
+    ) -> dict:
+        """
+        이 함수는 매도, 매수 거래 내역을 응답 데이터로 변환합니다. (get의 동기, 비동기 버전에서 함께 사용)
+
+        Args:
+            sell_user_trade_infos (Iterable[UserTradeInfo]): 매도 거래 내역 리스트입니다.
+            buy_user_trade_infos (Iterable[UserTradeInfo]): 매수 거래 내역 리스트입니다.
+        Returns:
+            dict: 거래 정보 목록 데이터입니다.
+        """
+        return self.OutputSerializer(
+            {
+                "sell_list": sell_user_trade_infos,
+                "buy_list": buy_user_trade_infos,
+            }
+        ).data
+
     @swagger_auto_schema(
         tags=["학생-주식"],
         operation_summary="학생 주식 종목 상세 거래 정보 목록 조회",
@@ -609,6 +820,7 @@ class StudentStockTradeListAPI(APIView):
             status.HTTP_200_OK: BaseResponseSerializer(data_serializer=OutputSerializer, pagination_serializer=True),
         },
     )
+    @cache_channel_response()
     def get(self, request: Request, channel_id: int, stock_id: int) -> Response:
         """
         학생 권한의 유저가 주식 종목 상세 거래 정보 목록을 조회합니다.
@@ -646,19 +858,183 @@ class StudentStockTradeListAPI(APIView):
             raise NotFoundException(detail="Stock does not exist.", code="not_stock")
 
         # 주식 종목의 판매 정보 목록 조회 (매도, 매수)
-        user_trade_info_selector = UserTradeInfoSelector()
-        sell_user_trade_infos = user_trade_info_selector.get_recent_user_trade_info_queryset_by_stock_id_and_trade_type(
-            stock_id=stock_id,
-            trade_type=TradeType.SELL.value,
+        sell_user_trade_infos, buy_user_trade_infos = self.get_recent_user_trade_info_querysets(stock_id=stock_id)
+
+        user_trade_info_data = self.get_user_trade_info_data(
+            sell_user_trade_infos=sell_user_trade_infos,
+            buy_user_trade_infos=buy_user_trade_infos,
         )
-        buy_user_trade_infos = user_trade_info_selector.get_recent_user_trade_info_queryset_by_stock_id_and_trade_type(
+        return create_response(user_trade_info_data, status_code=status.HTTP_200_OK)
+
+
+class StudentStockTradeListAsyncAPI(AsyncAPIView, StudentStockTradeListAPI):
+    @use_swagger_schema_of(StudentStockTradeListAPI.get)
+    @cache_channel_response()
+    async def get(self, request: Request, channel_id: int, stock_id: int) -> Response:
+        """
+        StudentStockTradeListAPI의 비동기 버전입니다. (ASGI 서버에서 사용)
+        url: /students/api/v1/channels/<int:channel_id>/stocks/<int:stock_id>/trades
+        """
+        # 유저 채널이 존재하는지 검증
+        user_channel_selector = UserChannelSelector()
+        user_channel = await user_channel_selector.aget_user_channel_by_channel_id_and_user_for_student(
+            user=request.user, channel_id=channel_id
+        )
+
+        if user_channel is None:
+            raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
+
+        # 주식 종목이 존재하는지 검증
+        stock_selector = StockSelector()
+        stock = await stock_selector.aget_stock_by_id_and_channel_id(
             stock_id=stock_id,
-            trade_type=TradeType.BUY.value,
+            channel_id=channel_id,
+        )
+
+        if stock is None:
+            raise NotFoundException(detail="Stock does not exist.", code="not_stock")
+
+        # 주식 종목의 판매 정보 목록 조회 (매도, 매수)
+        sell_user_trade_infos, buy_user_trade_infos = self.get_recent_user_trade_info_querysets(stock_id=stock_id)
+
+        user_trade_info_data = self.get_user_trade_info_data(
+            sell_user_trade_infos=[user_trade_info async for user_trade_info in sell_user_trade_infos],
+            buy_user_trade_infos=[user_trade_info async for user_trade_info in buy_user_trade_infos],
         )
-        user_trade_info_data = self.OutputSerializer(
-            {
-                "sell_list": sell_user_trade_infos[:7],
-                "buy_list": buy_user_trade_infos[:7],
-            }
-        ).data
         return create_response(user_trade_info_data, status_code=status.HTTP_200_OK)
+
+
+class StudentStockStreamTicketAPI(APIView):
+    authentication_classes = (CustomJWTAuthentication,)
+    permission_classes = (StudentPermission,)
+
+    class OutputSerializer(BaseSerializer):
+        ticket = serializers.CharField()
+        expires_in = serializers.IntegerField()
+
+    @swagger_auto_schema(
+        tags=["학생-주식"],
+        operation_summary="학생 주식 변경 이벤트 스트림 티켓 발급",
+        responses={
+            status.HTTP_200_OK: BaseResponseSerializer(data_serializer=OutputSerializer),
+        },
+    )
+    def post(self, request: Request, channel_id: int) -> Response:
+        """
+        학생 권한의 유저가 주식 변경 이벤트 스트림에 연결할 일회용 티켓을 발급받습니다.
+        url: /students/api/v1/channels/<int:channel_id>/stocks/stream/ticket
+
+        Args:
+            channel_id (int): 채널 아이디
+        Returns:
+            OutputSerializer:
+                ticket (str): 스트림 티켓 (STOCK_STREAM_TICKET_TIMEOUT초 동안 한 번만 사용 가능)
+                expires_in (int): 티켓 만료 시간(초)
+        """
+        # 유저 채널이 존재하는지 검증
+        user_channel_selector = UserChannelSelector()
+        user_channel = user_channel_selector.get_user_channel_by_channel_id_and_user_for_student(user=request.user, channel_id=channel_id)
+
+        if user_channel is None:
+            raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
+
+        ticket = StreamTicketAuthentication().issue_ticket(user=request.user, channel_id=channel_id)
+        ticket_data = self.OutputSerializer({"ticket": ticket, "expires_in": settings.STOCK_STREAM_TICKET_TIMEOUT}).data
+        return create_response(ticket_data, status_code=status.HTTP_200_OK)
+
+
+class StudentStockStreamAPI(AsyncAPIView):
+    """
+    채널의 주식 변경 이벤트를 SSE(text/event-stream)로 보내는 API입니다. (ASGI 서버에서 사용)
+    목록 API를 주기적으로 조회하는 대신, ready 이벤트를 받은 후 목록을 한 번 조회하고 이후의 변경 이벤트를 목록에 반영합니다.
+    resync, reconnect 이벤트를 받거나 연결이 끊기면 티켓을 다시 발급받아 새로 연결한 후 목록을 다시 조회합니다.
+    (액세스 토큰이 접근 로그에 남지 않도록 일회용 티켓으로 인증하므로, EventSource의 자동 재연결은 사용할 수 없습니다.)
+
+    Django(4.2)는 스트리밍 응답 중 클라이언트의 연결 종료를 뷰에 알리지 않으므로,
+    끊긴 연결이 남지 않도록 STOCK_STREAM_MAX_SECONDS초 후 reconnect 이벤트를 보내고 서버에서 연결을 닫습니다.
+    """
+
+    authentication_classes = (StreamTicketAuthentication,)
+    permission_classes = (StudentPermission,)
+
+    @swagger_auto_schema(
+        tags=["학생-주식"],
+        operation_summary="학생 주식 변경 이벤트 스트림 (SSE)",
+        responses={
+            status.HTTP_200_OK: "text/event-stream (ready, trade, stock_created, stock_updated, stock_deleted, "
+            "purchase_price_updated, daily_price_created, resync, reconnect)",
+        },
+    )
+    async def get(self, request: Request, channel_id: int) -> StreamingHttpResponse:
+        """
+        학생 권한의 유저가 채널의 주식 변경 이벤트 스트림에 연결합니다.
+        url: /students/api/v1/channels/<int:channel_id>/stocks/stream
+
+        Args:
+            channel_id (int): 채널 아이디
+            ticket (str): 스트림 티켓 (Authorization 헤더를 설정할 수 없는 EventSource에서 사용)
+        Returns:
+            text/event-stream:
+                trade: 주식 거래 (stockId, tradeType, amount, price, tradeDate)
+                stock_created, stock_updated, purchase_price_updated: 주식 종목 (id, name, purchasePrice, prevDayPurchasePrice, tax)
+                stock_deleted: 삭제된 주식 종목 (ids)
+                daily_price_created: 일별 시세 생성 (tradeDate)
+                reconnect: 연결 종료 예정 (티켓을 다시 발급받아 연결)
+        """
+        # 유저 채널이 존재하는지 검증
+        user_channel_selector = UserChannelSelector()
+        user_channel = await user_channel_selector.aget_user_channel_by_channel_id_and_user_for_student(
+            user=request.user, channel_id=channel_id
+        )
+
+        if user_channel is None:
+            raise NotFoundException(detail="User channel does not exist.", code="not_user_channel")
+
+        # 채널 이벤트 구독
+        try:
+            queue = await stock_stream_hub.subscribe(channel_id=channel_id)
+
+        except Exception as e:
+            logger.warning(f"Failed to subscribe stock stream. {e}")
+            raise ServiceUnavailableException("Stock stream is unavailable. Please try again later.")
+
+        # 스트림이 끝날 때까지 DB 연결을 잡고 있지 않도록, 요청 스레드의 DB 연결을 닫음
+        await sync_to_async(connections.close_all)()
+
+        response = StreamingHttpResponse(self._stream_events(channel_id=channel_id, queue=queue), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def _stream_events(self, channel_id: int, queue: asyncio.Queue):
+        """
+        이 내장 함수는 큐의 이벤트를 보내고, 이벤트가 없으면 STOCK_STREAM_HEARTBEAT_SECONDS초마다 프록시가 연결을 끊지 않도록 주석(ping)을 보냅니다.
+        """
+        loop = asyncio.get_running_loop()
+        closes_at = loop.time() + settings.STOCK_STREAM_MAX_SECONDS
+
+        try:
+            yield format_stock_event(event="ready", data={"channel_id": channel_id})
+
+            while True:
+                timeout = min(settings.STOCK_STREAM_HEARTBEAT_SECONDS, closes_at - loop.time())
+
+                if timeout <= 0:
+                    yield format_stock_event(event="reconnect", data={"channel_id": channel_id})
+                    break
+
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=timeout)
+
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+
+                if message == RESYNC:
+                    yield format_stock_event(event=RESYNC, data={"channel_id": channel_id})
+                    break
+
+                yield message
+
+        finally:
+            await stock_stream_hub.unsubscribe(channel_id=channel_id, queue=queue)
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 
 from jurin.stocks.students.apis import (
@@ -5,17 +6,43 @@ from jurin.stocks.students.apis import (
     StudentMyStockListAPI,
     StudentMyStockTradeInfoListAPI,
     StudentStockDetailAPI,
+    StudentStockDetailAsyncAPI,
     StudentStockListAPI,
+    StudentStockListAsyncAPI,
+    StudentStockStreamAPI,
+    StudentStockStreamTicketAPI,
     StudentStockTradeListAPI,
+    StudentStockTradeListAsyncAPI,
     StudentStockTradeTodayListAPI,
+    StudentStockTradeTodayListAsyncAPI,
 )
 
+# ASGI 서버에서는 폴링이 많은 학생 조회 API를 비동기 뷰로 제공
 urlpatterns = [
-    path("", StudentStockListAPI.as_view(), name="student_stock_list"),
-    path("/trades/today", StudentStockTradeTodayListAPI.as_view(), name="student_stock_trade_today_list"),
+    path("", (StudentStockListAsyncAPI if settings.ASYNC_READ_APIS_ENABLED else StudentStockListAPI).as_view(), name="student_stock_list"),
+    path(
+        "/trades/today",
+        (StudentStockTradeTodayListAsyncAPI if settings.ASYNC_READ_APIS_ENABLED else StudentStockTradeTodayListAPI).as_view(),
+        name="student_stock_trade_today_list",
+    ),
     path("/mine", StudentMyStockListAPI.as_view(), name="student_stock_mine_list"),
-    path("/<int:stock_id>", StudentStockDetailAPI.as_view(), name="student_stock_detail"),
+    path(
+        "/<int:stock_id>",
+        (StudentStockDetailAsyncAPI if settings.ASYNC_READ_APIS_ENABLED else StudentStockDetailAPI).as_view(),
+        name="student_stock_detail",
+    ),
     path("/<int:stock_id>/mine", StudentMyStockDetailAPI.as_view(), name="student_stock_detail_mine"),
     path("/<int:stock_id>/trades/mine", StudentMyStockTradeInfoListAPI.as_view(), name="student_stock_trade_info_mine_list"),
-    path("/<int:stock_id>/trades", StudentStockTradeListAPI.as_view(), name="student_stock_trade_today_list"),
+    path(
+        "/<int:stock_id>/trades",
+        (StudentStockTradeListAsyncAPI if settings.ASYNC_READ_APIS_ENABLED else StudentStockTradeListAPI).as_view(),
+        name="student_stock_trade_today_list",
+    ),
 ]
+
+# 주식 변경 이벤트 스트림(SSE)은 ASGI 서버에서만 제공
+if settings.STOCK_STREAM_ENABLED:
+    urlpatterns += [
+        path("/stream", StudentStockStreamAPI.as_view(), name="student_stock_stream"),
+        path("/stream/ticket", StudentStockStreamTicketAPI.as_view(), name="student_stock_stream_ticket"),
+    ]
@@ -33,13 +33,17 @@ def updatae_stock_purchase_price_task(self, stock_id: int, channel_id: int):
         channel_id (int): 채널 고유 아이디
     """
     try:
+        from jurin.channels.sharding import use_channel
         from jurin.stocks.services import StockService
 
         stock_service = StockService()
-        stock_service.update_stock_purchase_price(
-            stock_id=stock_id,
-            channel_id=channel_id,
-        )
+
+        with use_channel(channel_id=channel_id):
+            stock_service.update_stock_purchase_price(
+                stock_id=stock_id,
+                channel_id=channel_id,
+            )
+
         logger.info("Successfully updated stock purchase price.")
 
     except NotFoundException as e:
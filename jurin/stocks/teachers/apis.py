@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from jurin.authentication.services import CustomJWTAuthentication
+from jurin.channels.caches import cache_channel_response
 from jurin.channels.selectors.channels import ChannelSelector
 from jurin.common.base.serializers import BaseResponseSerializer, BaseSerializer
 from jurin.common.exception.exceptions import NotFoundException
@@ -47,6 +48,7 @@ class TeacherStockListAPI(APIView):
             status.HTTP_200_OK: BaseResponseSerializer(data_serializer=GetOutputSerializer, pagination_serializer=True),
         },
     )
+    @cache_channel_response()
     def get(self, request: Request, channel_id: int) -> Response:
         """
         선생님 권한의 유저가 주식 종목 목록을 조회합니다.
@@ -218,6 +220,7 @@ class TeacherStockTradeTodayListAPI(APIView):
             status.HTTP_200_OK: BaseResponseSerializer(data_serializer=OutputSerializer, pagination_serializer=True),
         },
     )
+    @cache_channel_response()
     def get(self, request: Request, channel_id: int) -> Response:
         """
         선생님 권한의 유저가 오늘의 거래 주식 종목 목록을 조회합니다.
@@ -284,6 +287,7 @@ class TeacherStockDetailAPI(APIView):
             status.HTTP_200_OK: BaseResponseSerializer(data_serializer=OutputSerializer),
         },
     )
+    @cache_channel_response()
     def get(self, request: Request, channel_id: int, stock_id: int) -> Response:
         """
         선생님 권한의 유저가 주식 종목을 상세 조회합니다.
@@ -0,0 +1,5 @@
+from django.contrib import admin
+
+from jurin.tasks.models import DeferredTask
+
+admin.site.register(DeferredTask)
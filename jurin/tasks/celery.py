@@ -15,6 +15,10 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
 app.conf.beat_schedule = {
+    "dispatch_deferred_tasks": {
+        "task": "jurin.tasks.tasks.dispatch_deferred_tasks_task",
+        "schedule": crontab(),
+    },
     "hard_delete_users": {
         "task": "jurin.users.tasks.hard_delete_users_task",
         "schedule": crontab(minute="0", hour="0"),
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class DeferredTaskStatus(Enum):
+    """
+    이 클래스는 지연 작업의 상태를 나타내는 열거형 클래스입니다.
+    """
+
+    PENDING = 1
+    DISPATCHED = 2
+    CANCELED = 3
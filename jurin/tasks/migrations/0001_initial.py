@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeferredTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='지연 작업 고유 아이디')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성 일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정 일시')),
+                ('task_name', models.CharField(max_length=128, verbose_name='작업 이름')),
+                ('task_key', models.CharField(max_length=191, verbose_name='작업 키')),
+                ('task_args', models.JSONField(default=list, verbose_name='작업 인자')),
+                ('status', models.PositiveSmallIntegerField(default=1, verbose_name='작업 상태')),
+                ('eta', models.DateTimeField(verbose_name='실행 예정 일시')),
+                ('dispatched_at', models.DateTimeField(null=True, verbose_name='실행 일시')),
+            ],
+            options={
+                'verbose_name': 'deferred task',
+                'verbose_name_plural': 'deferred tasks',
+                'db_table': 'deferred_task',
+                'indexes': [models.Index(fields=['status', 'eta'], name='deferred_task_status_eta_idx'), models.Index(fields=['task_key', 'status'], name='deferred_task_key_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import models
+
+from jurin.common.base.models import BaseModel
+from jurin.tasks.enums import DeferredTaskStatus
+
+
+class DeferredTask(BaseModel):
+    id = models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="지연 작업 고유 아이디")
+    task_name = models.CharField(max_length=128, verbose_name="작업 이름")
+    task_key = models.CharField(max_length=191, verbose_name="작업 키")
+    task_args = models.JSONField(default=list, verbose_name="작업 인자")
+    status = models.PositiveSmallIntegerField(default=DeferredTaskStatus.PENDING.value, verbose_name="작업 상태")
+    eta = models.DateTimeField(verbose_name="실행 예정 일시")
+    dispatched_at = models.DateTimeField(null=True, verbose_name="실행 일시")
+
+    def __str__(self):
+        return f"[{self.id}]: {self.task_key}"
+
+    class Meta:
+        db_table = "deferred_task"
+        verbose_name = "deferred task"
+        verbose_name_plural = "deferred tasks"
+        indexes = [
+            models.Index(fields=["status", "eta"], name="deferred_task_status_eta_idx"),
+            models.Index(fields=["task_key", "status"], name="deferred_task_key_status_idx"),
+        ]
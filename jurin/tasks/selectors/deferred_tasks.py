@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from django.db.models.query import QuerySet
+
+from jurin.tasks.enums import DeferredTaskStatus
+from jurin.tasks.models import DeferredTask
+
+
+class DeferredTaskSelector:
+    def get_due_deferred_task_queryset_for_update(self, now: datetime, limit: int) -> QuerySet[DeferredTask]:
+        """
+        이 함수는 실행 예정 일시가 지난 대기 중인 지연 작업을 잠금과 함께 조회합니다.
+        다른 워커가 잠근 작업은 건너뛰므로 여러 워커가 동시에 실행해도 중복 실행되지 않습니다.
+
+        Args:
+            now (datetime): 기준 일시입니다.
+            limit (int): 조회할 최대 개수입니다.
+        Returns:
+            QuerySet[DeferredTask]: 지연 작업 쿼리셋입니다.
+        """
+        return (
+            DeferredTask.objects.select_for_update(skip_locked=True)
+            .filter(status=DeferredTaskStatus.PENDING.value, eta__lte=now)
+            .order_by("eta")[:limit]
+        )
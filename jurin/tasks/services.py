@@ -0,0 +1,109 @@
+import json
+
+from celery import Task
+from django.db import transaction
+from django.utils import timezone
+
+from config.django.base import logger
+from jurin.tasks.enums import DeferredTaskStatus
+from jurin.tasks.models import DeferredTask
+from jurin.tasks.selectors.deferred_tasks import DeferredTaskSelector
+
+
+class DeferredTaskService:
+    def __init__(self):
+        self.deferred_task_selector = DeferredTaskSelector()
+
+    @staticmethod
+    def _make_task_key(task_name: str, task_args: list) -> str:
+        """
+        이 내장 함수는 작업 이름과 인자로 지연 작업을 식별하는 키를 생성합니다.
+
+        Args:
+            task_name (str): 작업 이름입니다.
+            task_args (list): 작업 인자입니다.
+        Returns:
+            str: 지연 작업 키입니다.
+        """
+        return f"{task_name}:{json.dumps(task_args, separators=(',', ':'))}"
+
+    def schedule_task(self, task: Task, task_args: list, countdown: int) -> DeferredTask:
+        """
+        이 함수는 작업과 인자를 받아서 일정 시간 후에 실행될 지연 작업을 등록합니다.
+        브로커에 예약하지 않고 테이블에 저장하며, 주기 작업이 실행 시간이 된 작업을 브로커로 보냅니다.
+
+        Args:
+            task (Task): 셀러리 작업입니다.
+            task_args (list): 작업 인자입니다.
+            countdown (int): 실행까지 대기할 시간(초)입니다.
+        Returns:
+            DeferredTask: 지연 작업 객체입니다.
+        """
+        return DeferredTask.objects.create(
+            task_name=task.name,
+            task_key=self._make_task_key(task_name=task.name, task_args=task_args),
+            task_args=task_args,
+            eta=timezone.now() + timezone.timedelta(seconds=countdown),
+        )
+
+    def cancel_task(self, task: Task, task_args: list) -> int:
+        """
+        이 함수는 작업과 인자를 받아서 대기 중인 지연 작업을 취소합니다.
+
+        Args:
+            task (Task): 셀러리 작업입니다.
+            task_args (list): 작업 인자입니다.
+        Returns:
+            int: 취소된 지연 작업의 개수입니다.
+        """
+        return DeferredTask.objects.filter(
+            task_key=self._make_task_key(task_name=task.name, task_args=task_args),
+            status=DeferredTaskStatus.PENDING.value,
+        ).update(status=DeferredTaskStatus.CANCELED.value)
+
+    def dispatch_due_tasks(self, batch_size: int = 100) -> int:
+        """
+        이 함수는 실행 시간이 된 지연 작업을 실행 처리한 후 브로커로 보냅니다.
+        브로커로 보내지 못한 작업은 대기 상태로 되돌려 다음 주기에 다시 보냅니다.
+
+        Args:
+            batch_size (int): 한 번에 처리할 최대 개수입니다.
+        Returns:
+            int: 브로커로 보낸 지연 작업의 개수입니다.
+        """
+        from jurin.tasks.celery import app as celery_app
+
+        now = timezone.now()
+
+        # 실행 시간이 된 지연 작업을 잠근 후 실행 처리
+        with transaction.atomic():
+            deferred_tasks = list(
+                self.deferred_task_selector.get_due_deferred_task_queryset_for_update(now=now, limit=batch_size).values_list(
+                    "id", "task_name", "task_args"
+                )
+            )
+
+            DeferredTask.objects.filter(id__in=[deferred_task[0] for deferred_task in deferred_tasks]).update(
+                status=DeferredTaskStatus.DISPATCHED.value,
+                dispatched_at=now,
+            )
+
+        # 커밋 이후 브로커로 작업 전송
+        failed_ids = []
+
+        for deferred_task_id, task_name, task_args in deferred_tasks:
+            try:
+                celery_app.send_task(task_name, args=task_args)
+
+            except Exception as e:
+                logger.warning(f"Failed to send deferred task. [{deferred_task_id}]: {task_name} {e}")
+                failed_ids.append(deferred_task_id)
+
+        # 브로커로 보내지 못한 작업은 대기 상태로 되돌림
+        if failed_ids:
+            DeferredTask.objects.filter(id__in=failed_ids, status=DeferredTaskStatus.DISPATCHED.value).update(
+                status=DeferredTaskStatus.PENDING.value,
+                dispatched_at=None,
+            )
+
+        return len(deferred_tasks) - len(failed_ids)
@@ -1,6 +1,26 @@
 from celery import shared_task
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
 
 
 @shared_task
 def debug_task(self):
     print("Request: {0!r}".format(self.request))
+
+
+@shared_task(bind=True)
+def dispatch_deferred_tasks_task(self):
+    """
+    이 함수는 실행 시간이 된 지연 작업을 브로커로 보내는 작업입니다.
+    """
+    try:
+        from jurin.tasks.services import DeferredTaskService
+
+        deferred_task_service = DeferredTaskService()
+        dispatched_count = deferred_task_service.dispatch_due_tasks()
+        logger.info(f"Successfully dispatched {dispatched_count} deferred tasks.")
+
+    except Exception as e:
+        logger.warning(f"Dispatch deferred tasks task failed. {e}")
+        self.retry(exc=e, countdown=60)
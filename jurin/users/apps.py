@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "jurin.users"
+
+    def ready(self):
+        import jurin.users.signals  # noqa
@@ -0,0 +1,103 @@
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from jurin.common.bloom_filter import RedisBloomFilter
+from jurin.users.models import User
+
+
+class UserCache:
+    """
+    이 클래스는 인증에 사용하는 유저 정보를 캐시에 저장하고 조회하는 클래스입니다.
+    비밀번호는 캐시에 저장하지 않으며, 캐시에서 만든 유저 객체는 비밀번호에 접근할 때 데이터베이스에서 불러옵니다.
+    """
+
+    CACHE_KEY = "users:auth_user:{user_id}"
+    FIELD_NAMES = [field.attname for field in User._meta.concrete_fields if field.attname != "password"]
+
+    def _get_cache_key(self, user_id: int) -> str:
+        return self.CACHE_KEY.format(user_id=user_id)
+
+    def get_user(self, user_id: int) -> Optional[User]:
+        """
+        이 함수는 유저 아이디로 캐시에 저장된 유저를 조회합니다.
+
+        Args:
+            user_id (int): 유저 아이디입니다.
+        Returns:
+            User | None: 유저 객체입니다. 캐시에 없으면 None을 반환합니다.
+        """
+        values = cache.get(self._get_cache_key(user_id=user_id))
+
+        if values is None:
+            return None
+
+        return User.from_db(DEFAULT_DB_ALIAS, self.FIELD_NAMES, values)
+
+    async def aget_user(self, user_id: int) -> Optional[User]:
+        """
+        이 함수는 get_user 함수의 비동기 버전입니다.
+
+        Args:
+            user_id (int): 유저 아이디입니다.
+        Returns:
+            User | None: 유저 객체입니다. 캐시에 없으면 None을 반환합니다.
+        """
+        values = await cache.aget(self._get_cache_key(user_id=user_id))
+
+        if values is None:
+            return None
+
+        return User.from_db(DEFAULT_DB_ALIAS, self.FIELD_NAMES, values)
+
+    def set_user(self, user: User):
+        """
+        이 함수는 유저를 캐시에 저장합니다.
+
+        Args:
+            user (User): 유저 객체입니다.
+        """
+        values = [getattr(user, field_name) for field_name in self.FIELD_NAMES]
+        cache.set(self._get_cache_key(user_id=user.id), values, timeout=settings.JWT_USER_CACHE_TIMEOUT)
+
+    async def aset_user(self, user: User):
+        """
+        이 함수는 set_user 함수의 비동기 버전입니다.
+
+        Args:
+            user (User): 유저 객체입니다.
+        """
+        values = [getattr(user, field_name) for field_name in self.FIELD_NAMES]
+        await cache.aset(self._get_cache_key(user_id=user.id), values, timeout=settings.JWT_USER_CACHE_TIMEOUT)
+
+    def delete_user(self, user_id: int):
+        """
+        이 함수는 캐시에 저장된 유저를 삭제합니다.
+        트랜잭션 안에서 호출되면 커밋된 후에 삭제하여, 커밋 전의 데이터가 다시 캐시되지 않도록 합니다.
+
+        Args:
+            user_id (int): 유저 아이디입니다.
+        """
+        cache_key = self._get_cache_key(user_id=user_id)
+        transaction.on_commit(lambda: cache.delete(cache_key))
+
+
+class UsernameBloomFilter(RedisBloomFilter):
+    """
+    이 클래스는 사용 중인 아이디를 저장하는 블룸 필터입니다.
+    데이터베이스의 아이디 비교는 대소문자를 구분하지 않으므로(MySQL collation) 소문자로 바꾸어 저장하고 조회합니다.
+    """
+
+    KEY = "users:username_bloom_filter"
+
+    def __init__(self):
+        super().__init__(
+            key=self.KEY,
+            capacity=settings.USERNAME_BLOOM_FILTER_CAPACITY,
+            error_rate=settings.USERNAME_BLOOM_FILTER_ERROR_RATE,
+        )
+
+    def _get_offsets(self, value: str) -> list[int]:
+        return super()._get_offsets(value.lower())
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from jurin.users.services import UserService
+
+
+class Command(BaseCommand):
+    help = "아이디 중복 검사에 사용하는 블룸 필터를 모든 유저의 아이디로 다시 만듭니다."
+
+    def handle(self, *args, **options):
+        user_service = UserService()
+
+        try:
+            count = user_service.rebuild_username_bloom_filter()
+
+        except NotImplementedError:
+            raise CommandError("Username bloom filter requires the Redis cache backend.")
+
+        self.stdout.write(self.style.SUCCESS(f"Username bloom filter is rebuilt with {count} usernames."))
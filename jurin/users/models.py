@@ -15,6 +15,7 @@ class User(AbstractBaseUser, BaseModel, PermissionsMixin):
     is_deleted = models.BooleanField(default=False, verbose_name="탈퇴 여부")
     is_admin = models.BooleanField(default=False, verbose_name="관리자 여부")
     deleted_at = models.DateTimeField(null=True, verbose_name="탈퇴 일시")
+    token_version = models.PositiveIntegerField(default=0, verbose_name="토큰 버전")
 
     objects = UserManager()
 
@@ -1,5 +1,7 @@
 from datetime import timedelta
+from typing import Optional
 
+from django.db.models import Max
 from django.db.models.query import QuerySet
 from django.utils import timezone
 
@@ -7,6 +9,21 @@ from jurin.users.models import User
 
 
 class UserSelector:
+    def get_user_by_id(self, user_id: int) -> Optional[User]:
+        """
+        이 함수는 유저 아이디로 유저를 조회합니다.
+
+        Args:
+            user_id (int): 유저 아이디입니다.
+        Returns:
+            User | None: 유저 객체입니다. 존재하지 않으면 None을 반환합니다.
+        """
+        try:
+            return User.objects.get(id=user_id)
+
+        except User.DoesNotExist:
+            return None
+
     def check_is_exists_user_by_username(self, username: str) -> bool:
         """
         이 함수는 유저의 유저네임이 존재하는지 조회합니다.
@@ -18,6 +35,48 @@ class UserSelector:
         """
         return User.objects.filter(username=username).exists()
 
+    def get_username_queryset_by_max_id(self, max_id: int) -> QuerySet[str]:
+        """
+        이 함수는 최대 유저 아이디 이하의 모든 유저네임을 조회합니다.
+
+        Args:
+            max_id (int): 최대 유저 아이디입니다.
+        Returns:
+            QuerySet[str]: 유저네임 쿼리셋입니다.
+        """
+        return User.objects.filter(id__lte=max_id).values_list("username", flat=True)
+
+    def get_username_queryset_by_min_id(self, min_id: int) -> QuerySet[str]:
+        """
+        이 함수는 최소 유저 아이디 초과의 모든 유저네임을 조회합니다.
+
+        Args:
+            min_id (int): 최소 유저 아이디입니다.
+        Returns:
+            QuerySet[str]: 유저네임 쿼리셋입니다.
+        """
+        return User.objects.filter(id__gt=min_id).values_list("username", flat=True)
+
+    def get_max_user_id(self) -> int:
+        """
+        이 함수는 가장 큰 유저 아이디를 조회합니다.
+
+        Returns:
+            int: 가장 큰 유저 아이디입니다. 유저가 없으면 0을 반환합니다.
+        """
+        return User.objects.aggregate(max_id=Max("id"))["max_id"] or 0
+
+    def get_username_list_by_usernames(self, usernames: list[str]) -> list[str]:
+        """
+        이 함수는 유저네임 리스트 중 이미 존재하는 유저네임을 조회합니다.
+
+        Args:
+            usernames (list[str]): 유저네임 리스트입니다.
+        Returns:
+            list[str]: 이미 존재하는 유저네임 리스트입니다.
+        """
+        return list(User.objects.filter(username__in=usernames).values_list("username", flat=True))
+
     def get_deleted_user_queryset(self) -> QuerySet[User]:
         """
         이 함수는 탈퇴한 유저를 조회합니다. (탈퇴한지 7일이 지난 유저들을 조회합니다.)
@@ -27,3 +86,15 @@ class UserSelector:
         """
 
         return User.objects.filter(deleted_at__lte=timezone.now() - timedelta(days=7), is_deleted=True)
+
+    def get_deleted_user_id_list_for_update(self, limit: int) -> list[int]:
+        """
+        이 함수는 탈퇴한지 7일이 지난 유저 아이디를 아이디 순서로 최대 limit개 조회합니다.
+        삭제하는 동안 유저가 복구되지 않도록 조회한 유저를 잠급니다.
+
+        Args:
+            limit (int): 최대 조회 개수입니다.
+        Returns:
+            list[int]: 유저 아이디 리스트입니다.
+        """
+        return list(self.get_deleted_user_queryset().select_for_update().order_by("id").values_list("id", flat=True)[:limit])
@@ -1,20 +1,48 @@
+import time
 from typing import Optional, Tuple
 
+from django.conf import settings
+from django.contrib.admin.models import LogEntry
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
 from django.utils import timezone
 
+from jurin.authentication.hashers import get_password_hash_executor
+from jurin.channels.models import Channel, PointLog, UserChannel
 from jurin.channels.selectors.channels import ChannelSelector
-from jurin.channels.tasks import delete_channel_task, drop_celery_task
-from jurin.common.exception.exceptions import ValidationException
+from jurin.channels.sharding import (
+    HOME_DATABASE,
+    get_channel_shard_databases,
+    get_current_channel_shard_database,
+    mirror_users,
+    use_channel_shard,
+)
+from jurin.channels.tasks import delete_channel_task
+from jurin.common.exception.exceptions import NotFoundException, ValidationException
+from jurin.common.utils import delete_queryset_in_batches
+from jurin.items.models import UserItem, UserItemLog
+from jurin.stocks.models import UserStock, UserTradeInfo
+from jurin.tasks.services import DeferredTaskService
+from jurin.users.caches import UserCache, UsernameBloomFilter
 from jurin.users.enums import UserRole
 from jurin.users.models import User
 from jurin.users.selectors.users import UserSelector
 from jurin.users.selectors.verification_codes import VerificationCodeSelector
+from jurin.users.tasks import restore_user_channel_task
 
 
 class UserService:
+    PASSWORD_HASH_POOL_THRESHOLD = 8
+    HARD_DELETE_CHUNK_SIZE = 200
+    HARD_DELETE_BATCH_SIZE = 1000
+
     def __init__(self):
         self.user_selector = UserSelector()
         self.channel_selector = ChannelSelector()
+        self.deferred_task_service = DeferredTaskService()
+        self.user_cache = UserCache()
+        self.username_bloom_filter = UsernameBloomFilter()
 
     def create_user(
         self,
@@ -52,6 +80,9 @@ class UserService:
             verification_code.is_verified = True
             verification_code.save()
 
+        # 아이디 중복 검사 필터에 추가 (생성에 실패해도 오탐만 늘어나므로 생성 전에 추가)
+        self.username_bloom_filter.add(values=[username])
+
         # 유저 생성
         user = User.objects.create_user(
             username=username,
@@ -62,6 +93,85 @@ class UserService:
 
         return user
 
+    def _make_passwords(self, passwords: list[str]) -> list[str]:
+        """
+        이 내장 함수는 비밀번호 리스트를 해시합니다.
+        개수가 많으면 프로세스의 비밀번호 해시 스레드 풀에 나누어 해시합니다. (PBKDF2 해시는 GIL을 해제하므로 스레드에서 병렬로 실행)
+
+        Args:
+            passwords (list[str]): 비밀번호 리스트입니다.
+        Returns:
+            list[str]: 해시된 비밀번호 리스트입니다.
+        """
+        if len(passwords) < self.PASSWORD_HASH_POOL_THRESHOLD or settings.PASSWORD_HASH_WORKERS <= 1:
+            return [make_password(password) for password in passwords]
+
+        return list(get_password_hash_executor().map(make_password, passwords))
+
+    def bulk_create_students(self, channel_id: int, user: User, students: list[dict]) -> list[User]:
+        """
+        이 함수는 채널 아이디와 유저와 학생 정보 리스트를 받아 검증 후 학생 유저들을 생성하고 채널에 가입시킵니다.
+        비밀번호는 스레드 풀에서 나누어 해시하며, 유저, 유저 권한, 유저 채널은 한 번에 생성합니다.
+
+        Args:
+            channel_id (int): 채널 아이디입니다.
+            user (User): 유저 객체입니다.
+            students (list[dict]): 학생 정보(username, nickname, password) 리스트입니다.
+        Returns:
+            list[User]: 생성된 학생 유저 리스트입니다.
+        """
+        # 채널이 존재하는지 검증
+        channel = self.channel_selector.get_channel_by_user_and_id(user=user, channel_id=channel_id)
+
+        if channel is None:
+            raise NotFoundException(detail="Channel does not exist.", code="not_channel")
+
+        # 아이디 중복 검사
+        usernames = [student["username"] for student in students]
+
+        if len(set(usernames)) != len(usernames):
+            raise ValidationException("Username is duplicated")
+
+        if self.user_selector.get_username_list_by_usernames(usernames=usernames):
+            raise ValidationException("Username already exists")
+
+        # 아이디 중복 검사 필터에 추가
+        self.username_bloom_filter.add(values=usernames)
+
+        # 비밀번호 해시
+        passwords = self._make_passwords(passwords=[student["password"] for student in students])
+
+        try:
+            with transaction.atomic(), transaction.atomic(using=get_current_channel_shard_database()):
+                # 유저 생성 후 아이디 조회 (MySQL은 bulk_create 시 아이디를 반환하지 않음)
+                User.objects.bulk_create(
+                    [
+                        User(username=student["username"], nickname=student["nickname"], password=password)
+                        for student, password in zip(students, passwords)
+                    ]
+                )
+                created_users = list(User.objects.filter(username__in=usernames).order_by("id"))
+                mirror_users(users=created_users, database=get_current_channel_shard_database())
+
+                # 유저 권한 및 유저 채널 생성
+                User.groups.through.objects.bulk_create(
+                    [User.groups.through(user_id=created_user.id, group_id=UserRole.STUDENT.value) for created_user in created_users]
+                )
+                UserChannel.objects.bulk_create(
+                    [
+                        UserChannel(user_id=created_user.id, channel_id=channel_id, nickname=created_user.nickname)
+                        for created_user in created_users
+                    ]
+                )
+
+                # 학생 수 증가
+                Channel.objects.filter(id=channel_id).update(member_count=F("member_count") + len(created_users))
+
+        except IntegrityError:
+            raise ValidationException("Username already exists")
+
+        return created_users
+
     def validate_constraint(self, validate_type: str, validate_value: str) -> Tuple[bool, Optional[str]]:
         """
         이 함수는 아이디 중복 검사, 인증 코드 검증을 합니다.
@@ -72,8 +182,11 @@ class UserService:
         Returns:
             Tuple[bool, Optional[str]]: 검증 결과와 검증 타입입니다.
         """
-        # 아이디 중복 검사
+        # 아이디 중복 검사 (필터에 없으면 사용 가능한 아이디이므로 데이터베이스를 조회하지 않음)
         if validate_type == "username":
+            if self.username_bloom_filter.might_contain(value=validate_value) is False:
+                return True, validate_type
+
             if self.user_selector.check_is_exists_user_by_username(username=validate_value) is True:
                 return False, "username"
 
@@ -87,6 +200,24 @@ class UserService:
 
         return True, validate_type
 
+    def rebuild_username_bloom_filter(self) -> int:
+        """
+        이 함수는 아이디 중복 검사 필터를 모든 유저의 아이디로 다시 만듭니다.
+        필터를 만드는 동안 가입한 유저의 아이디는 교체한 후에 추가합니다.
+
+        Returns:
+            int: 필터에 넣은 아이디의 개수입니다.
+        """
+        max_id = self.user_selector.get_max_user_id()
+        usernames = self.user_selector.get_username_queryset_by_max_id(max_id=max_id)
+        count = self.username_bloom_filter.rebuild(values=usernames.iterator(chunk_size=self.username_bloom_filter.BATCH_SIZE))
+
+        # 필터를 만드는 동안 가입한 유저의 아이디 추가
+        new_usernames = list(self.user_selector.get_username_queryset_by_min_id(min_id=max_id))
+        self.username_bloom_filter.add(values=new_usernames)
+
+        return count + len(new_usernames)
+
     def update_user(self, nickname: str, user: User, school_name: Optional[str]) -> User:
         """
         이 함수는 유저 정보를 수정합니다.
@@ -98,37 +229,72 @@ class UserService:
         Returns:
             User: 유저 객체입니다.
         """
-        user.nickname = nickname
-        user.school_name = school_name
-        user.save()
+        with transaction.atomic(), transaction.atomic(using=get_current_channel_shard_database()):
+            user.nickname = nickname
+            user.school_name = school_name
+            user.save()
+
+            # 학생 명단 검색에 사용하는 유저 채널의 닉네임 동기화
+            UserChannel.objects.filter(user=user).update(nickname=nickname)
+
+        # 인증에 사용하는 유저 캐시 삭제
+        self.user_cache.delete_user(user_id=user.id)
+
         return user
 
     def restore_user(self, user: User, user_role: int):
         """
         이 함수는 회원 탈퇴한 유저를 복구합니다.
-        선생님인 경우 채널 복구 처리를 합니다.
+        로그인 중에 호출되므로 한 번의 조건부 수정으로 유저만 복구하고,
+        선생님인 경우 채널 복구 처리는 백그라운드 작업으로 보냅니다.
 
         Args:
             user (User): 유저 객체입니다.
             user_role (int): 유저 역할입니다.
         """
-        # 회원 탈퇴한 유저 복구
-        if user.is_deleted is True and user.deleted_at is not None:
-            user.is_deleted = False
-            user.deleted_at = None
-            user.save()
+        # 회원 탈퇴한 유저 복구 (이미 복구된 경우 아무 작업도 하지 않음)
+        restored_count = User.objects.filter(id=user.id, is_deleted=True).update(is_deleted=False, deleted_at=None)
+
+        if restored_count == 0:
+            return
 
-        # 선생님인 경우 채널 복구 처리
+        user.is_deleted = False
+        user.deleted_at = None
+
+        # 인증에 사용하는 유저 캐시 삭제
+        self.user_cache.delete_user(user_id=user.id)
+
+        # 선생님인 경우 채널 복구 작업 실행
         if user_role == UserRole.TEACHER.value:
-            channel = self.channel_selector.get_pending_deleted_channel_by_user_order_by_pending_deleted_at_desc(user=user)
+            transaction.on_commit(lambda: restore_user_channel_task.delay(user.id))
 
-            if channel is not None:
-                channel.is_pending_deleted = False
-                channel.pending_deleted_at = None
-                channel.save()
+    def restore_user_channel(self, user_id: int):
+        """
+        이 함수는 복구된 선생님 유저의 삭제 대기 중인 채널을 복구하고 채널 삭제 작업을 취소합니다.
+        여러 번 실행되어도 결과가 같습니다.
+
+        Args:
+            user_id (int): 유저 아이디입니다.
+        """
+        # 복구된 유저인지 검증
+        user = self.user_selector.get_user_by_id(user_id=user_id)
 
-                # 큐에 올라간 채널 데이터 삭제
-                drop_celery_task.apply_async(args=["delete_channel_task", [channel.id]])
+        if user is None:
+            raise NotFoundException(detail="User does not exist.", code="not_user")
+
+        if user.is_deleted is True:
+            return
+
+        # 삭제 대기 중인 채널 복구
+        channel = self.channel_selector.get_pending_deleted_channel_by_user_order_by_pending_deleted_at_desc(user=user)
+
+        if channel is not None:
+            channel.is_pending_deleted = False
+            channel.pending_deleted_at = None
+            channel.save()
+
+            # 대기 중인 채널 삭제 작업 취소
+            self.deferred_task_service.cancel_task(task=delete_channel_task, task_args=[channel.id])
 
     def soft_delete_user(self, password: str, user: User, user_role: int):
         """
@@ -150,6 +316,9 @@ class UserService:
             user.is_deleted = True
             user.save()
 
+            # 인증에 사용하는 유저 캐시 삭제
+            self.user_cache.delete_user(user_id=user.id)
+
         # 선생님인 경우 채널
         if user_role == UserRole.TEACHER.value:
             channel = self.channel_selector.get_channel_by_user(user=user)
@@ -160,11 +329,101 @@ class UserService:
                 channel.save()
 
                 # 채널 삭제 테스크를 60분 후에 실행
-                delete_channel_task.apply_async(args=[channel.id], countdown=3600)
+                self.deferred_task_service.schedule_task(task=delete_channel_task, task_args=[channel.id], countdown=3600)
+
+    def _hard_delete_user_chunk(self, user_ids: list[int]) -> dict[str, int]:
+        """
+        이 내장 함수는 유저 아이디 리스트를 받아서 유저와 유저를 참조하는 데이터를 삭제합니다.
+        연관 객체를 불러오지 않도록 참조하는 테이블부터 순서대로 일정 개수씩 바로 삭제합니다.
+
+        Args:
+            user_ids (list[int]): 유저 아이디 리스트입니다.
+        Returns:
+            dict[str, int]: 테이블별 삭제된 행의 개수입니다.
+        """
+        deleted_counts = {}
+
+        # 샤드마다 유저의 채널 데이터 삭제
+        for database in get_channel_shard_databases():
+            with use_channel_shard(database=database), transaction.atomic(using=database):
+                # 채널의 학생 수 감소 (채널 소유 유저는 학생 수에 포함되지 않음)
+                member_counts = (
+                    UserChannel.objects.filter(user_id__in=user_ids)
+                    .exclude(user_id=F("channel__user_id"))
+                    .values("channel_id")
+                    .annotate(count=Count("id"))
+                    .order_by("channel_id")
+                )
+
+                for member_count in member_counts:
+                    Channel.objects.filter(id=member_count["channel_id"]).update(member_count=F("member_count") - member_count["count"])
+
+                # 유저가 포인트를 지급한 내역과 소유한 채널은 남기고 연결만 해제
+                PointLog.objects.filter(actor_id__in=user_ids).update(actor=None)
+                Channel.objects.filter(user_id__in=user_ids).update(user=None)
+
+                querysets = [
+                    UserItemLog.objects.filter(user_item__user_id__in=user_ids),
+                    UserItem.objects.filter(user_id__in=user_ids),
+                    UserTradeInfo.objects.filter(user_id__in=user_ids),
+                    UserStock.objects.filter(user_id__in=user_ids),
+                    PointLog.objects.filter(user_id__in=user_ids),
+                    UserChannel.objects.filter(user_id__in=user_ids),
+                ]
+
+                # 홈 샤드가 아닌 샤드는 복사된 유저도 삭제
+                if database != HOME_DATABASE:
+                    querysets.append(User.objects.using(database).filter(id__in=user_ids))
 
-    def hard_bulk_delete_users(self):
+                for queryset in querysets:
+                    deleted_count = delete_queryset_in_batches(queryset=queryset, batch_size=self.HARD_DELETE_BATCH_SIZE)
+                    deleted_counts[queryset.model._meta.db_table] = deleted_counts.get(queryset.model._meta.db_table, 0) + deleted_count
+
+        querysets = [
+            LogEntry.objects.filter(user_id__in=user_ids),
+            User.groups.through.objects.filter(user_id__in=user_ids),
+            User.user_permissions.through.objects.filter(user_id__in=user_ids),
+            User.objects.filter(id__in=user_ids),
+        ]
+
+        for queryset in querysets:
+            deleted_count = delete_queryset_in_batches(queryset=queryset, batch_size=self.HARD_DELETE_BATCH_SIZE)
+            deleted_counts[queryset.model._meta.db_table] = deleted_counts.get(queryset.model._meta.db_table, 0) + deleted_count
+
+        return deleted_counts
+
+    def hard_bulk_delete_users(self, time_budget: float) -> dict:
         """
-        이 함수는 7일 이상 탈퇴한 유저들을 삭제합니다.
+        이 함수는 7일 이상 탈퇴한 유저들을 일정 개수씩 나누어 삭제합니다.
+        나눈 유저마다 트랜잭션을 커밋하여 잠금 시간을 제한하고, 주어진 시간을 넘기면 남은 유저는 삭제하지 않고 멈춥니다.
+
+        Args:
+            time_budget (float): 삭제에 사용할 최대 시간(초)입니다.
+        Returns:
+            dict: 삭제한 유저 수, 테이블별 삭제된 행의 개수, 걸린 시간, 남은 유저가 있는지 여부입니다.
         """
-        users = self.user_selector.get_deleted_user_queryset()
-        users.delete()
+        started_at = time.monotonic()
+        metrics = {"user_count": 0, "chunk_count": 0, "deleted_counts": {}, "elapsed": 0.0, "has_remaining": False}
+
+        while True:
+            if time.monotonic() - started_at >= time_budget:
+                metrics["has_remaining"] = self.user_selector.get_deleted_user_queryset().exists()
+                break
+
+            with transaction.atomic():
+                user_ids = self.user_selector.get_deleted_user_id_list_for_update(limit=self.HARD_DELETE_CHUNK_SIZE)
+
+                if not user_ids:
+                    break
+
+                deleted_counts = self._hard_delete_user_chunk(user_ids=user_ids)
+
+            metrics["user_count"] += len(user_ids)
+            metrics["chunk_count"] += 1
+
+            for db_table, deleted_count in deleted_counts.items():
+                metrics["deleted_counts"][db_table] = metrics["deleted_counts"].get(db_table, 0) + deleted_count
+
+        metrics["elapsed"] = round(time.monotonic() - started_at, 3)
+
+        return metrics
@@ -0,0 +1,77 @@
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+
+from jurin.channels.sharding import (
+    HOME_DATABASE,
+    find_user_channel_id,
+    get_channel_shard,
+    get_current_channel_shard_database,
+    is_sharding_enabled,
+    mirror_users,
+)
+from jurin.users.caches import UserCache
+from jurin.users.models import User
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def revoke_tokens_on_user_role_changed(sender, instance, action: str, reverse: bool, pk_set, **kwargs):
+    """
+    이 함수는 유저의 권한(그룹)이 변경되면 유저의 토큰 버전을 올려 기존에 발급된 토큰을 무효화합니다.
+    토큰에 담긴 권한 정보를 그대로 신뢰하기 때문에, 권한이 바뀐 유저는 다시 로그인해야 합니다.
+    캐시된 유저의 토큰 버전으로 토큰을 검증하므로, 커밋된 후 캐시된 유저도 삭제합니다.
+    그룹 쪽에서 clear하면 post_clear에 변경된 유저 아이디가 전달되지 않으므로, pre_clear에서 그룹의 유저 아이디를 저장해 둡니다.
+
+    Args:
+        sender (Model): 유저와 그룹의 중간 모델입니다.
+        instance (User | Group): 변경된 유저 또는 그룹 객체입니다.
+        action (str): 변경 종류입니다.
+        reverse (bool): 그룹 쪽에서 변경했는지 여부입니다.
+        pk_set (set[int] | None): 변경된 대상의 아이디 집합입니다.
+    """
+    if action == "pre_clear" and reverse is True:
+        instance._cleared_user_ids = list(instance.user_set.values_list("id", flat=True))
+        return
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if reverse is False:
+        user_ids = [instance.pk]
+    elif action == "post_clear":
+        user_ids = instance.__dict__.pop("_cleared_user_ids", [])
+    else:
+        user_ids = list(pk_set or [])
+
+    if not user_ids:
+        return
+
+    User.objects.filter(id__in=user_ids).update(token_version=F("token_version") + 1)
+
+    user_cache = UserCache()
+
+    for user_id in user_ids:
+        user_cache.delete_user(user_id=user_id)
+
+
+@receiver(post_save, sender=User)
+def mirror_user_on_saved(sender, instance: User, created: bool, **kwargs):
+    """
+    이 함수는 샤딩을 사용할 때 저장된 유저를 유저가 참여한 채널의 샤드에 복사합니다.
+    채널 샤드의 유저 사본이 홈 샤드의 유저(닉네임, 학교 이름, 탈퇴 여부 등)와 같도록 유지합니다.
+
+    Args:
+        sender (Model): 유저 모델입니다.
+        instance (User): 저장된 유저 객체입니다.
+        created (bool): 생성 여부입니다.
+    """
+    # 홈 샤드에 저장된 원본만 복사
+    if not is_sharding_enabled() or kwargs.get("using") != HOME_DATABASE:
+        return
+
+    database = get_current_channel_shard_database()
+
+    if database == HOME_DATABASE:
+        database = get_channel_shard(channel_id=find_user_channel_id(user_id=instance.id))[0]
+
+    mirror_users(users=[instance], database=database)
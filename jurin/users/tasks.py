@@ -1,5 +1,11 @@
+import time
+
 from celery import shared_task
 from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.utils import timezone
+
+from jurin.common.exception.exceptions import NotFoundException, TaskFailedException
 
 logger = get_task_logger(__name__)
 
@@ -8,17 +14,56 @@ logger = get_task_logger(__name__)
 def hard_delete_users_task(self):
     """
     이 함수는 탈퇴한 유저를 삭제 작업입니다.
+    작업 제한 시간 안에 끝나도록 정해진 시간만큼만 삭제하고, 남은 유저는 수업 시간 전까지 작업을 다시 실행하여 삭제합니다.
     """
     try:
         from jurin.users.services import UserService
 
         # 탈퇴한 유저 삭제
         user_service = UserService()
-        user_service.hard_bulk_delete_users()
-        logger.info("Successfully hard deleted users")
+        metrics = user_service.hard_bulk_delete_users(time_budget=settings.HARD_DELETE_USERS_TIME_BUDGET)
+        logger.info(f"Successfully hard deleted users. {metrics}")
 
     except Exception as e:
         logger.warning(f"Hard delete users task failed: {e}")
 
         # 실패할 경우 60초 후에 재시도
         self.retry(exc=e, countdown=60)
+
+    # 남은 유저가 있으면 수업 시간 전까지 이어서 삭제
+    if metrics["has_remaining"] is True:
+        if timezone.localtime().hour < settings.HARD_DELETE_USERS_END_HOUR:
+            self.apply_async(countdown=1)
+
+        else:
+            logger.warning("Hard delete users task stopped with remaining users. It will resume at the next schedule.")
+
+
+@shared_task(bind=True)
+def restore_user_channel_task(self, user_id: int):
+    """
+    이 함수는 로그인으로 복구된 선생님 유저의 채널을 복구하는 작업입니다.
+    로그인 응답 시간과 별도로 복구 작업 시간을 기록합니다.
+
+    Args:
+        user_id (int): 유저 아이디입니다.
+    """
+    try:
+        from jurin.channels.sharding import find_user_channel_id, use_channel
+        from jurin.users.services import UserService
+
+        started_at = time.monotonic()
+        user_service = UserService()
+
+        with use_channel(channel_id=find_user_channel_id(user_id=user_id)):
+            user_service.restore_user_channel(user_id=user_id)
+
+        logger.info(f"Successfully restored user channel. ({time.monotonic() - started_at:.3f}s)")
+
+    except NotFoundException as e:
+        logger.warning(f"Restore user channel task failed. {e}")
+        raise TaskFailedException(e)
+
+    except Exception as e:
+        logger.warning(f"Restore user channel task failed. {e}")
+        self.retry(exc=e, countdown=60)